@@ -2,7 +2,7 @@ from authlib.integrations.requests_client import OAuth2Session
 from authlib.oauth2.rfc6749 import OAuth2Token
 import requests
 import time
-import json
+import orjson
 import getpass
 from pathlib import Path
 from typing import Optional, Dict, Callable
@@ -104,7 +104,7 @@ class BrAPIOAuth2Session(OAuth2Session):
       token = dict(token)
 
     # Write to file with pretty formatting
-    Path(self.token_file).write_text(json.dumps(token, indent=2))
+    Path(self.token_file).write_bytes(orjson.dumps(token, option=orjson.OPT_INDENT_2))
     print(f'[OK] Token saved to {self.token_file}')
 
   def _load_token(self) -> Optional[Dict]:
@@ -119,13 +119,13 @@ class BrAPIOAuth2Session(OAuth2Session):
       return None
 
     try:
-      token_data = json.loads(Path(self.token_file).read_text())
+      token_data = orjson.loads(Path(self.token_file).read_bytes())
       print(f'[OK] Loaded existing token from {self.token_file}')
       return token_data
     except FileNotFoundError:
       print(f'[INFO] No existing token found at {self.token_file}')
       return None
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
       print(f'[WARNING] Could not parse token file: {e}')
       return None
 
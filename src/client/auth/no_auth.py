@@ -2,25 +2,46 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-def create_base_session() -> requests.Session:
+# Keep-alive connections per host; larger than helpers.PAGE_WORKERS so
+# concurrent page fetches never have to open (and then discard) extra connections
+POOL_SIZE = 32
+
+# Transient failures (rate limiting, gateway errors) are retried with capped exponential
+# backoff plus up to 1s of jitter, so concurrent callers don't retry in lockstep
+RETRY_TOTAL = 5
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+BACKOFF_MAX = 30
+
+def configure_session(session: requests.Session) -> requests.Session:
     """
-    Create a standard requests session with retry logic but no authentication.
-    Useful for public BrAPI endpoints.
+    Mount a pooled adapter with retry logic on both schemes.
+
+    requests already advertises gzip/deflate and keeps connections alive,
+    so the pool size and retries are the only things added here.
     """
-    session = requests.Session()
-    
     # Configure retries
     retries = Retry(
-        total=3,
+        total=RETRY_TOTAL,
         backoff_factor=1,
-        status_forcelist=[500, 502, 503, 504],
-        allowed_methods=["GET", "POST"]
+        backoff_max=BACKOFF_MAX,
+        backoff_jitter=1.0,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=["GET", "POST"],
     )
     
-    adapter = HTTPAdapter(max_retries=retries)
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retries)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     
+    return session
+
+def create_base_session() -> requests.Session:
+    """
+    Create a standard requests session with retry logic but no authentication.
+    Useful for public BrAPI endpoints.
+    """
+    session = configure_session(requests.Session())
+    
     # Disable SSL verification for this session
     session.verify = False
     
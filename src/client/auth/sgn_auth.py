@@ -1,9 +1,7 @@
 
 from authlib.integrations.requests_client import OAuth2Session
 from authlib.oauth2.rfc6749 import OAuth2Token
-import requests
 import time
-import json
 import getpass
 from pathlib import Path
 from typing import Optional, Dict, Callable
@@ -12,6 +10,7 @@ import os
 import sys
 
 from .base_oauth import BrAPIOAuth2Session
+from .no_auth import configure_session
 class SGNBrAPIOAuth2(BrAPIOAuth2Session):
   """
   OAuth2 session for SGN-based BrAPI servers (password grant flow).
@@ -88,7 +87,7 @@ class SGNBrAPIOAuth2(BrAPIOAuth2Session):
             - userDisplayName: User's display name from server
 
     Raises:
-        requests.HTTPError: If authentication fails
+        HTTPError: If authentication fails (raised by the session's raise_for_status)
         ValueError: If credentials are invalid
 
     Example:
@@ -110,8 +109,8 @@ class SGNBrAPIOAuth2(BrAPIOAuth2Session):
     # Note: This is NOT standard OAuth2, but required by SGN servers
     payload = {'grant_type': 'password', 'password': password, 'username': username}
   
-    # Make authentication request
-    response = requests.post(self.token_url, data=payload)
+    # Make authentication request over this session's own pool, so (re)logins reuse its keep-alive connections
+    response = self.post(self.token_url, data=payload, withhold_token=True)
 
     # Raise exception if authentication failed
     response.raise_for_status()
@@ -216,6 +215,7 @@ def create_sgn_session(
       >>> session = create_sgn_session(store_token=True)
   """
   session = SGNBrAPIOAuth2(base_url, token_file, store_token=store_token)
+  configure_session(session)
 
   if auto_login and not session.is_authenticated():
     print('No valid token found.')
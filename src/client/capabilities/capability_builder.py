@@ -1,17 +1,131 @@
-import pandas as pd
+import hashlib
+import os
+import sys
+import time
+from typing import Optional
+
+import orjson
 
 from client.capabilities.type import ServerCapabilities, ModuleCapability, EndpointCapability
 from client.client import BrapiClient
 from pathlib import Path
 
+METADATA_PATH = Path(__file__).parent.parent / 'data' / 'metadata.csv'
+
+# Built capabilities are reused from disk for this long before /serverinfo is queried again
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Endpoints share a handful of method sets ({'GET'}, {'GET', 'POST'}, ...); keep one instance of each
+_METHODS_INTERN: dict[frozenset, frozenset] = {}
+
+
+def _intern_methods(methods) -> frozenset:
+  fs = frozenset(methods or ())
+  return _METHODS_INTERN.setdefault(fs, fs)
+
+
+def _intern_data_types(data_types) -> list:
+  return [sys.intern(t) for t in data_types or ()]
+
 class CapabilityBuilder:
   @classmethod
-  def from_server(cls, client: BrapiClient, server_name: str):
+  def from_server(cls, client: BrapiClient, server_name: str, cache_file: Optional[Path] = None):
+    """
+    Build server capabilities from /serverinfo and the bundled metadata.
+
+    If cache_file is given, a fresh cache entry for the same server and metadata
+    is used instead of querying the server, and a new build is written back to it.
+    """
+    cache_key = cls._cache_key(client.base_url)
+
+    if cache_file:
+      caps = cls._load_cached(cache_file, cache_key, server_name)
+      if caps:
+        return caps
+
+    caps = cls._build(client, server_name)
+
+    # Don't persist an empty build (e.g. serverinfo was unreachable)
+    if cache_file and caps.endpoints:
+      cls._save_cached(cache_file, cache_key, caps)
+
+    return caps
+
+  @staticmethod
+  def _cache_key(base_url: str) -> str:
+    """Cache entries are only valid for the same server and metadata.csv revision"""
+    return hashlib.sha1(f'{base_url}|{METADATA_PATH.stat().st_mtime_ns}'.encode()).hexdigest()
+
+  @staticmethod
+  def _load_cached(cache_file: Path, cache_key: str, server_name: str) -> Optional[ServerCapabilities]:
+    """Rehydrate capabilities from the cache file, or None if missing, stale or unreadable"""
+    try:
+      if time.time() - cache_file.stat().st_mtime > CACHE_TTL_SECONDS:
+        return None
+      cached = orjson.loads(cache_file.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+      return None
+
+    if cached.get('key') != cache_key:
+      return None
+
+    caps = ServerCapabilities(server_name=server_name)
+    for entry in cached['endpoints']:
+      ep = EndpointCapability(
+        path=entry['path'],
+        methods=_intern_methods(entry['methods']),
+        data_types=_intern_data_types(entry['data_types']),
+        module=entry['module'],
+        description=entry['description'],
+        input_schema=entry['input_schema'],
+      )
+      caps.endpoints[ep.path] = ep
+      if ep.module not in caps.modules:
+        caps.modules[ep.module] = ModuleCapability(ep.module)
+      caps.modules[ep.module].endpoints[ep.path] = ep
+
+    return caps
+
+  @staticmethod
+  def _save_cached(cache_file: Path, cache_key: str, caps: ServerCapabilities):
+    """Write capabilities atomically so a concurrent reader never sees a partial file"""
+    payload = {
+      'key': cache_key,
+      'endpoints': [
+        {
+          'path': ep.path,
+          'methods': sorted(ep.methods),
+          'data_types': ep.data_types,
+          'module': ep.module,
+          'description': ep.description,
+          'input_schema': ep.input_schema,
+        }
+        for ep in caps.endpoints.values()
+      ],
+    }
+    tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+    tmp_file.write_bytes(orjson.dumps(payload))
+    os.replace(tmp_file, cache_file)
+
+  @staticmethod
+  def _load_metadata() -> dict:
+    """
+    Metadata rows indexed by service.
+
+    Read from the metadata_table module generated from metadata.csv; run
+    gen_metadata --check to confirm it is current.
+    """
+    from client.data.metadata_table import METADATA
+
+    return METADATA
+
+  @classmethod
+  def _build(cls, client: BrapiClient, server_name: str) -> ServerCapabilities:
     serverinfo = client.fetch_serverinfo()
     result = serverinfo.get('result', {})
     calls = result.get('calls', []) or []
     
-    metadata = pd.read_csv(Path(__file__).parent.parent / 'data' / 'metadata.csv')
+    metadata = cls._load_metadata()
 
     caps = ServerCapabilities(server_name=server_name)
 
@@ -24,16 +138,15 @@ class CapabilityBuilder:
       if not path:
         continue
 
-      methods = set(call.get('methods') or [])
-      data_types = call.get('dataTypes') or []
+      methods = _intern_methods(call.get('methods'))
+      data_types = _intern_data_types(call.get('dataTypes'))
 
       # Prefer category from metadata
-      row = metadata.loc[metadata['service'] == path]
-      if not row.empty:
-          category = row.iloc[0]['category']
-      else:
-          category = None
+      row = metadata.get(path)
+      if row is None:
+        continue
 
+      category = row.category
       if category:
         module = category.lower()
       else:
@@ -48,8 +161,8 @@ class CapabilityBuilder:
         methods=methods,
         data_types=data_types,
         module=module,
-        description=row.iloc[0]['description'],
-        input_schema=row.iloc[0]['dictionary_loc']
+        description=row.description or None,
+        input_schema=row.dictionary_loc or None
       )
 
       # register endpoint
@@ -60,4 +173,4 @@ class CapabilityBuilder:
 
     # Assign modules to capability object
     caps.modules = modules
-    return caps
\ No newline at end of file
+    return caps
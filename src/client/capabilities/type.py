@@ -1,16 +1,59 @@
 # brapi_mcp/client/capabilities.py
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Optional
+from operator import itemgetter
+from typing import Dict, FrozenSet, List, Optional
+
+
+def parse_endpoint_path(path: str) -> tuple[str, bool, Optional[str], bool]:
+    """
+    Parse endpoint path into components.
+    
+    Returns:
+        (base_service, has_id, sub_resource, is_search)
+    
+    Examples:
+        'locations' -> ('locations', False, None, False)
+        'locations/{locationDbId}' -> ('locations', True, None, False)
+        'variantsets/{variantSetDbId}/calls' -> ('variantsets', True, 'calls', False)
+        'search/locations/{searchResultsDbId}' -> ('locations', False, None, True)
+    """
+    # Only the first three components matter; maxsplit leaves the tail unsplit
+    parts = path.strip('/').split('/', 3)
+    
+    # Handle search endpoints
+    if parts[0] == 'search':
+        base_service = parts[1] if len(parts) > 1 else 'unknown'
+        # Ignore {searchResultsDbId} - it's just the GET results endpoint
+        return (base_service, False, None, True)
+    
+    # Regular endpoints
+    base_service = parts[0]
+    has_id = len(parts) > 1 and '{' in parts[1]
+    
+    # Sub-resource (e.g., variantsets/{id}/calls)
+    sub_resource = None
+    if len(parts) > 2 and '{' not in parts[2]:
+        sub_resource = parts[2]
+    
+    return (base_service, has_id, sub_resource, False)
 
 
 @dataclass
 class EndpointCapability:
   path: str
-  methods: Set[str]
+  methods: FrozenSet[str]
   data_types: List[str]
   module: Optional[str] = None
   description: Optional[str] = None
   input_schema: Dict | None = None
+  # Parsed once from path so consolidation doesn't re-split it on every call
+  base_service: str = field(init=False)
+  has_id: bool = field(init=False)
+  sub_resource: Optional[str] = field(init=False)
+  is_search: bool = field(init=False)
+
+  def __post_init__(self):
+    self.base_service, self.has_id, self.sub_resource, self.is_search = parse_endpoint_path(self.path)
 
 @dataclass
 class ModuleCapability:
@@ -67,18 +110,21 @@ class ServerCapabilities:
 
   def _get_base_service(self, path: str) -> Optional[str]:
       """Extract base service name from path"""
-      parts = path.strip('/').split('/')
+      # fast path: partition only looks at the leading components
+      stripped = path.strip('/')
       
       # Skip search result endpoints (they're internal)
-      if 'search' in parts and '{searchResultsDbId}' in path:
+      if '{searchResultsDbId}' in path and '/search/' in f'/{stripped}/':
           return None
       
+      head, _, rest = stripped.partition('/')
+      
       # For search endpoints, return the service being searched
-      if parts[0] == 'search' and len(parts) > 1:
-          return parts[1]
+      if head == 'search' and rest:
+          return rest.partition('/')[0]
       
       # For regular endpoints, return the base
-      return parts[0] if parts else None
+      return head
   
   def consolidate_modules(self) -> Dict:
     """
@@ -117,13 +163,10 @@ class ServerCapabilities:
     # Group endpoints by base service
     services: Dict[str, Dict] = {}
     
-    for path, endpoint in module.endpoints.items():
-        base_service, has_id, sub_resource, is_search = self._parse_endpoint_path(path)
-        
-        # Initialize service if not exists
-        if base_service not in services:
-            services[base_service] = {
-                "name": base_service,
+    for endpoint in module.endpoints.values():
+        info = services.get(endpoint.base_service)
+        if info is None:
+            info = services[endpoint.base_service] = {
                 "methods": set(),
                 "supports_id": False,
                 "supports_search": False,
@@ -132,71 +175,44 @@ class ServerCapabilities:
             }
         
         # Accumulate info
-        services[base_service]["methods"].update(endpoint.methods)
+        info["methods"] |= endpoint.methods
         
-        if has_id:
-            services[base_service]["supports_id"] = True
+        if endpoint.has_id:
+            info["supports_id"] = True
         
-        if is_search:
-            services[base_service]["supports_search"] = True
-            # Save search schema
+        if endpoint.is_search:
+            info["supports_search"] = True
+            # Save search schema (only search endpoints set it, so it implies supports_search)
             if endpoint.input_schema:
-                services[base_service]["input_schema"] = endpoint.input_schema
+                info["input_schema"] = endpoint.input_schema
         
-        if sub_resource:
-            services[base_service]["sub_resources"].add(sub_resource)
+        if endpoint.sub_resource:
+            info["sub_resources"].add(endpoint.sub_resource)
     
     # Convert to list with usage examples
     result = []
     for service_name, info in services.items():
         service_dict = {
             "name": service_name,
-            "methods": sorted(list(info["methods"])),
+            "methods": sorted(info["methods"]),
             "supports_id": info["supports_id"],
             "supports_search": info["supports_search"],
-            "sub_resources": sorted(list(info["sub_resources"])) if info["sub_resources"] else None,
+            "sub_resources": sorted(info["sub_resources"]) if info["sub_resources"] else None,
             "usage": self._generate_usage_examples(service_name, info)
         }
         
         # Add search schema if available
-        if info["supports_search"] and info["input_schema"]:
+        if info["input_schema"]:
             service_dict["search_parameters"] = info["input_schema"]
         
         result.append(service_dict)
     
-    return sorted(result, key=lambda x: x["name"])
+    result.sort(key=itemgetter("name"))
+    return result
 
   def _parse_endpoint_path(self, path: str) -> tuple[str, bool, Optional[str], bool]:
-    """
-    Parse endpoint path into components.
-    
-    Returns:
-        (base_service, has_id, sub_resource, is_search)
-    
-    Examples:
-        'locations' -> ('locations', False, None, False)
-        'locations/{locationDbId}' -> ('locations', True, None, False)
-        'variantsets/{variantSetDbId}/calls' -> ('variantsets', True, 'calls', False)
-        'search/locations/{searchResultsDbId}' -> ('locations', False, None, True)
-    """
-    parts = path.strip('/').split('/')
-    
-    # Handle search endpoints
-    if parts[0] == 'search':
-        base_service = parts[1] if len(parts) > 1 else 'unknown'
-        # Ignore {searchResultsDbId} - it's just the GET results endpoint
-        return (base_service, False, None, True)
-    
-    # Regular endpoints
-    base_service = parts[0]
-    has_id = len(parts) > 1 and '{' in parts[1]
-    
-    # Sub-resource (e.g., variantsets/{id}/calls)
-    sub_resource = None
-    if len(parts) > 2 and '{' not in parts[2]:
-        sub_resource = parts[2]
-    
-    return (base_service, has_id, sub_resource, False)
+    """Parse endpoint path into (base_service, has_id, sub_resource, is_search)"""
+    return parse_endpoint_path(path)
 
   def _generate_usage_examples(self, service: str, info: Dict) -> Dict:
     """Generate usage examples for a service"""
@@ -1,9 +1,12 @@
+import orjson
 import requests
 from typing import Dict, Any
 from pathlib import Path
+import shutil
 import sys
 from utils import logger
 import logging
+import threading
 from authlib.integrations.base_client.errors import InvalidTokenError
 from client.auth.sgn_auth import create_sgn_session
 from client.auth.no_auth import create_base_session
@@ -31,13 +34,23 @@ class BrapiClient:
       # Default to base session if no auth type or unknown type
       self.session = create_base_session()
     self.download_path = config.downloads_dir
+    # Page requests run on several threads; only one of them logs in again
+    self._reauth_lock = threading.Lock()
+    self._reauth_attempts = 0
 
-  def _try_reauth(self) -> bool:
+  def _try_reauth(self, stale_token=None) -> bool:
     """
     Attempt re-authentication once for SGN sessions.
     
     SGN servers don't support OAuth2 refresh tokens, so we must
     re-authenticate with username/password when the token expires.
+
+    Args:
+        stale_token: Token the caller's request was sent with (default: the current one).
+            If another thread has replaced it meanwhile, no new login is made.
+
+    Callers that arrive while a login is in progress get its outcome instead
+    of sending the same credentials again.
     
     Returns:
         True if re-auth successful, False otherwise
@@ -48,41 +61,56 @@ class BrapiClient:
     if not hasattr(self.session, 'login') or not self.username or not self.password:
       logging.info("Re-auth skipped: missing login method or credentials")
       return False
-    
-    try:
-      logging.info("Token expired, attempting re-authentication...")
-      self.session.login(self.username, self.password)
-      logging.info("Re-authentication successful")
-      return True
-    except Exception as e:
-      logging.error(f"Re-authentication failed: {e}")
-      return False
+
+    if stale_token is None:
+      stale_token = self.session.token
+    attempts = self._reauth_attempts
+
+    with self._reauth_lock:
+      if self.session.token is not stale_token:
+        # Another thread logged in while this one waited
+        return True
+      if self._reauth_attempts != attempts:
+        # Another thread's login failed while this one waited
+        return False
+
+      self._reauth_attempts += 1
+      try:
+        logging.info("Token expired, attempting re-authentication...")
+        self.session.login(self.username, self.password)
+        logging.info("Re-authentication successful")
+        return True
+      except Exception as e:
+        logging.error(f"Re-authentication failed: {e}")
+        return False
 
   def _get(self, path: str, params=None) -> Dict[str, Any]:
     url = f'{self.base_url}/{path.lstrip("/")}'
+    token = getattr(self.session, 'token', None)
     try:
       # Let other execptions bubble up to the tool wrapper
       resp = self.session.get(url, params=params, timeout=60)
       resp.raise_for_status()
-      return resp.json()
+      return orjson.loads(resp.content)
     except InvalidTokenError:
-      if self._try_reauth():
+      if self._try_reauth(token):
         resp = self.session.get(url, params=params, timeout=60)
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
       raise
 
   def _post(self, path: str, json=None, data=None, params=None) -> Dict[str, Any]:
     url = f'{self.base_url}/{path.lstrip("/")}'
+    token = getattr(self.session, 'token', None)
     try:
       resp = self.session.post(url, json=json, data=data, params=params, timeout=60)
       resp.raise_for_status()
-      return resp.json()
+      return orjson.loads(resp.content)
     except InvalidTokenError:
-      if self._try_reauth():
+      if self._try_reauth(token):
         resp = self.session.post(url, json=json, data=data, params=params, timeout=60)
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
       raise
 
   def fetch_serverinfo(self) -> Dict[str, Any]:
@@ -93,7 +121,7 @@ class BrapiClient:
       resp = self.session.get(url, timeout=10)
       resp.raise_for_status()
       # sys.stderr.write(f"{resp.json()}")
-      return resp.json()
+      return orjson.loads(resp.content)
     except Exception as e:
       sys.stderr.write(f"Error fetching serverinfo from {url}: {e}\n")
       return {}
@@ -114,8 +142,9 @@ class BrapiClient:
     response = self.session.get(url, stream=True, timeout=60)
     response.raise_for_status()
 
+    # Let urllib3 undo any Content-Encoding, then copy in 1 MiB blocks
+    response.raw.decode_content = True
     with open(output_path, 'wb') as f:
-      for chunk in response.iter_content(chunk_size=8192):
-        f.write(chunk)
+      shutil.copyfileobj(response.raw, f, length=1024 * 1024)
 
     return True
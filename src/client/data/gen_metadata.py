@@ -0,0 +1,80 @@
+"""
+Generate metadata_table.py from metadata.csv.
+
+Run after editing metadata.csv:
+
+  PYTHONPATH=src python -m client.data.gen_metadata
+
+The server only imports the table. To fail (exit 1) when it is out of date
+with the CSV, e.g. in CI, run:
+
+  PYTHONPATH=src python -m client.data.gen_metadata --check
+"""
+import csv
+import hashlib
+import re
+import sys
+from pathlib import Path
+
+DATA_DIR = Path(__file__).parent
+CSV_PATH = DATA_DIR / 'metadata.csv'
+TABLE_PATH = DATA_DIR / 'metadata_table.py'
+
+# Columns carried into the table; raw_json is only kept in the CSV
+FIELDS = ('service', 'category', 'description', 'dictionary_loc', 'used', 'status', 'tool', 'is_sub_service')
+
+HEADER = '''# Generated by client/data/gen_metadata.py from metadata.csv. Do not edit by hand.
+from typing import NamedTuple
+
+
+class MetaRow(NamedTuple):
+{fields}
+
+
+# Digest of the metadata.csv this table was generated from (see source_digest)
+SOURCE_DIGEST = {digest!r}
+
+METADATA: dict[str, MetaRow] = {{
+'''
+
+
+def source_digest(csv_path: Path = CSV_PATH) -> str:
+  """Content digest of metadata.csv; any edit changes it, unlike the file size"""
+  return hashlib.blake2b(csv_path.read_bytes(), digest_size=16).hexdigest()
+
+
+def generate(csv_path: Path = CSV_PATH, table_path: Path = TABLE_PATH) -> int:
+  """Write the table module and return the number of services in it"""
+  with open(csv_path, newline='') as f:
+    rows = {}
+    for row in csv.DictReader(f):
+      # First row wins, same as the CSV lookup in CapabilityBuilder
+      rows.setdefault(row['service'], row)
+
+  lines = [HEADER.format(fields='\n'.join(f'  {name}: str' for name in FIELDS), digest=source_digest(csv_path))]
+  for service, row in rows.items():
+    values = ', '.join(repr(row[name]) for name in FIELDS)
+    lines.append(f'  {service!r}: MetaRow({values}),\n')
+  lines.append('}\n')
+
+  table_path.write_text(''.join(lines))
+  return len(rows)
+
+
+def is_current(csv_path: Path = CSV_PATH, table_path: Path = TABLE_PATH) -> bool:
+  """Whether the table was generated from the CSV as it is now"""
+  try:
+    match = re.search(r"^SOURCE_DIGEST = '(\w+)'$", table_path.read_text(), re.MULTILINE)
+  except FileNotFoundError:
+    return False
+  return match is not None and match.group(1) == source_digest(csv_path)
+
+
+if __name__ == '__main__':
+  if '--check' in sys.argv[1:]:
+    if not is_current():
+      sys.exit(f'{TABLE_PATH.name} is out of date with {CSV_PATH.name}; rerun gen_metadata')
+    print(f'{TABLE_PATH.name} matches {CSV_PATH.name}')
+  else:
+    count = generate()
+    print(f'Wrote {count} services to {TABLE_PATH}')
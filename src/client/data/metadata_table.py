@@ -0,0 +1,113 @@
+# Generated by client/data/gen_metadata.py from metadata.csv. Do not edit by hand.
+from typing import NamedTuple
+
+
+class MetaRow(NamedTuple):
+  service: str
+  category: str
+  description: str
+  dictionary_loc: str
+  used: str
+  status: str
+  tool: str
+  is_sub_service: str
+
+
+# Digest of the metadata.csv this table was generated from (see source_digest)
+SOURCE_DIGEST = '7ffe2bc3ed014ce2fea0b57c735d1fc0'
+
+METADATA: dict[str, MetaRow] = {
+  'attributes': MetaRow('attributes', 'Germplasm', 'Get a filtered list of GermplasmAttribute', '{"germplasmDbId": {"type": "string","description": "List of IDs which uniquely identify germplasm to search for","required": false},"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"methodDbId": {"type": "string","description": "List of methods to filter search results","required": false},"methodName": {"type": "string","description": "Human readable name for the method\\n<br/>MIAPPE V1.1 (DM-88) Method  Name of the method of observation","required": false},"methodPUI": {"type": "string","description": "The Permanent Unique Identifier of a Method, usually in the form of a URI","required": false},"scaleDbId": {"type": "string","description": "The unique identifier for a Scale","required": false},"scaleName": {"type": "string","description": "Name of the scale\\n<br/>MIAPPE V1.1 (DM-92) Scale Name of the scale associated with the variable","required": false},"scalePUI": {"type": "string","description": "The Permanent Unique Identifier of a Scale, usually in the form of a URI","required": false},"traitDbId": {"type": "string","description": "The unique identifier for a Trait","required": false},"traitName": {"type": "string","description": "The human readable name of a trait\\n<br/>MIAPPE V1.1 (DM-86) Trait - Name of the (plant or environmental) trait under observation","required": false},"traitPUI": {"type": "string","description": "The Permanent Unique Identifier of a Trait, usually in the form of a URI","required": false},"attributeDbId": {"type": "string","description": "List of Germplasm Attribute IDs to search for","required": false},"attributeName": {"type": "string","description": "List of human readable Germplasm Attribute names to search for","required": false},"attributePUI": {"type": "string","description": "The Permanent Unique Identifier of an Attribute, usually in the form of a URI","required": false},"attributeCategory": {"type": "string","description": "General category for the attribute. very similar to Trait class.","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'attributes/{attributeDbId}': MetaRow('attributes/{attributeDbId}', 'Germplasm', 'Get the details of a specific GermplasmAttribute', '{"germplasmDbId": {"type": "string", "required": false, "description": "List of IDs which uniquely identify germplasm to search for"}, "commonCropName": {"type": "string", "required": false, "description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server."}, "programDbId": {"type": "string", "required": false, "description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server."}, "methodDbId": {"type": "string", "required": false, "description": "List of methods to filter search results"}, "methodName": {"type": "string", "required": false, "description": "Human readable name for the method\\n<br/>MIAPPE V1.1 (DM-88) Method  Name of the method of observation"}, "methodPUI": {"type": "string", "required": false, "description": "The Permanent Unique Identifier of a Method, usually in the form of a URI"}, "scaleDbId": {"type": "string", "required": false, "description": "The unique identifier for a Scale"}, "scaleName": {"type": "string", "required": false, "description": "Name of the scale\\n<br/>MIAPPE V1.1 (DM-92) Scale Name of the scale associated with the variable"}, "scalePUI": {"type": "string", "required": false, "description": "The Permanent Unique Identifier of a Scale, usually in the form of a URI"}, "traitDbId": {"type": "string", "required": false, "description": "The unique identifier for a Trait"}, "traitName": {"type": "string", "required": false, "description": "The human readable name of a trait\\n<br/>MIAPPE V1.1 (DM-86) Trait - Name of the (plant or environmental) trait under observation"}, "traitPUI": {"type": "string", "required": false, "description": "The Permanent Unique Identifier of a Trait, usually in the form of a URI"}, "attributeDbId": {"type": "string", "required": false, "description": "List of Germplasm Attribute IDs to search for"}, "attributeName": {"type": "string", "required": false, "description": "List of human readable Germplasm Attribute names to search for"}, "attributePUI": {"type": "string", "required": false, "description": "The Permanent Unique Identifier of an Attribute, usually in the form of a URI"}, "attributeCategory": {"type": "string", "required": false, "description": "General category for the attribute. very similar to Trait class."}, "externalReferenceID": {"type": "externalReferenceID", "required": false, "description": ""}, "externalReferenceId": {"type": "externalReferenceId", "required": false, "description": ""}, "externalReferenceSource": {"type": "externalReferenceSource", "required": false, "description": ""}, "page": {"type": "page", "required": false, "description": ""}, "pageSize": {"type": "pageSize", "required": false, "description": ""}, "authorizationHeader": {"type": "authorizationHeader", "required": false, "description": ""}}', '0.0', '0.0', 'get', 'False'),
+  'attributevalues': MetaRow('attributevalues', 'Germplasm', 'Get a filtered list of GermplasmAttributeValue', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"germplasmDbId": {"type": "string","description": "List of IDs which uniquely identify germplasm to search for","required": false},"germplasmName": {"type": "string","description": "List of human readable names to identify germplasm to search for","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"attributeValueDbId": {"type": "string","description": "List of Germplasm Attribute Value IDs to search for","required": false},"attributeDbId": {"type": "string","description": "List of Germplasm Attribute IDs to search for","required": false},"attributeName": {"type": "string","description": "List of human readable Germplasm Attribute names to search for","required": false},"ontologyDbId": {"type": "string","description": "List of ontology IDs to search for","required": false},"methodDbId": {"type": "string","description": "List of methods to filter search results","required": false},"scaleDbId": {"type": "string","description": "List of scales to filter search results","required": false},"traitDbId": {"type": "string","description": "List of trait unique ID to filter search results","required": false},"traitClass": {"type": "string","description": "List of trait classes to filter search results","required": false},"dataType": {"type": "string","description": "List of scale data types to filter search results","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'attributevalues/{attributeValueDbId}': MetaRow('attributevalues/{attributeValueDbId}', 'Germplasm', 'Get the details of a specific GermplasmAttributeValue', '{}', '0.0', '0.0', 'get', 'False'),
+  'breedingmethods': MetaRow('breedingmethods', 'Germplasm', 'Get a filtered list of BreedingMethod', '{}', '0.0', '0.0', 'get', 'False'),
+  'breedingmethods/{breedingMethodDbId}': MetaRow('breedingmethods/{breedingMethodDbId}', 'Germplasm', 'Get the details of a specific BreedingMethod', '{}', '0.0', '0.0', 'get', 'False'),
+  'calls': MetaRow('calls', 'Genotyping', 'Get a filtered list of Call', '{"callSetDbId": {"type": "string","description": "A list of IDs which uniquely identify `CallSets` within the given database server","required": false},"variantDbId": {"type": "string","description": "A list of IDs which uniquely identify `Variant` within the given database server","required": false},"variantSetDbId": {"type": "string","description": "A list of IDs which uniquely identify `VariantSets` within the given database server","required": false},"expandHomozygote": {"type": "boolean","description": "Should homozygotes be expanded (true) or collapsed into a single occurrence (false)","required": false},"sepPhased": {"type": "string","description": "The string used as a separator for phased allele calls.","required": false},"sepUnphased": {"type": "string","description": "The string used as a separator for unphased allele calls.","required": false},"unknownString": {"type": "string","description": "The string used as a representation for missing data.","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'callsets': MetaRow('callsets', 'Genotyping', 'Get a filtered list of CallSet', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"germplasmDbId": {"type": "string","description": "List of IDs which uniquely identify germplasm to search for","required": false},"germplasmName": {"type": "string","description": "List of human readable names to identify germplasm to search for","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"studyDbId": {"type": "string","description": "List of study identifiers to search for","required": false},"studyName": {"type": "string","description": "List of study names to filter search results","required": false},"trialDbId": {"type": "string","description": "The ID which uniquely identifies a trial to search for","required": false},"trialName": {"type": "string","description": "The human readable name of a trial to search for","required": false},"sampleDbId": {"type": "string","description": "A list of IDs which uniquely identify `Samples` within the given database server","required": false},"sampleName": {"type": "string","description": "A list of human readable names associated with `Samples`","required": false},"callSetDbId": {"type": "string","description": "A list of IDs which uniquely identify `CallSets` within the given database server","required": false},"callSetName": {"type": "string","description": "A list of human readable names associated with `CallSets`","required": false},"variantSetDbId": {"type": "string","description": "A list of IDs which uniquely identify `VariantSets` within the given database server","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'callsets/{callSetDbId}': MetaRow('callsets/{callSetDbId}', 'Genotyping', 'Get the details of a specific CallSet', '{}', '0.0', '0.0', 'get', 'False'),
+  'callsets/{callSetDbId}/calls': MetaRow('callsets/{callSetDbId}/calls', 'Genotyping', 'Get a filtered list of Call', '{"callSetDbId": {"type": "string","description": "A list of IDs which uniquely identify `CallSets` within the given database server","required": false},"variantDbId": {"type": "string","description": "A list of IDs which uniquely identify `Variant` within the given database server","required": false},"variantSetDbId": {"type": "string","description": "A list of IDs which uniquely identify `VariantSets` within the given database server","required": false},"expandHomozygote": {"type": "boolean","description": "Should homozygotes be expanded (true) or collapsed into a single occurrence (false)","required": false},"sepPhased": {"type": "string","description": "The string used as a separator for phased allele calls.","required": false},"sepUnphased": {"type": "string","description": "The string used as a separator for unphased allele calls.","required": false},"unknownString": {"type": "string","description": "The string used as a representation for missing data.","required": false}}', '0.0', '0.0', 'get', 'True'),
+  'crosses': MetaRow('crosses', 'Germplasm', 'Get a filtered list of Cross', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"crossingProjectDbId": {"type": "string","description": "Search for Crossing Projects with this unique id","required": false},"crossingProjectName": {"type": "string","description": "The human readable name for a crossing project","required": false},"crossDbId": {"type": "string","description": "Search for Cross with this unique id","required": false},"crossName": {"type": "string","description": "Search for Cross with this human readable name","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'crossingprojects': MetaRow('crossingprojects', 'Germplasm', 'Get a filtered list of CrossingProject', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"crossingProjectDbId": {"type": "string","description": "Search for Crossing Projects with this unique id","required": false},"crossingProjectName": {"type": "string","description": "The human readable name for a crossing project","required": false},"includePotentialParent": {"type": "boolean","description": "If the parameter \'includePotentialParents\' is false, the array \'potentialParents\' should be empty, null, or excluded from the response object.","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'crossingprojects/{crossingProjectDbId}': MetaRow('crossingprojects/{crossingProjectDbId}', 'Germplasm', 'Get the details of a specific CrossingProject', '{}', '0.0', '0.0', 'get', 'False'),
+  'events': MetaRow('events', 'Phenotyping', 'Get a filtered list of Event', '{"studyDbId": {"type": "string","description": "List of study identifiers to search for","required": false},"studyName": {"type": "string","description": "List of study names to filter search results","required": false},"observationUnitDbId": {"type": "string","description": "The ID which uniquely identifies an observation unit.","required": false},"eventDbId": {"type": "string","description": "Filter based on an Event DbId.","required": false},"eventType": {"type": "string","description": "Filter based on an Event Type","required": false},"dateRangeStart": {"type": "string","description": "Filter based on an Event start date.","required": false},"dateRangeEnd": {"type": "string","description": "Filter based on an Event start date.","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'germplasm': MetaRow('germplasm', 'Germplasm', 'Get a filtered list of Germplasm', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"germplasmDbId": {"type": "string","description": "List of IDs which uniquely identify germplasm to search for","required": false},"germplasmName": {"type": "string","description": "List of human readable names to identify germplasm to search for","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"studyDbId": {"type": "string","description": "List of study identifiers to search for","required": false},"studyName": {"type": "string","description": "List of study names to filter search results","required": false},"trialDbId": {"type": "string","description": "The ID which uniquely identifies a trial to search for","required": false},"trialName": {"type": "string","description": "The human readable name of a trial to search for","required": false},"germplasmPUI": {"type": "string","description": "List of Permanent Unique Identifiers to identify germplasm","required": false},"accessionNumber": {"type": "string","description": "A collection of unique identifiers for materials or germplasm within a genebank\\n\\nMCPD (v2.1) (ACCENUMB) 2. This is the unique identifier for accessions within a genebank, and is assigned when a sample is entered into the genebank collection (e.g. \\"PI 113869\\").","required": false},"collection": {"type": "string","description": "A specific panel/collection/population name this germplasm belongs to.","required": false},"familyCode": {"type": "string","description": "A familyCode representing the family this germplasm belongs to.","required": false},"instituteCode": {"type": "string","description": "The code for the institute that maintains the material. \\n<br/> MCPD (v2.1) (INSTCODE) 1. FAO WIEWS code of the institute where the accession is maintained. The codes consist of the 3-letter ISO 3166 country code of the country where the institute is located plus a number (e.g. PER001). The current set of institute codes is available from http://www.fao.org/wiews. For those institutes not yet having an FAO Code, or for those with \\"obsolete\\" codes, see \\"Common formatting rules (v)\\".","required": false},"binomialName": {"type": "string","description": "List of the full binomial name (scientific name) to identify a germplasm","required": false},"genu": {"type": "string","description": "List of Genus names to identify germplasm","required": false},"specy": {"type": "string","description": "List of Species names to identify germplasm","required": false},"synonym": {"type": "string","description": "List of alternative names or IDs used to reference this germplasm","required": false},"parentDbId": {"type": "string","description": "Search for Germplasm with these parents","required": false},"progenyDbId": {"type": "string","description": "Search for Germplasm with these children","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'germplasm/{germplasmDbId}': MetaRow('germplasm/{germplasmDbId}', 'Germplasm', 'Get the details of a specific Germplasm', '{}', '0.0', '0.0', 'get', 'False'),
+  'images': MetaRow('images', 'Phenotyping', 'Get a filtered list of Image', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"descriptiveOntologyTerm": {"type": "string","description": "A list of terms to formally describe the image to search for. Each item could be a simple Tag, an Ontology reference Id, or a full ontology URL.","required": false},"imageFileName": {"type": "string","description": "Image file names to search for.","required": false},"imageFileSizeMax": {"type": "integer","description": "A maximum image file size to search for.","required": false},"imageFileSizeMin": {"type": "integer","description": "A minimum image file size to search for.","required": false},"imageHeightMax": {"type": "integer","description": "A maximum image height to search for.","required": false},"imageHeightMin": {"type": "integer","description": "A minimum image height to search for.","required": false},"imageLocation": {"type": "string","description": "","required": false},"imageName": {"type": "string","description": "Human readable names to search for.","required": false},"imageTimeStampRangeEnd": {"type": "string","description": "The latest timestamp to search for.","required": false},"imageTimeStampRangeStart": {"type": "string","description": "The earliest timestamp to search for.","required": false},"imageWidthMax": {"type": "integer","description": "A maximum image width to search for.","required": false},"imageWidthMin": {"type": "integer","description": "A minimum image width to search for.","required": false},"mimeType": {"type": "string","description": "A set of image file types to search for.","required": false},"observationDbId": {"type": "string","description": "A list of observation Ids this image is associated with to search for","required": false},"imageDbId": {"type": "string","description": "A list of image Ids to search for","required": false},"observationUnitDbId": {"type": "string","description": "A set of observation unit identifiers to search for.","required": false}}', '0.0', '0.0', 'image', 'False'),
+  'images/{imageDbId}': MetaRow('images/{imageDbId}', 'Phenotyping', 'Get the details of a specific Image', '{}', '0.0', '0.0', 'image', 'False'),
+  'lists': MetaRow('lists', 'Core', 'Get a filtered list of List', '{"dateCreatedRangeStart": {"type": "string","description": "Define the beginning for an interval of time and only include Lists that are created within this interval.","required": false},"dateCreatedRangeEnd": {"type": "string","description": "Define the end for an interval of time and only include Lists that are created within this interval.","required": false},"dateModifiedRangeStart": {"type": "string","description": "Define the beginning for an interval of time and only include Lists that are modified within this interval.","required": false},"dateModifiedRangeEnd": {"type": "string","description": "Define the end for an interval of time and only include Lists that are modified within this interval.","required": false},"listDbId": {"type": "string","description": "An array of primary database identifiers to identify a set of Lists","required": false},"listName": {"type": "string","description": "An array of human readable names to identify a set of Lists","required": false},"listOwnerName": {"type": "string","description": "An array of names for the people or entities who are responsible for a set of Lists","required": false},"listOwnerPersonDbId": {"type": "string","description": "An array of primary database identifiers to identify people or entities who are responsible for a set of Lists","required": false},"listSource": {"type": "string","description": "An array of terms identifying lists from different sources (ie \'USER\', \'SYSTEM\', etc)","required": false},"listType": {"type": "string","description": "","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'lists/{listDbId}': MetaRow('lists/{listDbId}', 'Core', 'Get the details of a specific List', '{}', '0.0', '0.0', 'get', 'False'),
+  'locations': MetaRow('locations', 'Core', 'Get a filtered list of Location', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"locationDbId": {"type": "string","description": "The location ids to search for","required": false},"locationName": {"type": "string","description": "A human readable names to search for","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"abbreviation": {"type": "string","description": "A list of shortened human readable names for a set of Locations","required": false},"altitudeMin": {"type": "number","description": "The minimum altitude to search for","required": false},"altitudeMax": {"type": "number","description": "The maximum altitude to search for","required": false},"countryCode": {"type": "string","description": "[ISO_3166-1_alpha-3](https://en.wikipedia.org/wiki/ISO_3166-1_alpha-3) spec","required": false},"countryName": {"type": "string","description": "The full name of the country to search for","required": false},"coordinate": {"type": "string","description": "","required": false},"instituteAddress": {"type": "string","description": "The street address of the institute to search for","required": false},"instituteName": {"type": "string","description": "The name of the institute to search for","required": false},"locationType": {"type": "string","description": "The type of location this represents (ex. Breeding Location, Storage Location, etc)","required": false},"parentLocationDbId": {"type": "string","description": "The unique identifier for a Location\\n<br/> The Parent Location defines the encompassing location that this location belongs to. \\nFor example, an Institution might have multiple Field Stations inside it and each Field Station might have multiple Fields.","required": false},"parentLocationName": {"type": "string","description": "A human readable name for a location\\n<br/> The Parent Location defines the encompassing location that this location belongs to. \\nFor example, an Institution might have multiple Field Stations inside it and each Field Station might have multiple Fields.","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'locations/{locationDbId}': MetaRow('locations/{locationDbId}', 'Core', 'Get the details of a specific Location', '{}', '0.0', '0.0', 'get', 'False'),
+  'maps': MetaRow('maps', 'Genotyping', 'Get a filtered list of GenomeMap', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"studyDbId": {"type": "string","description": "List of study identifiers to search for","required": false},"studyName": {"type": "string","description": "List of study names to filter search results","required": false},"trialDbId": {"type": "string","description": "The ID which uniquely identifies a trial to search for","required": false},"trialName": {"type": "string","description": "The human readable name of a trial to search for","required": false},"mapDbId": {"type": "string","description": "The ID which uniquely identifies a `GenomeMap`","required": false},"mapPUI": {"type": "string","description": "The DOI or other permanent identifier for a `GenomeMap`","required": false},"scientificName": {"type": "string","description": "Full scientific binomial format name. This includes Genus, Species, and Sub-species","required": false},"type": {"type": "string","description": "The type of map, usually \\"Genetic\\" or \\"Physical\\"","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'maps/{mapDbId}': MetaRow('maps/{mapDbId}', 'Genotyping', 'Get the details of a specific GenomeMap', '{}', '0.0', '0.0', 'get', 'False'),
+  'markerpositions': MetaRow('markerpositions', 'Genotyping', 'Get a filtered list of MarkerPosition', '{"mapDbId": {"type": "string","description": "A list of IDs which uniquely identify `GenomeMaps` within the given database server","required": false},"linkageGroupName": {"type": "string","description": "A list of Uniquely Identifiable linkage group names","required": false},"variantDbId": {"type": "string","description": "A list of IDs which uniquely identify `Variants` within the given database server","required": false},"minPosition": {"type": "integer","description": "The minimum position of markers in a given map","required": false},"maxPosition": {"type": "integer","description": "The maximum position of markers in a given map","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'methods': MetaRow('methods', 'Other', 'Get a filtered list of Method', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"ontologyDbId": {"type": "string","description": "The unique identifier for an ontology definition. Use this parameter to filter results based on a specific ontology \\n\\n  Use `GET /ontologies` to find the list of available ontologies on a server.","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"scaleDbId": {"type": "string","description": "The unique identifier for a method.","required": false},"observationVariableDbId": {"type": "string","description": "The unique identifier for an observation variable.","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'methods/{methodDbId}': MetaRow('methods/{methodDbId}', 'Other', 'Get the details of a specific Method', '{}', '0.0', '0.0', 'get', 'False'),
+  'observations': MetaRow('observations', 'Phenotyping', 'Get a filtered list of Observation', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"germplasmDbId": {"type": "string","description": "List of IDs which uniquely identify germplasm to search for","required": false},"germplasmName": {"type": "string","description": "List of human readable names to identify germplasm to search for","required": false},"locationDbId": {"type": "string","description": "The location ids to search for","required": false},"locationName": {"type": "string","description": "A human readable names to search for","required": false},"observationVariableDbId": {"type": "string","description": "The DbIds of Variables to search for","required": false},"observationVariableName": {"type": "string","description": "The names of Variables to search for","required": false},"observationVariablePUI": {"type": "string","description": "The Permanent Unique Identifier of an Observation Variable, usually in the form of a URI","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"studyDbId": {"type": "string","description": "List of study identifiers to search for","required": false},"studyName": {"type": "string","description": "List of study names to filter search results","required": false},"trialDbId": {"type": "string","description": "The ID which uniquely identifies a trial to search for","required": false},"trialName": {"type": "string","description": "The human readable name of a trial to search for","required": false},"observationDbId": {"type": "string","description": "The unique id of an Observation","required": false},"observationUnitDbId": {"type": "string","description": "The unique id of an Observation Unit","required": false},"observationLevel": {"type": "string","description": "Searches for values in ObservationUnit->observationUnitPosition->observationLevel","required": false},"observationLevelRelationship": {"type": "string","description": "Searches for values in ObservationUnit->observationUnitPosition->observationLevelRelationships","required": false},"observationTimeStampRangeEnd": {"type": "string","description": "Timestamp range end","required": false},"observationTimeStampRangeStart": {"type": "string","description": "Timestamp range start","required": false},"seasonDbId": {"type": "string","description": "The year or Phenotyping campaign of a multi-annual study (trees, grape, ...)","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'observations/{observationDbId}': MetaRow('observations/{observationDbId}', 'Phenotyping', 'Get the details of a specific Observation', '{}', '0.0', '0.0', 'get', 'False'),
+  'observationunits': MetaRow('observationunits', 'Phenotyping', 'Get a filtered list of ObservationUnit', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"germplasmDbId": {"type": "string","description": "List of IDs which uniquely identify germplasm to search for","required": false},"germplasmName": {"type": "string","description": "List of human readable names to identify germplasm to search for","required": false},"locationDbId": {"type": "string","description": "The location ids to search for","required": false},"locationName": {"type": "string","description": "A human readable names to search for","required": false},"studyDbId": {"type": "string","description": "List of study identifiers to search for","required": false},"studyName": {"type": "string","description": "List of study names to filter search results","required": false},"observationVariableDbId": {"type": "string","description": "The DbIds of Variables to search for","required": false},"observationVariableName": {"type": "string","description": "The names of Variables to search for","required": false},"observationVariablePUI": {"type": "string","description": "The Permanent Unique Identifier of an Observation Variable, usually in the form of a URI","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"trialDbId": {"type": "string","description": "The ID which uniquely identifies a trial to search for","required": false},"trialName": {"type": "string","description": "The human readable name of a trial to search for","required": false},"observationUnitDbId": {"type": "string","description": "The unique id of an observation unit","required": false},"observationUnitName": {"type": "string","description": "The human readable identifier for an Observation Unit","required": false},"observationLevel": {"type": "string","description": "Searches for values in ObservationUnit->observationUnitPosition->observationLevel","required": false},"observationLevelRelationship": {"type": "string","description": "Searches for values in ObservationUnit->observationUnitPosition->observationLevelRelationships","required": false},"includeObservation": {"type": "boolean","description": "Use this parameter to include a list of observations embedded in each ObservationUnit object. \\n\\nCAUTION - Use this parameter at your own risk. It may return large, unpaginated lists of observation data. Only set this value to True if you are sure you need to.","required": false},"seasonDbId": {"type": "string","description": "The year or Phenotyping campaign of a multi-annual study (trees, grape, ...)","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'observationunits/{observationUnitDbId}': MetaRow('observationunits/{observationUnitDbId}', 'Phenotyping', 'Get the details of a specific ObservationUnit', '{}', '0.0', '0.0', 'get', 'False'),
+  'ontologies': MetaRow('ontologies', 'Phenotyping', 'Get a filtered list of Ontology', '{"ontologyDbId": {"type": "string","description": "The unique identifier for an ontology definition. Use this parameter to filter results based on a specific ontology \\n\\n  Use `GET /ontologies` to find the list of available ontologies on a server.","required": false},"ontologyName": {"type": "string","description": "The human readable identifier for an ontology definition.","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'ontologies/{ontologyDbId}': MetaRow('ontologies/{ontologyDbId}', 'Phenotyping', 'Get the details of a specific Ontology', '{}', '0.0', '0.0', 'get', 'False'),
+  'pedigree': MetaRow('pedigree', 'Other', 'Get a filtered list of PedigreeNode', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"germplasmDbId": {"type": "string","description": "List of IDs which uniquely identify germplasm to search for","required": false},"germplasmName": {"type": "string","description": "List of human readable names to identify germplasm to search for","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"studyDbId": {"type": "string","description": "List of study identifiers to search for","required": false},"studyName": {"type": "string","description": "List of study names to filter search results","required": false},"trialDbId": {"type": "string","description": "The ID which uniquely identifies a trial to search for","required": false},"trialName": {"type": "string","description": "The human readable name of a trial to search for","required": false},"germplasmPUI": {"type": "string","description": "List of Permanent Unique Identifiers to identify germplasm","required": false},"accessionNumber": {"type": "string","description": "A collection of unique identifiers for materials or germplasm within a genebank\\n\\nMCPD (v2.1) (ACCENUMB) 2. This is the unique identifier for accessions within a genebank, and is assigned when a sample is entered into the genebank collection (e.g. \\"PI 113869\\").","required": false},"collection": {"type": "string","description": "A specific panel/collection/population name this germplasm belongs to.","required": false},"familyCode": {"type": "string","description": "A familyCode representing the family this germplasm belongs to.","required": false},"instituteCode": {"type": "string","description": "The code for the institute that maintains the material. \\n<br/> MCPD (v2.1) (INSTCODE) 1. FAO WIEWS code of the institute where the accession is maintained. The codes consist of the 3-letter ISO 3166 country code of the country where the institute is located plus a number (e.g. PER001). The current set of institute codes is available from http://www.fao.org/wiews. For those institutes not yet having an FAO Code, or for those with \\"obsolete\\" codes, see \\"Common formatting rules (v)\\".","required": false},"binomialName": {"type": "string","description": "List of the full binomial name (scientific name) to identify a germplasm","required": false},"genu": {"type": "string","description": "List of Genus names to identify germplasm","required": false},"specy": {"type": "string","description": "List of Species names to identify germplasm","required": false},"synonym": {"type": "string","description": "List of alternative names or IDs used to reference this germplasm","required": false},"includeParent": {"type": "boolean","description": "If this parameter is true, include the array of parents in the response","required": false},"includeSibling": {"type": "boolean","description": "If this parameter is true, include the array of siblings in the response","required": false},"includeProgeny": {"type": "boolean","description": "If this parameter is true, include the array of progeny in the response","required": false},"includeFullTree": {"type": "boolean","description": "If this parameter is true, recursively include ALL of the nodes available in this pedigree tree","required": false},"pedigreeDepth": {"type": "integer","description": "Recursively include this number of levels up the tree in the response (parents, grand-parents, great-grand-parents, etc)","required": false},"progenyDepth": {"type": "integer","description": "Recursively include this number of levels down the tree in the response (children, grand-children, great-grand-children, etc)","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'people': MetaRow('people', 'Core', 'Get a filtered list of Person', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"emailAddress": {"type": "string","description": "email address for this person","required": false},"firstName": {"type": "string","description": "Persons first name","required": false},"lastName": {"type": "string","description": "Persons last name","required": false},"mailingAddress": {"type": "string","description": "physical address of this person","required": false},"middleName": {"type": "string","description": "Persons middle name","required": false},"personDbId": {"type": "string","description": "Unique ID for this person","required": false},"phoneNumber": {"type": "string","description": "phone number of this person","required": false},"userID": {"type": "string","description": "A systems user ID associated with this person. Different from personDbId because you could have a person who is not a user of the system.","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'people/{personDbId}': MetaRow('people/{personDbId}', 'Core', 'Get the details of a specific Person', '{}', '0.0', '0.0', 'get', 'False'),
+  'plannedcrosses': MetaRow('plannedcrosses', 'Germplasm', 'Get a filtered list of PlannedCross', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"crossingProjectDbId": {"type": "string","description": "Search for Crossing Projects with this unique id","required": false},"crossingProjectName": {"type": "string","description": "The human readable name for a crossing project","required": false},"plannedCrossDbId": {"type": "string","description": "Search for Planned Cross with this unique id","required": false},"plannedCrossName": {"type": "string","description": "Search for Planned Cross with this human readable name","required": false},"status": {"type": "string","description": "The status of this planned cross. Is it waiting to be performed (\'TODO\'), has it been completed successfully (\'DONE\'), or has it not been done on purpose (\'SKIPPED\').","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'plates': MetaRow('plates', 'Genotyping', 'Get a filtered list of Plate', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"germplasmDbId": {"type": "string","description": "The ID which uniquely identifies a germplasm","required": false},"germplasmName": {"type": "string","description": "List of human readable names to identify germplasm to search for","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"studyDbId": {"type": "string","description": "List of study identifiers to search for","required": false},"studyName": {"type": "string","description": "List of study names to filter search results","required": false},"trialDbId": {"type": "string","description": "The ID which uniquely identifies a trial to search for","required": false},"trialName": {"type": "string","description": "The human readable name of a trial to search for","required": false},"observationUnitDbId": {"type": "string","description": "The ID which uniquely identifies an observation unit","required": false},"plateDbId": {"type": "string","description": "The ID which uniquely identifies a plate of samples","required": false},"plateName": {"type": "string","description": "The human readable name of a plate of samples","required": false},"plateBarcode": {"type": "string","description": "A unique identifier physically attached to the plate","required": false},"sampleDbId": {"type": "string","description": "The ID which uniquely identifies a sample","required": false},"sampleName": {"type": "string","description": "The human readable name of the sample","required": false},"sampleGroupDbId": {"type": "string","description": "The unique identifier for a group of related Samples","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'plates/{plateDbId}': MetaRow('plates/{plateDbId}', 'Genotyping', 'Get the details of a specific Plate', '{}', '0.0', '0.0', 'get', 'False'),
+  'programs': MetaRow('programs', 'Core', 'Get a filtered list of Program', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"abbreviation": {"type": "string","description": "A list of shortened human readable names for a set of Programs","required": false},"leadPersonDbId": {"type": "string","description": "The person DbIds of the program leader to search for","required": false},"leadPersonName": {"type": "string","description": "The names of the program leader to search for","required": false},"objectife": {"type": "string","description": "A program objective to search for","required": false},"programType": {"type": "string","description": "The type of program entity this object represents\\n<br/> \'STANDARD\' represents a standard, permanent breeding program\\n<br/> \'PROJECT\' represents a short term project, usually with a set time limit based on funding ","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'programs/{programDbId}': MetaRow('programs/{programDbId}', 'Core', 'Get the details of a specific Program', '{}', '0.0', '0.0', 'get', 'False'),
+  'references': MetaRow('references', 'Genotyping', 'Get a filtered list of Reference', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"germplasmDbId": {"type": "string","description": "List of IDs which uniquely identify germplasm to search for","required": false},"germplasmName": {"type": "string","description": "List of human readable names to identify germplasm to search for","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"studyDbId": {"type": "string","description": "List of study identifiers to search for","required": false},"studyName": {"type": "string","description": "List of study names to filter search results","required": false},"trialDbId": {"type": "string","description": "The ID which uniquely identifies a trial to search for","required": false},"trialName": {"type": "string","description": "The human readable name of a trial to search for","required": false},"accession": {"type": "string","description": "If specified, return the references for which the `accession` matches this string (case-sensitive, exact match).","required": false},"md5checksum": {"type": "string","description": "If specified, return the references for which the `md5checksum` matches this string (case-sensitive, exact match).","required": false},"referenceDbId": {"type": "string","description": "A list of IDs which uniquely identify `References` within the given database server","required": false},"referenceSetDbId": {"type": "string","description": "A list of IDs which uniquely identify `ReferenceSets` within the given database server","required": false},"isDerived": {"type": "boolean","description": "A sequence X is said to be derived from source sequence Y, if X and Y are of the same length and the per-base sequence divergence at A/C/G/T bases is sufficiently small. Two sequences derived from the same official sequence share the same coordinates and annotations, and can be replaced with the official sequence for certain use cases.","required": false},"minLength": {"type": "integer","description": "The minimum length of this `References` sequence.","required": false},"maxLength": {"type": "integer","description": "The minimum length of this `References` sequence.","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'references/{referenceDbId}': MetaRow('references/{referenceDbId}', 'Genotyping', 'Get the details of a specific Reference', '{}', '0.0', '0.0', 'get', 'False'),
+  'referencesets': MetaRow('referencesets', 'Genotyping', 'Get a filtered list of ReferenceSet', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"germplasmDbId": {"type": "string","description": "List of IDs which uniquely identify germplasm to search for","required": false},"germplasmName": {"type": "string","description": "List of human readable names to identify germplasm to search for","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"studyDbId": {"type": "string","description": "List of study identifiers to search for","required": false},"studyName": {"type": "string","description": "List of study names to filter search results","required": false},"trialDbId": {"type": "string","description": "The ID which uniquely identifies a trial to search for","required": false},"trialName": {"type": "string","description": "The human readable name of a trial to search for","required": false},"accession": {"type": "string","description": "If set, return the reference sets for which the `accession` matches this string (case-sensitive, exact match).","required": false},"assemblyPUI": {"type": "string","description": "If set, return the reference sets for which the `assemblyId` matches this string (case-sensitive, exact match).","required": false},"md5checksum": {"type": "string","description": "If set, return the reference sets for which the `md5checksum` matches this string (case-sensitive, exact match).","required": false},"referenceSetDbId": {"type": "string","description": "The `ReferenceSets` to search.","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'referencesets/{referenceSetDbId}': MetaRow('referencesets/{referenceSetDbId}', 'Genotyping', 'Get the details of a specific ReferenceSet', '{}', '0.0', '0.0', 'get', 'False'),
+  'samples': MetaRow('samples', 'Genotyping', 'Get a filtered list of Sample', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"germplasmDbId": {"type": "string","description": "The ID which uniquely identifies a `Germplasm`","required": false},"germplasmName": {"type": "string","description": "List of human readable names to identify germplasm to search for","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"studyDbId": {"type": "string","description": "List of study identifiers to search for","required": false},"studyName": {"type": "string","description": "List of study names to filter search results","required": false},"trialDbId": {"type": "string","description": "The ID which uniquely identifies a trial to search for","required": false},"trialName": {"type": "string","description": "The human readable name of a trial to search for","required": false},"observationUnitDbId": {"type": "string","description": "The ID which uniquely identifies an `ObservationUnit`","required": false},"plateDbId": {"type": "string","description": "The ID which uniquely identifies a `Plate` of `Samples`","required": false},"plateName": {"type": "string","description": "The human readable name of a `Plate` of `Samples`","required": false},"sampleDbId": {"type": "string","description": "The ID which uniquely identifies a `Sample`","required": false},"sampleName": {"type": "string","description": "The human readable name of the `Sample`","required": false},"sampleGroupDbId": {"type": "string","description": "The unique identifier for a group of related `Samples`","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'samples/{sampleDbId}': MetaRow('samples/{sampleDbId}', 'Genotyping', 'Get the details of a specific Sample', '{}', '0.0', '0.0', 'get', 'False'),
+  'scales': MetaRow('scales', 'Other', 'Get a filtered list of Scale', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"ontologyDbId": {"type": "string","description": "The unique identifier for an ontology definition. Use this parameter to filter results based on a specific ontology \\n\\n  Use `GET /ontologies` to find the list of available ontologies on a server.","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"scaleDbId": {"type": "string","description": "The unique identifier for a scale.","required": false},"observationVariableDbId": {"type": "string","description": "The unique identifier for an observation variable.","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'scales/{scaleDbId}': MetaRow('scales/{scaleDbId}', 'Other', 'Get the details of a specific Scale', '{}', '0.0', '0.0', 'get', 'False'),
+  'seasons': MetaRow('seasons', 'Core', 'Get a filtered list of Season', '{"seasonDbId": {"type": "string","description": "The unique identifier for a season. For backward compatibility it can be a string like \'2012\', \'1957-2004\'.","required": false},"season": {"type": "string","description": "The term to describe a given season. Example \\"Spring\\" OR \\"May\\" OR \\"Planting_Time_7\\".","required": false},"seasonName": {"type": "string","description": "The term to describe a given season. Example \\"Spring\\" OR \\"May\\" OR \\"Planting_Time_7\\".","required": false},"year": {"type": "string","description": "The 4 digit year of a season. Example \\"2017\\"","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'seasons/{seasonDbId}': MetaRow('seasons/{seasonDbId}', 'Core', 'Get the details of a specific Season', '{}', '0.0', '0.0', 'get', 'False'),
+  'seedlots': MetaRow('seedlots', 'Germplasm', 'Get a filtered list of SeedLot', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"germplasmDbId": {"type": "string","description": "List of IDs which uniquely identify germplasm to search for","required": false},"germplasmName": {"type": "string","description": "List of human readable names to identify germplasm to search for","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"seedLotDbId": {"type": "string","description": "Unique id for a seed lot on this server","required": false},"crossDbId": {"type": "string","description": "Search for Cross with this unique id","required": false},"crossName": {"type": "string","description": "Search for Cross with this human readable name","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'seedlots/{seedLotDbId}': MetaRow('seedlots/{seedLotDbId}', 'Germplasm', 'Get the details of a specific SeedLot', '{}', '0.0', '0.0', 'get', 'False'),
+  'studies': MetaRow('studies', 'Core', 'Get a filtered list of Study', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"germplasmDbId": {"type": "string","description": "List of IDs which uniquely identify germplasm to search for","required": false},"germplasmName": {"type": "string","description": "List of human readable names to identify germplasm to search for","required": false},"locationDbId": {"type": "string","description": "The location ids to search for","required": false},"locationName": {"type": "string","description": "A human readable names to search for","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"studyDbId": {"type": "string","description": "List of study identifiers to search for","required": false},"studyName": {"type": "string","description": "List of study names to filter search results","required": false},"trialDbId": {"type": "string","description": "The ID which uniquely identifies a trial to search for","required": false},"trialName": {"type": "string","description": "The human readable name of a trial to search for","required": false},"observationVariableDbId": {"type": "string","description": "The DbIds of Variables to search for","required": false},"observationVariableName": {"type": "string","description": "The names of Variables to search for","required": false},"observationVariablePUI": {"type": "string","description": "The Permanent Unique Identifier of an Observation Variable, usually in the form of a URI","required": false},"actife": {"type": "boolean","description": "A flag to indicate if a Study is currently active and ongoing","required": false},"seasonDbId": {"type": "string","description": "The ID which uniquely identifies a season","required": false},"studyType": {"type": "string","description": "The type of study being performed. ex. \\"Yield Trial\\", etc","required": false},"studyCode": {"type": "string","description": "A short human readable code for a study","required": false},"studyPUI": {"type": "string","description": "Permanent unique identifier associated with study data. For example, a URI or DOI","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'studies/{studyDbId}': MetaRow('studies/{studyDbId}', 'Core', 'Get the details of a specific Study', '{}', '0.0', '0.0', 'get', 'False'),
+  'traits': MetaRow('traits', 'Phenotyping', 'Get a filtered list of Trait', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"ontologyDbId": {"type": "string","description": "The unique identifier for an ontology definition. Use this parameter to filter results based on a specific ontology \\n\\n  Use `GET /ontologies` to find the list of available ontologies on a server.","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"traitDbId": {"type": "string","description": "The unique identifier for a trait.","required": false},"observationVariableDbId": {"type": "string","description": "The unique identifier for an observation variable.","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'traits/{traitDbId}': MetaRow('traits/{traitDbId}', 'Phenotyping', 'Get the details of a specific Trait', '{}', '0.0', '0.0', 'get', 'False'),
+  'trials': MetaRow('trials', 'Core', 'Get a filtered list of Trial', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"locationDbId": {"type": "string","description": "The location ids to search for","required": false},"locationName": {"type": "string","description": "A human readable names to search for","required": false},"observationVariableDbId": {"type": "string","description": "The DbIds of Variables to search for","required": false},"observationVariableName": {"type": "string","description": "The names of Variables to search for","required": false},"observationVariablePUI": {"type": "string","description": "The Permanent Unique Identifier of an Observation Variable, usually in the form of a URI","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"studyDbId": {"type": "string","description": "List of study identifiers to search for","required": false},"studyName": {"type": "string","description": "List of study names to filter search results","required": false},"trialDbId": {"type": "string","description": "The ID which uniquely identifies a trial to search for","required": false},"trialName": {"type": "string","description": "The human readable name of a trial to search for","required": false},"actife": {"type": "boolean","description": "A flag to indicate if a Trial is currently active and ongoing","required": false},"contactDbId": {"type": "string","description": "List of contact entities associated with this trial","required": false},"searchDateRangeStart": {"type": "string","description": "The start of the overlapping search date range. `searchDateRangeStart` must be before `searchDateRangeEnd`.\\n\\nReturn a Trial entity if any of the following cases are true\\n\\n- `searchDateRangeStart` is before `trial.endDate` AND `searchDateRangeEnd` is null \\n\\n- `searchDateRangeStart` is before `trial.endDate` AND `searchDateRangeEnd` is after `trial.startDate`\\n\\n- `searchDateRangeEnd` is after `trial.startDate` AND `searchDateRangeStart` is null\\n\\n- `searchDateRangeEnd` is after `trial.startDate` AND `searchDateRangeStart` is before `trial.endDate`","required": false},"searchDateRangeEnd": {"type": "string","description": "The end of the overlapping search date range. `searchDateRangeStart` must be before `searchDateRangeEnd`.\\n\\nReturn a Trial entity if any of the following cases are true\\n\\n- `searchDateRangeStart` is before `trial.endDate` AND `searchDateRangeEnd` is null \\n\\n- `searchDateRangeStart` is before `trial.endDate` AND `searchDateRangeEnd` is after `trial.startDate`\\n\\n- `searchDateRangeEnd` is after `trial.startDate` AND `searchDateRangeStart` is null\\n\\n- `searchDateRangeEnd` is after `trial.startDate` AND `searchDateRangeStart` is before `trial.endDate`","required": false},"trialPUI": {"type": "string","description": "A permanent identifier for a trial. Could be DOI or other URI formatted identifier.","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'trials/{trialDbId}': MetaRow('trials/{trialDbId}', 'Core', 'Get the details of a specific Trial', '{}', '0.0', '0.0', 'get', 'False'),
+  'variables': MetaRow('variables', 'Phenotyping', 'Get a filtered list of ObservationVariable', '{"observationVariableDbId": {"type": "string","description": "The DbIds of Variables to search for","required": false},"observationVariableName": {"type": "string","description": "The names of Variables to search for","required": false},"observationVariablePUI": {"type": "string","description": "The Permanent Unique Identifier of an Observation Variable, usually in the form of a URI","required": false},"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"studyDbId": {"type": "string","description": "**Deprecated in v2.1** Please use `studyDbIds`. Github issue number #483 \\n<br>The unique ID of a studies to filter on","required": false},"studyName": {"type": "string","description": "List of study names to filter search results","required": false},"trialDbId": {"type": "string","description": "The ID which uniquely identifies a trial to search for","required": false},"trialName": {"type": "string","description": "The human readable name of a trial to search for","required": false},"ontologyDbId": {"type": "string","description": "List of ontology IDs to search for","required": false},"methodDbId": {"type": "string","description": "List of methods to filter search results","required": false},"methodName": {"type": "string","description": "Human readable name for the method\\n<br/>MIAPPE V1.1 (DM-88) Method  Name of the method of observation","required": false},"methodPUI": {"type": "string","description": "The Permanent Unique Identifier of a Method, usually in the form of a URI","required": false},"scaleDbId": {"type": "string","description": "The unique identifier for a Scale","required": false},"scaleName": {"type": "string","description": "Name of the scale\\n<br/>MIAPPE V1.1 (DM-92) Scale Name of the scale associated with the variable","required": false},"scalePUI": {"type": "string","description": "The Permanent Unique Identifier of a Scale, usually in the form of a URI","required": false},"dataType": {"type": "string","description": "List of scale data types to filter search results","required": false},"traitClass": {"type": "string","description": "List of trait classes to filter search results","required": false},"traitDbId": {"type": "string","description": "The unique identifier for a Trait","required": false},"traitName": {"type": "string","description": "The human readable name of a trait\\n<br/>MIAPPE V1.1 (DM-86) Trait - Name of the (plant or environmental) trait under observation","required": false},"traitPUI": {"type": "string","description": "The Permanent Unique Identifier of a Trait, usually in the form of a URI","required": false},"traitAttribute": {"type": "string","description": "A trait can be decomposed as \\"Trait\\" = \\"Entity\\" + \\"Attribute\\", the attribute is the observed feature (or characteristic) of the entity e.g., for \\"grain colour\\", attribute = \\"colour\\"","required": false},"traitAttributePUI": {"type": "string","description": "The Permanent Unique Identifier of a Trait Attribute, usually in the form of a URI\\n<br/>A trait can be decomposed as \\"Trait\\" = \\"Entity\\" + \\"Attribute\\", the attribute is the observed feature (or characteristic) of the entity e.g., for \\"grain colour\\", attribute = \\"colour\\"","required": false},"traitEntity": {"type": "string","description": "A trait can be decomposed as \\"Trait\\" = \\"Entity\\" + \\"Attribute\\", the entity is the part of the plant that the trait refers to e.g., for \\"grain colour\\", entity = \\"grain\\"","required": false},"traitEntityPUI": {"type": "string","description": "The Permanent Unique Identifier of a Trait Entity, usually in the form of a URI\\n<br/>A trait can be decomposed as \\"Trait\\" = \\"Entity\\" + \\"Attribute\\", the entity is the part of the plant that the trait refers to e.g., for \\"grain colour\\", entity = \\"grain\\" ","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'variables/{observationVariableDbId}': MetaRow('variables/{observationVariableDbId}', 'Phenotyping', 'Get the details of a specific ObservationVariable', '{}', '0.0', '0.0', 'get', 'False'),
+  'variants': MetaRow('variants', 'Genotyping', 'Get a filtered list of Variant', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"studyDbId": {"type": "string","description": "List of study identifiers to search for","required": false},"studyName": {"type": "string","description": "List of study names to filter search results","required": false},"trialDbId": {"type": "string","description": "The ID which uniquely identifies a trial to search for","required": false},"trialName": {"type": "string","description": "The human readable name of a trial to search for","required": false},"callSetDbId": {"type": "string","description": "**Deprecated in v2.1** Parameter unnecessary. Github issue number #474 \\n<br/>Only return variant calls which belong to call sets with these IDs. If unspecified, return all variants and no variant call objects.","required": false},"end": {"type": "integer","description": "The end of the window (0-based, exclusive) for which overlapping variants should be returned.","required": false},"referenceDbId": {"type": "string","description": "The unique identifier representing a genotype `Reference`","required": false},"referenceSetDbId": {"type": "string","description": "The unique identifier representing a genotype `ReferenceSet`","required": false},"start": {"type": "integer","description": "The beginning of the window (0-based, inclusive) for which overlapping variants should be returned. Genomic positions are non-negative integers less than reference length. Requests spanning the join of circular genomes are represented as two requests one on each side of the join (position 0).","required": false},"variantDbId": {"type": "string","description": "A list of IDs which uniquely identify `Variants`","required": false},"variantSetDbId": {"type": "string","description": "A list of IDs which uniquely identify `VariantSets`","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'variants/{variantDbId}': MetaRow('variants/{variantDbId}', 'Genotyping', 'Get the details of a specific Variant', '{}', '0.0', '0.0', 'get', 'False'),
+  'variants/{variantDbId}/calls': MetaRow('variants/{variantDbId}/calls', 'Genotyping', 'Get a filtered list of Call', '{"callSetDbId": {"type": "string","description": "A list of IDs which uniquely identify `CallSets` within the given database server","required": false},"variantDbId": {"type": "string","description": "A list of IDs which uniquely identify `Variant` within the given database server","required": false},"variantSetDbId": {"type": "string","description": "A list of IDs which uniquely identify `VariantSets` within the given database server","required": false},"expandHomozygote": {"type": "boolean","description": "Should homozygotes be expanded (true) or collapsed into a single occurrence (false)","required": false},"sepPhased": {"type": "string","description": "The string used as a separator for phased allele calls.","required": false},"sepUnphased": {"type": "string","description": "The string used as a separator for unphased allele calls.","required": false},"unknownString": {"type": "string","description": "The string used as a representation for missing data.","required": false}}', '0.0', '0.0', 'get', 'True'),
+  'variantsets': MetaRow('variantsets', 'Genotyping', 'Get a filtered list of VariantSet', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"studyDbId": {"type": "string","description": "List of study identifiers to search for","required": false},"studyName": {"type": "string","description": "List of study names to filter search results","required": false},"trialDbId": {"type": "string","description": "The ID which uniquely identifies a trial to search for","required": false},"trialName": {"type": "string","description": "The human readable name of a trial to search for","required": false},"callSetDbId": {"type": "string","description": "The unique identifier representing a CallSet","required": false},"variantDbId": {"type": "string","description": "The unique identifier representing a Variant","required": false},"variantSetDbId": {"type": "string","description": "The unique identifier representing a VariantSet","required": false},"referenceDbId": {"type": "string","description": "The unique identifier representing a genotype Reference","required": false},"referenceSetDbId": {"type": "string","description": "The unique identifier representing a genotype ReferenceSet","required": false}}', '0.0', '0.0', 'get', 'False'),
+  'variantsets/{variantSetDbId}': MetaRow('variantsets/{variantSetDbId}', 'Genotyping', 'Get the details of a specific VariantSet', '{}', '0.0', '0.0', 'get', 'False'),
+  'variantsets/{variantSetDbId}/calls': MetaRow('variantsets/{variantSetDbId}/calls', 'Genotyping', 'Get a filtered list of Call', '{"callSetDbId": {"type": "string","description": "A list of IDs which uniquely identify `CallSets` within the given database server","required": false},"variantDbId": {"type": "string","description": "A list of IDs which uniquely identify `Variant` within the given database server","required": false},"variantSetDbId": {"type": "string","description": "A list of IDs which uniquely identify `VariantSets` within the given database server","required": false},"expandHomozygote": {"type": "boolean","description": "Should homozygotes be expanded (true) or collapsed into a single occurrence (false)","required": false},"sepPhased": {"type": "string","description": "The string used as a separator for phased allele calls.","required": false},"sepUnphased": {"type": "string","description": "The string used as a separator for unphased allele calls.","required": false},"unknownString": {"type": "string","description": "The string used as a representation for missing data.","required": false}}', '0.0', '0.0', 'get', 'True'),
+  'variantsets/{variantSetDbId}/callsets': MetaRow('variantsets/{variantSetDbId}/callsets', 'Genotyping', 'Get a filtered list of CallSet', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"germplasmDbId": {"type": "string","description": "List of IDs which uniquely identify germplasm to search for","required": false},"germplasmName": {"type": "string","description": "List of human readable names to identify germplasm to search for","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"studyDbId": {"type": "string","description": "List of study identifiers to search for","required": false},"studyName": {"type": "string","description": "List of study names to filter search results","required": false},"trialDbId": {"type": "string","description": "The ID which uniquely identifies a trial to search for","required": false},"trialName": {"type": "string","description": "The human readable name of a trial to search for","required": false},"sampleDbId": {"type": "string","description": "A list of IDs which uniquely identify `Samples` within the given database server","required": false},"sampleName": {"type": "string","description": "A list of human readable names associated with `Samples`","required": false},"callSetDbId": {"type": "string","description": "A list of IDs which uniquely identify `CallSets` within the given database server","required": false},"callSetName": {"type": "string","description": "A list of human readable names associated with `CallSets`","required": false},"variantSetDbId": {"type": "string","description": "A list of IDs which uniquely identify `VariantSets` within the given database server","required": false}}', '0.0', '0.0', 'get', 'True'),
+  'variantsets/{variantSetDbId}/variants': MetaRow('variantsets/{variantSetDbId}/variants', 'Genotyping', 'Get a filtered list of Variant', '{"commonCropName": {"type": "string","description": "The BrAPI Common Crop Name is the simple, generalized, widely accepted name of the organism being researched. It is most often used in multi-crop systems where digital resources need to be divided at a high level. Things like \'Maize\', \'Wheat\', and \'Rice\' are examples of common crop names.\\n\\nUse this parameter to only return results associated with the given crops. \\n\\nUse `GET /commoncropnames` to find the list of available crops on a server.","required": false},"programDbId": {"type": "string","description": "A BrAPI Program represents the high level organization or group who is responsible for conducting trials and studies. Things like Breeding Programs and Funded Projects are considered BrAPI Programs. \\n\\nUse this parameter to only return results associated with the given programs. \\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"programName": {"type": "string","description": "Use this parameter to only return results associated with the given program names. Program names are not required to be unique.\\n\\nUse `GET /programs` to find the list of available programs on a server.","required": false},"studyDbId": {"type": "string","description": "List of study identifiers to search for","required": false},"studyName": {"type": "string","description": "List of study names to filter search results","required": false},"trialDbId": {"type": "string","description": "The ID which uniquely identifies a trial to search for","required": false},"trialName": {"type": "string","description": "The human readable name of a trial to search for","required": false},"callSetDbId": {"type": "string","description": "**Deprecated in v2.1** Parameter unnecessary. Github issue number #474 \\n<br/>Only return variant calls which belong to call sets with these IDs. If unspecified, return all variants and no variant call objects.","required": false},"end": {"type": "integer","description": "The end of the window (0-based, exclusive) for which overlapping variants should be returned.","required": false},"referenceDbId": {"type": "string","description": "The unique identifier representing a genotype `Reference`","required": false},"referenceSetDbId": {"type": "string","description": "The unique identifier representing a genotype `ReferenceSet`","required": false},"start": {"type": "integer","description": "The beginning of the window (0-based, inclusive) for which overlapping variants should be returned. Genomic positions are non-negative integers less than reference length. Requests spanning the join of circular genomes are represented as two requests one on each side of the join (position 0).","required": false},"variantDbId": {"type": "string","description": "A list of IDs which uniquely identify `Variants`","required": false},"variantSetDbId": {"type": "string","description": "A list of IDs which uniquely identify `VariantSets`","required": false}}', '0.0', '0.0', 'get', 'True'),
+  'search/lists/{searchResultsDbId}': MetaRow('search/lists/{searchResultsDbId}', 'Core', 'Submit a search request for Lists', '{"page": {"type": "integer","description": "Which result page is requested. The page indexing starts at 0 (the first page is \'page\'= 0). Default is `0`.","example": 0},"pageSize": {"type": "integer","description": "The size of the pages to be returned. Default is `1000`.","example": 1000},"externalReferenceIDs": {"type": "array","description": "List of external reference IDs. Could be a simple strings or a URIs. (use with `externalReferenceSources` parameter)","example": ["http://purl.obolibrary.org/obo/ro.owl","14a19841"],"items": {"type": "string"}},"externalReferenceSources": {"type": "array","description": "List of identifiers for the source system or database of an external reference (use with `externalReferenceIDs` parameter)","example": ["OBO Library","Field App Name"],"items": {"type": "string"}},"dateCreatedRangeEnd": {"type": "string","format": "date-time"},"dateCreatedRangeStart": {"type": "string","format": "date-time"},"dateModifiedRangeEnd": {"type": "string","format": "date-time"},"dateModifiedRangeStart": {"type": "string","format": "date-time"},"listDbIds": {"type": "array","example": ["55f20cf6","3193ca3d"],"items": {"type": "string"}},"listNames": {"type": "array","example": ["Planing List 1","Bobs List"],"items": {"type": "string"}},"listOwnerNames": {"type": "array","example": ["Bob Robertson","Rob Robertson"],"items": {"type": "string"}},"listOwnerPersonDbIds": {"type": "array","example": ["bob@bob.com","rob@bob.com"],"items": {"type": "string"}},"listSources": {"type": "array","example": ["USER","SYSTEM","EXTERNAL"],"items": {"type": "string"}},"listType": {"type": "string","example": "germplasm","enum": ["germplasm","markers","programs","trials","studies","observationUnits","observations","observationVariables","samples"]}}', '', '', 'search', 'False'),
+  'search/locations/{searchResultsDbId}': MetaRow('search/locations/{searchResultsDbId}', 'Core', 'Submit a search request for Locations', '{"page": {"type": "integer","description": "Which result page is requested. The page indexing starts at 0 (the first page is \'page\'= 0). Default is `0`.","example": 0},"pageSize": {"type": "integer","description": "The size of the pages to be returned. Default is `1000`.","example": 1000},"externalReferenceIDs": {"type": "array","description": "List of external reference IDs. Could be a simple strings or a URIs. (use with `externalReferenceSources` parameter)","example": ["http://purl.obolibrary.org/obo/ro.owl","14a19841"],"items": {"type": "string"}},"externalReferenceSources": {"type": "array","description": "List of identifiers for the source system or database of an external reference (use with `externalReferenceIDs` parameter)","example": ["OBO Library","Field App Name"],"items": {"type": "string"}},"locationDbIds": {"type": "array","description": "The location ids to search for","example": ["b28911cf","5071d1e4"],"items": {"type": "string"}},"locationNames": {"type": "array","description": "A human readable names to search for","example": ["Location Alpha","The Large Hadron Collider"],"items": {"type": "string"}},"abbreviations": {"type": "array","description": "An abbreviation which represents this location","example": ["L1","LHC"],"items": {"type": "string"}},"altitudeMax": {"type": "number","description": "The maximum altitude to search for","example": 200},"altitudeMin": {"type": "number","description": "The minimum altitude to search for","example": 20},"coordinates": {"type": "object","properties": {"geometry": {"title": "GeoJSON Geometry","type": "object","description": "A geometry as defined by GeoJSON (RFC 7946). In this context, only Point or Polygon geometry are allowed.","example": {"coordinates": [-76.506042,42.417373,123],"type": "Point"},"discriminator": {"propertyName": "type","mapping": {"Point": "#/components/schemas/pointGeometry","Polygon": "#/components/schemas/polygonGeometry"}},"oneOf": [{"type": "object","properties": {"coordinates": {"$ref": "#/components/schemas/position"},"type": {"type": "string","description": "The literal string \\"Point\\"","example": "Point","default": "Point"}},"description": "Copied from RFC 7946 Section 3.1.1\\n\\nA position is an array of numbers. There MUST be two or more elements. The first two elements are longitude and latitude, or\\neasting and northing, precisely in that order and using decimal numbers. Altitude or elevation MAY be included as an optional third element."},{"type": "object","properties": {"coordinates": {"$ref": "#/components/schemas/polygon"},"type": {"type": "string","description": "The literal string \\"Polygon\\"","example": "Polygon","default": "Polygon"}},"description": "An array of Linear Rings. Each Linear Ring is an array of Points. \\n\\nA Point is an array of numbers. There MUST be two or more elements. The first two elements are longitude and latitude, or\\neasting and northing, precisely in that order and using decimal numbers. Altitude or elevation MAY be included as an optional third element."}]},"type": {"type": "string","description": "The literal string \\"Feature\\"","example": "Feature","default": "Feature"}}},"countryCodes": {"type": "array","description": "[ISO_3166-1_alpha-3](https://en.wikipedia.org/wiki/ISO_3166-1_alpha-3) spec","example": ["USA","PER"],"items": {"type": "string"}},"countryNames": {"type": "array","description": "The full name of the country to search for","example": ["United States of America","Peru"],"items": {"type": "string"}},"instituteAddresses": {"type": "array","description": "The street address of the institute to search for","example": ["123 Main Street","456 Side Street"],"items": {"type": "string"}},"instituteNames": {"type": "array","description": "The name of the institute to search for","example": ["The Institute","The Other Institute"],"items": {"type": "string"}},"locationTypes": {"type": "array","description": "The type of location this represents (ex. Breeding Location, Storage Location, etc)","example": ["Nursery","Storage Location"],"items": {"type": "string"}}}', '', '', 'search', 'False'),
+  'search/people/{searchResultsDbId}': MetaRow('search/people/{searchResultsDbId}', 'Core', 'Submit a search request for People', '{"page": {"type": "integer","description": "Which result page is requested. The page indexing starts at 0 (the first page is \'page\'= 0). Default is `0`.","example": 0},"pageSize": {"type": "integer","description": "The size of the pages to be returned. Default is `1000`.","example": 1000},"externalReferenceIDs": {"type": "array","description": "List of external reference IDs. Could be a simple strings or a URIs. (use with `externalReferenceSources` parameter)","example": ["http://purl.obolibrary.org/obo/ro.owl","14a19841"],"items": {"type": "string"}},"externalReferenceSources": {"type": "array","description": "List of identifiers for the source system or database of an external reference (use with `externalReferenceIDs` parameter)","example": ["OBO Library","Field App Name"],"items": {"type": "string"}},"emailAddresses": {"type": "array","description": "email address for this person","example": ["bob@bob.com","rob@bob.com"],"items": {"type": "string"}},"firstNames": {"type": "array","description": "Persons first name","example": ["Bob","Rob"],"items": {"type": "string"}},"lastNames": {"type": "array","description": "Persons last name","example": ["Robertson","Smith"],"items": {"type": "string"}},"mailingAddresses": {"type": "array","description": "physical address of this person","example": ["123 Main Street","456 Side Street"],"items": {"type": "string"}},"middleNames": {"type": "array","description": "Persons middle name","example": ["Danger","Fight"],"items": {"type": "string"}},"personDbIds": {"type": "array","description": "Unique ID for this person","example": ["1e7731ab","bc28cff8"],"items": {"type": "string"}},"phoneNumbers": {"type": "array","description": "phone number of this person","example": ["9995555555","8884444444"],"items": {"type": "string"}},"userIDs": {"type": "array","description": "A systems user ID associated with this person. Different from personDbId because you could have a person who is not a user of the system.","example": ["bob","rob"],"items": {"type": "string"}}}', '', '', 'search', 'False'),
+  'search/programs/{searchResultsDbId}': MetaRow('search/programs/{searchResultsDbId}', 'Core', 'Submit a search request for Programs', '{"page": {"type": "integer","description": "Which result page is requested. The page indexing starts at 0 (the first page is \'page\'= 0). Default is `0`.","example": 0},"pageSize": {"type": "integer","description": "The size of the pages to be returned. Default is `1000`.","example": 1000},"commonCropNames": {"type": "array","description": "Common name for the crop which this program is for","example": ["Tomatillo","Paw Paw"],"items": {"type": "string"}},"programDbIds": {"type": "array","description": "A program identifier to search for","example": ["8f5de35b","0e2d4a13"],"items": {"type": "string"}},"programNames": {"type": "array","description": "A name of a program to search for","example": ["Better Breeding Program","Best Breeding Program"],"items": {"type": "string"}},"externalReferenceIDs": {"type": "array","description": "List of external reference IDs. Could be a simple strings or a URIs. (use with `externalReferenceSources` parameter)","example": ["http://purl.obolibrary.org/obo/ro.owl","14a19841"],"items": {"type": "string"}},"externalReferenceSources": {"type": "array","description": "List of identifiers for the source system or database of an external reference (use with `externalReferenceIDs` parameter)","example": ["OBO Library","Field App Name"],"items": {"type": "string"}},"abbreviations": {"type": "array","description": "An abbreviation of a program to search for","example": ["P1","P2"],"items": {"type": "string"}},"leadPersonDbIds": {"type": "array","description": "The person DbIds of the program leader to search for","example": ["d8bd96c7","a2b9c8e7"],"items": {"type": "string"}},"leadPersonNames": {"type": "array","description": "The names of the program leader to search for","example": ["Bob Robertson","Rob Robertson"],"items": {"type": "string"}},"objectives": {"type": "array","description": "A program objective to search for","example": ["Objective Code One","This is a longer objective search query"],"items": {"type": "string"}}}', '', '', 'search', 'False'),
+  'search/studies/{searchResultsDbId}': MetaRow('search/studies/{searchResultsDbId}', 'Core', 'Submit a search request for Studies', '{"page": {"type": "integer","description": "Which result page is requested. The page indexing starts at 0 (the first page is \'page\'= 0). Default is `0`.","example": 0},"pageSize": {"type": "integer","description": "The size of the pages to be returned. Default is `1000`.","example": 1000},"commonCropNames": {"type": "array","description": "Common name for the crop which this program is for","example": ["Tomatillo","Paw Paw"],"items": {"type": "string"}},"programDbIds": {"type": "array","description": "A program identifier to search for","example": ["8f5de35b","0e2d4a13"],"items": {"type": "string"}},"programNames": {"type": "array","description": "A name of a program to search for","example": ["Better Breeding Program","Best Breeding Program"],"items": {"type": "string"}},"trialDbIds": {"type": "array","description": "The ID which uniquely identifies a trial to search for","example": ["d2593dc2","9431a731"],"items": {"type": "string"}},"trialNames": {"type": "array","description": "The human readable name of a trial to search for","example": ["All Yield Trials 2016","Disease Resistance Study Comparison Group"],"items": {"type": "string"}},"studyDbIds": {"type": "array","description": "List of study identifiers to search for","example": ["cf6c4bd4","691e69d6"],"items": {"type": "string"}},"studyNames": {"type": "array","description": "List of study names to filter search results","example": ["The First Bob Study 2017","Wheat Yield Trial 246"],"items": {"type": "string"}},"locationDbIds": {"type": "array","description": "The location ids to search for","example": ["b28911cf","5071d1e4"],"items": {"type": "string"}},"locationNames": {"type": "array","description": "A human readable names to search for","example": ["Location Alpha","The Large Hadron Collider"],"items": {"type": "string"}},"germplasmDbIds": {"type": "array","description": "List of IDs which uniquely identify germplasm to search for","example": ["e9c6edd7","1b1df4a6"],"items": {"type": "string"}},"germplasmNames": {"type": "array","description": "List of human readable names to identify germplasm to search for","example": ["A0000003","A0000477"],"items": {"type": "string"}},"observationVariableDbIds": {"type": "array","description": "List of observation variable IDs to search for","example": ["819e508f","f540b703"],"items": {"type": "string"}},"observationVariableNames": {"type": "array","description": "The names of Variables to search for","example": ["Plant Height in meters","Wheat rust score 1-5"],"items": {"type": "string"}},"externalReferenceIDs": {"type": "array","description": "List of external reference IDs. Could be a simple strings or a URIs. (use with `externalReferenceSources` parameter)","example": ["http://purl.obolibrary.org/obo/ro.owl","14a19841"],"items": {"type": "string"}},"externalReferenceSources": {"type": "array","description": "List of identifiers for the source system or database of an external reference (use with `externalReferenceIDs` parameter)","example": ["OBO Library","Field App Name"],"items": {"type": "string"}},"active": {"type": "boolean","description": "Is this study currently active","example": true},"seasonDbIds": {"type": "array","description": "The ID which uniquely identifies a season","example": ["Harvest Two 2017","Summer 2018"],"items": {"type": "string"}},"sortBy": {"type": "string","description": "Name of one of the fields within the study object on which results can be sorted","enum": ["studyDbId","trialDbId","programDbId","locationDbId","seasonDbId","studyType","studyName","studyLocation","programName","germplasmDbId","observationVariableDbId"]},"sortOrder": {"type": "string","description": "Order results should be sorted. ex. \\"ASC\\" or \\"DESC\\"","enum": ["ASC","DESC"]},"studyCodes": {"type": "array","description": "A short human readable code for a study","example": ["Grape_Yield_Spring_2018","Walnut_Kenya"],"items": {"type": "string"}},"studyPUIs": {"type": "array","description": "Permanent unique identifier associated with study data. For example, a URI or DOI","example": ["doi:10.155454/12349537312","https://pui.per/d8dd35e1"],"items": {"type": "string"}},"studyTypes": {"type": "array","description": "The type of study being performed. ex. \\"Yield Trial\\", etc","example": ["Yield Trial","Disease Resistance Trial"],"items": {"type": "string"}}}', '', '', 'search', 'False'),
+  'search/trials/{searchResultsDbId}': MetaRow('search/trials/{searchResultsDbId}', 'Core', 'Submit a search request for Trials', '{"page": {"type": "integer","description": "Which result page is requested. The page indexing starts at 0 (the first page is \'page\'= 0). Default is `0`.","example": 0},"pageSize": {"type": "integer","description": "The size of the pages to be returned. Default is `1000`.","example": 1000},"commonCropNames": {"type": "array","description": "Common name for the crop which this program is for","example": ["Tomatillo","Paw Paw"],"items": {"type": "string"}},"programDbIds": {"type": "array","description": "A program identifier to search for","example": ["8f5de35b","0e2d4a13"],"items": {"type": "string"}},"programNames": {"type": "array","description": "A name of a program to search for","example": ["Better Breeding Program","Best Breeding Program"],"items": {"type": "string"}},"trialDbIds": {"type": "array","description": "The ID which uniquely identifies a trial to search for","example": ["d2593dc2","9431a731"],"items": {"type": "string"}},"trialNames": {"type": "array","description": "The human readable name of a trial to search for","example": ["All Yield Trials 2016","Disease Resistance Study Comparison Group"],"items": {"type": "string"}},"studyDbIds": {"type": "array","description": "List of study identifiers to search for","example": ["cf6c4bd4","691e69d6"],"items": {"type": "string"}},"studyNames": {"type": "array","description": "List of study names to filter search results","example": ["The First Bob Study 2017","Wheat Yield Trial 246"],"items": {"type": "string"}},"locationDbIds": {"type": "array","description": "The location ids to search for","example": ["b28911cf","5071d1e4"],"items": {"type": "string"}},"locationNames": {"type": "array","description": "A human readable names to search for","example": ["Location Alpha","The Large Hadron Collider"],"items": {"type": "string"}},"externalReferenceIDs": {"type": "array","description": "List of external reference IDs. Could be a simple strings or a URIs. (use with `externalReferenceSources` parameter)","example": ["http://purl.obolibrary.org/obo/ro.owl","14a19841"],"items": {"type": "string"}},"externalReferenceSources": {"type": "array","description": "List of identifiers for the source system or database of an external reference (use with `externalReferenceIDs` parameter)","example": ["OBO Library","Field App Name"],"items": {"type": "string"}},"active": {"type": "boolean","description": "Is this trail currently active","example": true},"contactDbIds": {"type": "array","description": "List of contact entities associated with this trial","example": ["e0f70c2a","b82f0967"],"items": {"type": "string"}},"searchDateRangeEnd": {"type": "string","description": "The end of the overlapping search date range. `searchDateRangeStart` must be before `searchDateRangeEnd`.\\n\\nReturn a Trial entity if any of the following cases are true\\n\\n- `searchDateRangeStart` is before `trial.endDate` AND `searchDateRangeEnd` is null \\n\\n- `searchDateRangeStart` is before `trial.endDate` AND `searchDateRangeEnd` is after `trial.startDate`\\n\\n- `searchDateRangeEnd` is after `trial.startDate` AND `searchDateRangeStart` is null\\n\\n- `searchDateRangeEnd` is after `trial.startDate` AND `searchDateRangeStart` is before `trial.endDate`","format": "date"},"searchDateRangeStart": {"type": "string","description": "The start of the overlapping search date range. `searchDateRangeStart` must be before `searchDateRangeEnd`.\\n\\nReturn a Trial entity if any of the following cases are true\\n\\n- `searchDateRangeStart` is before `trial.endDate` AND `searchDateRangeEnd` is null \\n\\n- `searchDateRangeStart` is before `trial.endDate` AND `searchDateRangeEnd` is after `trial.startDate`\\n\\n- `searchDateRangeEnd` is after `trial.startDate` AND `searchDateRangeStart` is null\\n\\n- `searchDateRangeEnd` is after `trial.startDate` AND `searchDateRangeStart` is before `trial.endDate`","format": "date"},"trialPUIs": {"type": "array","description": "A permanent identifier for a trial. Could be DOI or other URI formatted identifier.","example": ["https://doi.org/01093190","https://doi.org/11192409"],"items": {"type": "string"}}}', '', '', 'search', 'False'),
+  'search/attributes/{searchResultsDbId}': MetaRow('search/attributes/{searchResultsDbId}', 'Genotyping', 'Submit a search request for Germplasm Attributes', '{"page": {"type": "integer","description": "Which result page is requested. The page indexing starts at 0 (the first page is \'page\'= 0). Default is `0`.","example": 0},"pageSize": {"type": "integer","description": "The size of the pages to be returned. Default is `1000`.","example": 1000},"externalReferenceIDs": {"type": "array","description": "List of external reference IDs. Could be a simple strings or a URIs. (use with `externalReferenceSources` parameter)","example": ["http://purl.obolibrary.org/obo/ro.owl","14a19841"],"items": {"type": "string"}},"externalReferenceSources": {"type": "array","description": "List of identifiers for the source system or database of an external reference (use with `externalReferenceIDs` parameter)","example": ["OBO Library","Field App Name"],"items": {"type": "string"}},"attributeDbIds": {"type": "array","description": "List of Germplasm Attribute IDs to search for","example": ["2ef15c9f","318e7f7d"],"items": {"type": "string"}},"attributeNames": {"type": "array","description": "List of human readable Germplasm Attribute names to search for","example": ["Plant Height 1","Root Color"],"items": {"type": "string"}},"dataTypes": {"type": "array","description": "List of scale data types to filter search results","example": ["Numerical","Ordinal","Text"],"items": {"type": "string","description": "<p>Class of the scale, entries can be</p>\\n<p>\\"Code\\" -  This scale class is exceptionally used to express complex traits. Code is a nominal scale that combines the expressions of the different traits composing the complex trait. For example a severity trait might be expressed by a 2 digit and 2 character code. The first 2 digits are the percentage of the plant covered by a fungus and the 2 characters refer to the delay in development, e.g. \\"75VD\\" means \\"75 %\\" of the plant is infected and the plant is very delayed.</p>\\n<p>\\"Date\\" - The date class is for events expressed in a time format, See ISO 8601</p>\\n<p>\\"Duration\\" - The Duration class is for time elapsed between two events expressed in a time format, e.g. days, hours, months</p>\\n<p>\\"Nominal\\" - Categorical scale that can take one of a limited and fixed number of categories. There is no intrinsic ordering to the categories</p>\\n<p>\\"Numerical\\" - Numerical scales express the trait with real numbers. The numerical scale defines the unit e.g. centimeter, ton per hectare, branches</p>\\n<p>\\"Ordinal\\" - Ordinal scales are scales composed of ordered categories</p>\\n<p>\\"Text\\" - A free text is used to express the trait.</p>","example": "Numerical","enum": ["Code","Date","Duration","Nominal","Numerical","Ordinal","Text"]}},"methodDbIds": {"type": "array","description": "List of methods to filter search results","example": ["07e34f83","d3d5517a"],"items": {"type": "string"}},"ontologyDbIds": {"type": "array","description": "List of ontology IDs to search for","example": ["f44f7b23","a26b576e"],"items": {"type": "string"}},"scaleDbIds": {"type": "array","description": "List of scales to filter search results","example": ["a13ecffa","7e1afe4f"],"items": {"type": "string"}},"studyDbId": {"type": "array","description": "The unique ID of a studies to filter on","example": ["5bcac0ae","7f48e22d"],"items": {"type": "string"}},"traitClasses": {"type": "array","description": "List of trait classes to filter search results","example": ["morphological","phenological","agronomical"],"items": {"type": "string"}},"traitDbIds": {"type": "array","description": "List of trait unique ID to filter search results","example": ["ef81147b","78d82fad"],"items": {"type": "string"}}}', '', '', 'search', 'False'),
+  'search/attributevalues/{searchResultsDbId}': MetaRow('search/attributevalues/{searchResultsDbId}', 'Genotyping', 'Submit a search request for Germplasm Attribute Values', '{"page": {"type": "integer","description": "Which result page is requested. The page indexing starts at 0 (the first page is \'page\'= 0). Default is `0`.","example": 0},"pageSize": {"type": "integer","description": "The size of the pages to be returned. Default is `1000`.","example": 1000},"germplasmDbIds": {"type": "array","description": "List of IDs which uniquely identify germplasm to search for","example": ["e9c6edd7","1b1df4a6"],"items": {"type": "string"}},"germplasmNames": {"type": "array","description": "List of human readable names to identify germplasm to search for","example": ["A0000003","A0000477"],"items": {"type": "string"}},"externalReferenceIDs": {"type": "array","description": "List of external reference IDs. Could be a simple strings or a URIs. (use with `externalReferenceSources` parameter)","example": ["http://purl.obolibrary.org/obo/ro.owl","14a19841"],"items": {"type": "string"}},"externalReferenceSources": {"type": "array","description": "List of identifiers for the source system or database of an external reference (use with `externalReferenceIDs` parameter)","example": ["OBO Library","Field App Name"],"items": {"type": "string"}},"attributeDbIds": {"type": "array","description": "List of Germplasm Attribute IDs to search for","example": ["2ef15c9f","318e7f7d"],"items": {"type": "string"}},"attributeNames": {"type": "array","description": "List of human readable Germplasm Attribute names to search for","example": ["Plant Height 1","Root Color"],"items": {"type": "string"}},"attributeValueDbIds": {"type": "array","description": "List of Germplasm Attribute Value IDs to search for","example": ["ca4636d0","c8a92409"],"items": {"type": "string"}},"dataTypes": {"type": "array","description": "List of scale data types to filter search results","example": ["Numerical","Ordinal","Text"],"items": {"type": "string","description": "<p>Class of the scale, entries can be</p>\\n<p>\\"Code\\" -  This scale class is exceptionally used to express complex traits. Code is a nominal scale that combines the expressions of the different traits composing the complex trait. For example a severity trait might be expressed by a 2 digit and 2 character code. The first 2 digits are the percentage of the plant covered by a fungus and the 2 characters refer to the delay in development, e.g. \\"75VD\\" means \\"75 %\\" of the plant is infected and the plant is very delayed.</p>\\n<p>\\"Date\\" - The date class is for events expressed in a time format, See ISO 8601</p>\\n<p>\\"Duration\\" - The Duration class is for time elapsed between two events expressed in a time format, e.g. days, hours, months</p>\\n<p>\\"Nominal\\" - Categorical scale that can take one of a limited and fixed number of categories. There is no intrinsic ordering to the categories</p>\\n<p>\\"Numerical\\" - Numerical scales express the trait with real numbers. The numerical scale defines the unit e.g. centimeter, ton per hectare, branches</p>\\n<p>\\"Ordinal\\" - Ordinal scales are scales composed of ordered categories</p>\\n<p>\\"Text\\" - A free text is used to express the trait.</p>","example": "Numerical","enum": ["Code","Date","Duration","Nominal","Numerical","Ordinal","Text"]}},"methodDbIds": {"type": "array","description": "List of methods to filter search results","example": ["07e34f83","d3d5517a"],"items": {"type": "string"}},"ontologyDbIds": {"type": "array","description": "List of ontology IDs to search for","example": ["f44f7b23","a26b576e"],"items": {"type": "string"}},"scaleDbIds": {"type": "array","description": "List of scales to filter search results","example": ["a13ecffa","7e1afe4f"],"items": {"type": "string"}},"traitClasses": {"type": "array","description": "List of trait classes to filter search results","example": ["morphological","phenological","agronomical"],"items": {"type": "string"}},"traitDbIds": {"type": "array","description": "List of trait unique ID to filter search results","example": ["ef81147b","78d82fad"],"items": {"type": "string"}}}', '', '', 'search', 'False'),
+  'search/germplasm/{searchResultsDbId}': MetaRow('search/germplasm/{searchResultsDbId}', 'Genotyping', 'Submit a search request for Germplasm', '{"page": {"type": "integer","description": "Which result page is requested. The page indexing starts at 0 (the first page is \'page\'= 0). Default is `0`.","example": 0},"pageSize": {"type": "integer","description": "The size of the pages to be returned. Default is `1000`.","example": 1000},"commonCropNames": {"type": "array","description": "Common name for the crop which this program is for","example": ["Tomatillo","Paw Paw"],"items": {"type": "string"}},"germplasmDbIds": {"type": "array","description": "List of IDs which uniquely identify germplasm to search for","example": ["e9c6edd7","1b1df4a6"],"items": {"type": "string"}},"germplasmNames": {"type": "array","description": "List of human readable names to identify germplasm to search for","example": ["A0000003","A0000477"],"items": {"type": "string"}},"studyDbIds": {"type": "array","description": "List of study identifiers to search for","example": ["cf6c4bd4","691e69d6"],"items": {"type": "string"}},"studyNames": {"type": "array","description": "List of study names to filter search results","example": ["The First Bob Study 2017","Wheat Yield Trial 246"],"items": {"type": "string"}},"externalReferenceIDs": {"type": "array","description": "List of external reference IDs. Could be a simple strings or a URIs. (use with `externalReferenceSources` parameter)","example": ["http://purl.obolibrary.org/obo/ro.owl","14a19841"],"items": {"type": "string"}},"externalReferenceSources": {"type": "array","description": "List of identifiers for the source system or database of an external reference (use with `externalReferenceIDs` parameter)","example": ["OBO Library","Field App Name"],"items": {"type": "string"}},"accessionNumbers": {"type": "array","description": "List unique identifiers for accessions within a genebank","example": ["A0000003","A0000477"],"items": {"type": "string"}},"collections": {"type": "array","description": "A specific panel/collection/population name this germplasm belongs to.","example": ["RDP1","MDP1"],"items": {"type": "string"}},"genus": {"type": "array","description": "List of Genus names to identify germplasm","example": ["Aspergillus","Zea"],"items": {"type": "string"}},"germplasmPUIs": {"type": "array","description": "List of Permanent Unique Identifiers to identify germplasm","example": ["http://pui.per/accession/A0000003","http://pui.per/accession/A0000477"],"items": {"type": "string"}},"parentDbIds": {"type": "array","description": "Search for Germplasm with these parents","example": ["72c1001f","7346c553"],"items": {"type": "string"}},"progenyDbIds": {"type": "array","description": "Search for Germplasm with these children","example": ["16e16a7e","ce06cf9e"],"items": {"type": "string"}},"species": {"type": "array","description": "List of Species names to identify germplasm","example": ["fructus","mays"],"items": {"type": "string"}},"synonyms": {"type": "array","description": "List of alternative names or IDs used to reference this germplasm","example": ["variety_1","2c38f9b6"],"items": {"type": "string"}}}', '', '', 'search', 'False'),
+  'search/images/{searchResultsDbId}': MetaRow('search/images/{searchResultsDbId}', 'Phenotyping', 'Submit a search request for Images', '{"page": {"type": "integer","description": "Which result page is requested. The page indexing starts at 0 (the first page is \'page\'= 0). Default is `0`.","example": 0},"pageSize": {"type": "integer","description": "The size of the pages to be returned. Default is `1000`.","example": 1000},"externalReferenceIDs": {"type": "array","description": "List of external reference IDs. Could be a simple strings or a URIs. (use with `externalReferenceSources` parameter)","example": ["http://purl.obolibrary.org/obo/ro.owl","14a19841"],"items": {"type": "string"}},"externalReferenceSources": {"type": "array","description": "List of identifiers for the source system or database of an external reference (use with `externalReferenceIDs` parameter)","example": ["OBO Library","Field App Name"],"items": {"type": "string"}},"descriptiveOntologyTerms": {"type": "array","description": "A list of terms to formally describe the image to search for. Each item could be a simple Tag, an Ontology reference Id, or a full ontology URL.","example": ["doi:10.1002/0470841559","Red","ncbi:0300294"],"items": {"type": "string"}},"imageDbIds": {"type": "array","description": "A list of image Ids to search for","example": ["564b64a6","0d122d1d"],"items": {"type": "string"}},"imageFileNames": {"type": "array","description": "Image file names to search for.","example": ["image_01032019.jpg","picture_field_1234.jpg"],"items": {"type": "string"}},"imageFileSizeMax": {"type": "integer","description": "A maximum image file size to search for.","example": 20000000},"imageFileSizeMin": {"type": "integer","description": "A minimum image file size to search for.","example": 1000},"imageHeightMax": {"type": "integer","description": "A maximum image height to search for.","example": 1080},"imageHeightMin": {"type": "integer","description": "A minimum image height to search for.","example": 720},"imageLocation": {"type": "object","properties": {"geometry": {"title": "GeoJSON Geometry","type": "object","description": "A geometry as defined by GeoJSON (RFC 7946). In this context, only Point or Polygon geometry are allowed.","example": {"coordinates": [-76.506042,42.417373,123],"type": "Point"},"discriminator": {"propertyName": "type","mapping": {"Point": "#/components/schemas/pointGeometry","Polygon": "#/components/schemas/polygonGeometry"}},"oneOf": [{"type": "object","properties": {"coordinates": {"$ref": "#/components/schemas/position"},"type": {"type": "string","description": "The literal string \\"Point\\"","example": "Point","default": "Point"}},"description": "Copied from RFC 7946 Section 3.1.1\\n\\nA position is an array of numbers. There MUST be two or more elements. The first two elements are longitude and latitude, or\\neasting and northing, precisely in that order and using decimal numbers. Altitude or elevation MAY be included as an optional third element."},{"type": "object","properties": {"coordinates": {"$ref": "#/components/schemas/polygon"},"type": {"type": "string","description": "The literal string \\"Polygon\\"","example": "Polygon","default": "Polygon"}},"description": "An array of Linear Rings. Each Linear Ring is an array of Points. \\n\\nA Point is an array of numbers. There MUST be two or more elements. The first two elements are longitude and latitude, or\\neasting and northing, precisely in that order and using decimal numbers. Altitude or elevation MAY be included as an optional third element."}]},"type": {"type": "string","description": "The literal string \\"Feature\\"","example": "Feature","default": "Feature"}}},"imageNames": {"type": "array","description": "Human readable names to search for.","example": ["Image 43","Tractor in field"],"items": {"type": "string"}},"imageTimeStampRangeEnd": {"type": "string","description": "The latest timestamp to search for.","format": "date-time"},"imageTimeStampRangeStart": {"type": "string","description": "The earliest timestamp to search for.","format": "date-time"},"imageWidthMax": {"type": "integer","description": "A maximum image width to search for.","example": 1920},"imageWidthMin": {"type": "integer","description": "A minimum image width to search for.","example": 1280},"mimeTypes": {"type": "array","description": "A set of image file types to search for.","example": ["image/jpg","image/jpeg","image/gif"],"items": {"pattern": "image/.*","type": "string"}},"observationDbIds": {"type": "array","description": "A list of observation Ids this image is associated with to search for","example": ["47326456","fc9823ac"],"items": {"type": "string"}},"observationUnitDbIds": {"type": "array","description": "A set of observation unit identifiers to search for.","example": ["f5e4b273","328c9424"],"items": {"type": "string"}}}', '', '', 'image', 'False'),
+  'search/observations/{searchResultsDbId}': MetaRow('search/observations/{searchResultsDbId}', 'Phenotyping', 'Submit a search request for a set of Observations', '{"page": {"type": "integer","description": "Which result page is requested. The page indexing starts at 0 (the first page is \'page\'= 0). Default is `0`.","example": 0},"pageSize": {"type": "integer","description": "The size of the pages to be returned. Default is `1000`.","example": 1000},"programDbIds": {"type": "array","description": "A program identifier to search for","example": ["8f5de35b","0e2d4a13"],"items": {"type": "string"}},"programNames": {"type": "array","description": "A name of a program to search for","example": ["Better Breeding Program","Best Breeding Program"],"items": {"type": "string"}},"trialDbIds": {"type": "array","description": "The ID which uniquely identifies a trial to search for","example": ["d2593dc2","9431a731"],"items": {"type": "string"}},"trialNames": {"type": "array","description": "The human readable name of a trial to search for","example": ["All Yield Trials 2016","Disease Resistance Study Comparison Group"],"items": {"type": "string"}},"studyDbIds": {"type": "array","description": "List of study identifiers to search for","example": ["cf6c4bd4","691e69d6"],"items": {"type": "string"}},"studyNames": {"type": "array","description": "List of study names to filter search results","example": ["The First Bob Study 2017","Wheat Yield Trial 246"],"items": {"type": "string"}},"germplasmDbIds": {"type": "array","description": "List of IDs which uniquely identify germplasm to search for","example": ["e9c6edd7","1b1df4a6"],"items": {"type": "string"}},"germplasmNames": {"type": "array","description": "List of human readable names to identify germplasm to search for","example": ["A0000003","A0000477"],"items": {"type": "string"}},"locationDbIds": {"type": "array","description": "The location ids to search for","example": ["b28911cf","5071d1e4"],"items": {"type": "string"}},"locationNames": {"type": "array","description": "A human readable names to search for","example": ["Location Alpha","The Large Hadron Collider"],"items": {"type": "string"}},"observationVariableDbIds": {"type": "array","description": "The DbIds of Variables to search for","example": ["a646187d","6d23513b"],"items": {"type": "string"}},"observationVariableNames": {"type": "array","description": "The names of Variables to search for","example": ["Plant Height in meters","Wheat rust score 1-5"],"items": {"type": "string"}},"externalReferenceIDs": {"type": "array","description": "List of external reference IDs. Could be a simple strings or a URIs. (use with `externalReferenceSources` parameter)","example": ["http://purl.obolibrary.org/obo/ro.owl","14a19841"],"items": {"type": "string"}},"externalReferenceSources": {"type": "array","description": "List of identifiers for the source system or database of an external reference (use with `externalReferenceIDs` parameter)","example": ["OBO Library","Field App Name"],"items": {"type": "string"}},"observationDbIds": {"type": "array","description": "The unique id of an Observation","example": ["6a4a59d8","3ff067e0"],"items": {"type": "string"}},"observationLevelRelationships": {"type": "array","description": "Searches for values in ObservationUnit->observationUnitPosition->observationLevelRelationships","example": [{"levelCode": "Field_1","levelName": "field"}],"items": {"type": "object","properties": {"levelName": {"type": "string","description": "A name for this level","example": "plot","enum": ["study","field","entry","rep","block","sub-block","plot","sub-plot","plant","pot","sample"]},"levelOrder": {"type": "integer","description": "`levelOrder` defines where that level exists in the hierarchy of levels. `levelOrder`\'s lower numbers are at the top of the hierarchy (ie field -> 1) and higher numbers are at the bottom of the hierarchy (ie plant -> 9).","example": 2},"levelCode": {"type": "string","description": "An ID code for this level tag. Identify this observation unit by each level of the hierarchy where it exists","example": "Plot_123"}}}},"observationLevels": {"type": "array","description": "Searches for values in ObservationUnit->observationUnitPosition->observationLevel","example": [{"levelCode": "Plot_123","levelName": "plot"},{"levelCode": "Plot_456","levelName": "plot"},{"levelCode": "Plot_789","levelName": "plot"}],"items": {"type": "object","properties": {"levelName": {"type": "string","description": "A name for this level","example": "plot","enum": ["study","field","entry","rep","block","sub-block","plot","sub-plot","plant","pot","sample"]},"levelOrder": {"type": "integer","description": "`levelOrder` defines where that level exists in the hierarchy of levels. `levelOrder`\'s lower numbers are at the top of the hierarchy (ie field -> 1) and higher numbers are at the bottom of the hierarchy (ie plant -> 9).","example": 2},"levelCode": {"type": "string","description": "An ID code for this level tag. Identify this observation unit by each level of the hierarchy where it exists","example": "Plot_123"}}}},"observationTimeStampRangeEnd": {"type": "string","description": "Timestamp range end","format": "date-time"},"observationTimeStampRangeStart": {"type": "string","description": "Timestamp range start","format": "date-time"},"observationUnitDbIds": {"type": "array","description": "The unique id of an Observation Unit","example": ["76f559b5","066bc5d3"],"items": {"type": "string"}},"seasonDbIds": {"type": "array","description": "The year or Phenotyping campaign of a multi-annual study (trees, grape, ...)","example": ["Spring 2018","Season A"],"items": {"type": "string"}}}', '', '', 'search', 'False'),
+  'search/observationunits/{searchResultsDbId}': MetaRow('search/observationunits/{searchResultsDbId}', 'Phenotyping', 'Submit a search request for Observation Units', '{"page": {"type": "integer","description": "Which result page is requested. The page indexing starts at 0 (the first page is \'page\'= 0). Default is `0`.","example": 0},"pageSize": {"type": "integer","description": "The size of the pages to be returned. Default is `1000`.","example": 1000},"programDbIds": {"type": "array","description": "A program identifier to search for","example": ["8f5de35b","0e2d4a13"],"items": {"type": "string"}},"programNames": {"type": "array","description": "A name of a program to search for","example": ["Better Breeding Program","Best Breeding Program"],"items": {"type": "string"}},"trialDbIds": {"type": "array","description": "The ID which uniquely identifies a trial to search for","example": ["d2593dc2","9431a731"],"items": {"type": "string"}},"trialNames": {"type": "array","description": "The human readable name of a trial to search for","example": ["All Yield Trials 2016","Disease Resistance Study Comparison Group"],"items": {"type": "string"}},"studyDbIds": {"type": "array","description": "List of study identifiers to search for","example": ["cf6c4bd4","691e69d6"],"items": {"type": "string"}},"studyNames": {"type": "array","description": "List of study names to filter search results","example": ["The First Bob Study 2017","Wheat Yield Trial 246"],"items": {"type": "string"}},"locationDbIds": {"type": "array","description": "The location ids to search for","example": ["b28911cf","5071d1e4"],"items": {"type": "string"}},"locationNames": {"type": "array","description": "A human readable names to search for","example": ["Location Alpha","The Large Hadron Collider"],"items": {"type": "string"}},"germplasmDbIds": {"type": "array","description": "List of IDs which uniquely identify germplasm to search for","example": ["e9c6edd7","1b1df4a6"],"items": {"type": "string"}},"germplasmNames": {"type": "array","description": "List of human readable names to identify germplasm to search for","example": ["A0000003","A0000477"],"items": {"type": "string"}},"observationVariableDbIds": {"type": "array","description": "The DbIds of Variables to search for","example": ["a646187d","6d23513b"],"items": {"type": "string"}},"observationVariableNames": {"type": "array","description": "The names of Variables to search for","example": ["Plant Height in meters","Wheat rust score 1-5"],"items": {"type": "string"}},"externalReferenceIDs": {"type": "array","description": "List of external reference IDs. Could be a simple strings or a URIs. (use with `externalReferenceSources` parameter)","example": ["http://purl.obolibrary.org/obo/ro.owl","14a19841"],"items": {"type": "string"}},"externalReferenceSources": {"type": "array","description": "List of identifiers for the source system or database of an external reference (use with `externalReferenceIDs` parameter)","example": ["OBO Library","Field App Name"],"items": {"type": "string"}},"includeObservations": {"type": "boolean","description": "Use this parameter to include a list of observations embedded in each ObservationUnit object. \\n\\nCAUTION - Use this parameter at your own risk. It may return large, unpaginated lists of observation data. Only set this value to True if you are sure you need to.","example": false},"observationLevelRelationships": {"type": "array","description": "Searches for values in ObservationUnit->observationUnitPosition->observationLevelRelationships","example": [{"levelCode": "Field_1","levelName": "field"}],"items": {"type": "object","properties": {"levelName": {"type": "string","description": "A name for this level","example": "plot","enum": ["study","field","entry","rep","block","sub-block","plot","sub-plot","plant","pot","sample"]},"levelOrder": {"type": "integer","description": "`levelOrder` defines where that level exists in the hierarchy of levels. `levelOrder`\'s lower numbers are at the top of the hierarchy (ie field -> 1) and higher numbers are at the bottom of the hierarchy (ie plant -> 9).","example": 2},"levelCode": {"type": "string","description": "An ID code for this level tag. Identify this observation unit by each level of the hierarchy where it exists","example": "Plot_123"}}}},"observationLevels": {"type": "array","description": "Searches for values in ObservationUnit->observationUnitPosition->observationLevel","example": [{"levelCode": "Plot_123","levelName": "plot"},{"levelCode": "Plot_456","levelName": "plot"},{"levelCode": "Plot_789","levelName": "plot"}],"items": {"type": "object","properties": {"levelName": {"type": "string","description": "A name for this level","example": "plot","enum": ["study","field","entry","rep","block","sub-block","plot","sub-plot","plant","pot","sample"]},"levelOrder": {"type": "integer","description": "`levelOrder` defines where that level exists in the hierarchy of levels. `levelOrder`\'s lower numbers are at the top of the hierarchy (ie field -> 1) and higher numbers are at the bottom of the hierarchy (ie plant -> 9).","example": 2},"levelCode": {"type": "string","description": "An ID code for this level tag. Identify this observation unit by each level of the hierarchy where it exists","example": "Plot_123"}}}},"observationUnitDbIds": {"type": "array","description": "The unique id of an observation unit","example": ["66bab7e3","0e5e7f99"],"items": {"type": "string"}}}', '', '', 'search', 'False'),
+  'search/variables': MetaRow('search/variables', 'Phenotyping', 'Submit a search request for Observation Variables', '{"page": {"type": "integer","description": "Which result page is requested. The page indexing starts at 0 (the first page is \'page\'= 0). Default is `0`.","example": 0},"pageSize": {"type": "integer","description": "The size of the pages to be returned. Default is `1000`.","example": 1000},"externalReferenceIDs": {"type": "array","description": "List of external reference IDs. Could be a simple strings or a URIs. (use with `externalReferenceSources` parameter)","example": ["http://purl.obolibrary.org/obo/ro.owl","14a19841"],"items": {"type": "string"}},"externalReferenceSources": {"type": "array","description": "List of identifiers for the source system or database of an external reference (use with `externalReferenceIDs` parameter)","example": ["OBO Library","Field App Name"],"items": {"type": "string"}},"dataTypes": {"type": "array","description": "List of scale data types to filter search results","example": ["Numerical","Ordinal","Text"],"items": {"type": "string","description": "<p>Class of the scale, entries can be</p>\\n<p>\\"Code\\" -  This scale class is exceptionally used to express complex traits. Code is a nominal scale that combines the expressions of the different traits composing the complex trait. For example a severity trait might be expressed by a 2 digit and 2 character code. The first 2 digits are the percentage of the plant covered by a fungus and the 2 characters refer to the delay in development, e.g. \\"75VD\\" means \\"75 %\\" of the plant is infected and the plant is very delayed.</p>\\n<p>\\"Date\\" - The date class is for events expressed in a time format, See ISO 8601</p>\\n<p>\\"Duration\\" - The Duration class is for time elapsed between two events expressed in a time format, e.g. days, hours, months</p>\\n<p>\\"Nominal\\" - Categorical scale that can take one of a limited and fixed number of categories. There is no intrinsic ordering to the categories</p>\\n<p>\\"Numerical\\" - Numerical scales express the trait with real numbers. The numerical scale defines the unit e.g. centimeter, ton per hectare, branches</p>\\n<p>\\"Ordinal\\" - Ordinal scales are scales composed of ordered categories</p>\\n<p>\\"Text\\" - A free text is used to express the trait.</p>","example": "Numerical","enum": ["Code","Date","Duration","Nominal","Numerical","Ordinal","Text"]}},"methodDbIds": {"type": "array","description": "List of methods to filter search results","example": ["07e34f83","d3d5517a"],"items": {"type": "string"}},"observationVariableDbIds": {"type": "array","description": "List of observation variable IDs to search for","example": ["2ef15c9f","318e7f7d"],"items": {"type": "string"}},"observationVariableNames": {"type": "array","description": "List of human readable observation variable names to search for","example": ["Plant Height 1","Root Color"],"items": {"type": "string"}},"ontologyDbIds": {"type": "array","description": "List of ontology IDs to search for","example": ["f44f7b23","a26b576e"],"items": {"type": "string"}},"scaleDbIds": {"type": "array","description": "List of scales to filter search results","example": ["a13ecffa","7e1afe4f"],"items": {"type": "string"}},"studyDbId": {"type": "array","description": "The unique ID of a studies to filter on","example": ["5bcac0ae","7f48e22d"],"items": {"type": "string"}},"traitClasses": {"type": "array","description": "List of trait classes to filter search results","example": ["morphological","phenological","agronomical"],"items": {"type": "string"}},"traitDbIds": {"type": "array","description": "List of trait unique ID to filter search results","example": ["ef81147b","78d82fad"],"items": {"type": "string"}}}', '', '', 'search', 'False'),
+  'search/calls/{searchResultsDbId}': MetaRow('search/calls/{searchResultsDbId}', 'Genotyping', 'Submit a search request for `Calls`', '{"pageSize": {"type": "integer","description": "The size of the pages to be returned. Default is `1000`.","example": 1000},"pageToken": {"type": "string","description": "Used to request a specific page of data to be returned.\\n\\nTokenized pages are for large data sets which can not be efficiently broken into indexed pages. Use the nextPageToken and prevPageToken from a prior response to construct a query and move to the next or previous page respectively. ","example": "33c27874"},"callSetDbIds": {"type": "array","description": "The CallSet to search.","example": ["a03202ec","274e4f63"],"items": {"type": "string"}},"expandHomozygotes": {"type": "boolean","description": "Should homozygotes be expanded (true) or collapsed into a single occurrence (false)","example": true},"sepPhased": {"type": "string","description": "The string used as a separator for phased allele calls.","example": null},"sepUnphased": {"type": "string","description": "The string used as a separator for unphased allele calls.","example": "|"},"unknownString": {"type": "string","description": "The string used as a representation for missing data.","example": "-"},"variantDbIds": {"type": "array","description": "The Variant to search.","example": ["bba0b258","ff97d4f0"],"items": {"type": "string"}},"variantSetDbIds": {"type": "array","description": "The VariantSet to search.","example": ["407c0508","49e24dfc"],"items": {"type": "string"}}}', '', '', 'search', 'False'),
+  'search/callsets/{searchResultsDbId}': MetaRow('search/callsets/{searchResultsDbId}', 'Genotyping', 'Gets a list of call sets matching the search criteria.', '{"page": {"type": "integer","description": "Which result page is requested. The page indexing starts at 0 (the first page is \'page\'= 0). Default is `0`.","example": 0},"pageSize": {"type": "integer","description": "The size of the pages to be returned. Default is `1000`.","example": 1000},"germplasmDbIds": {"type": "array","description": "List of IDs which uniquely identify germplasm to search for","example": ["e9c6edd7","1b1df4a6"],"items": {"type": "string"}},"germplasmNames": {"type": "array","description": "List of human readable names to identify germplasm to search for","example": ["A0000003","A0000477"],"items": {"type": "string"}},"callSetDbIds": {"type": "array","description": "Only return call sets with these DbIds (case-sensitive, exact match).","example": ["6c7486b2","49c36a73"],"items": {"type": "string"}},"callSetNames": {"type": "array","description": "Only return call sets with these names (case-sensitive, exact match).","example": ["Sample_123_DNA_Run_456","Sample_789_DNA_Run_101"],"items": {"type": "string"}},"sampleDbIds": {"type": "array","description": "Return only call sets generated from the provided Biosample IDs.","example": ["758d3f6d","39c0a3f7"],"items": {"type": "string"}},"sampleNames": {"type": "array","description": "Return only call sets generated from the provided Biosample human readable names.","example": ["Sample_123","Sample_789"],"items": {"type": "string"}},"variantSetDbIds": {"type": "array","description": "The VariantSet to search.","example": ["8a9a8972","32a2649a"],"items": {"type": "string"}}}', '', '', 'search', 'False'),
+  'search/markerpositions/{searchResultsDbId}': MetaRow('search/markerpositions/{searchResultsDbId}', 'Genotyping', 'Get marker position info', '{"page": {"type": "integer","description": "Which result page is requested. The page indexing starts at 0 (the first page is \'page\'= 0). Default is `0`.","example": 0},"pageSize": {"type": "integer","description": "The size of the pages to be returned. Default is `1000`.","example": 1000},"linkageGroupNames": {"type": "array","description": "The Uniquely Identifiable name of this linkage group","example": ["Chromosome 2","Chromosome 3"],"items": {"type": "string"}},"mapDbIds": {"type": "array","description": "The unique ID of the map","example": ["7e6fa8aa","bedc418c"],"items": {"type": "string"}},"maxPosition": {"type": "integer","description": "The maximum position","example": 4000},"minPosition": {"type": "integer","description": "The minimum position","example": 250},"variantDbIds": {"type": "array","description": "Internal db identifier","example": ["a0caa928","f8894a26"],"items": {"type": "string"}}}', '', '', 'search', 'False'),
+  'search/references/{searchResultsDbId}': MetaRow('search/references/{searchResultsDbId}', 'Genotyping', 'Gets a list of `Reference` matching the search criteria.', '{"page": {"type": "integer","description": "Which result page is requested. The page indexing starts at 0 (the first page is \'page\'= 0). Default is `0`.","example": 0},"pageSize": {"type": "integer","description": "The size of the pages to be returned. Default is `1000`.","example": 1000},"accessions": {"type": "array","description": "If specified, return the references for which the `accession` matches this string (case-sensitive, exact match).","example": ["A0009283","A0006657"],"items": {"type": "string"}},"isDerived": {"type": "boolean","description": "A sequence X is said to be derived from source sequence Y, if X and Y are of the same length and the per-base sequence divergence at A/C/G/T bases is sufficiently small. Two sequences derived from the same official sequence share the same coordinates and annotations, and can be replaced with the official sequence for certain use cases.","format": "boolean"},"maxLength": {"type": "integer","description": "The minimum length of this reference\'s sequence.","example": 90000},"md5checksums": {"type": "array","description": "If specified, return the references for which the `md5checksum` matches this string (case-sensitive, exact match).","example": ["c2365e900c81a89cf74d83dab60df146"],"items": {"type": "string"}},"minLength": {"type": "integer","description": "The minimum length of this reference\'s sequence.","example": 4000},"referenceDbIds": {"type": "array","description": "The `References` to search.","example": ["04c83ea7","d0998a34"],"items": {"type": "string"}},"referenceSetDbIds": {"type": "array","description": "The `ReferenceSets` to search.","example": ["32a19dd7","2c182c18"],"items": {"type": "string"}}}', '', '', 'search', 'False'),
+  'search/referencesets/{searchResultsDbId}': MetaRow('search/referencesets/{searchResultsDbId}', 'Genotyping', 'Gets a list of `ReferenceSet` matching the search criteria.', '{"page": {"type": "integer","description": "Which result page is requested. The page indexing starts at 0 (the first page is \'page\'= 0). Default is `0`.","example": 0},"pageSize": {"type": "integer","description": "The size of the pages to be returned. Default is `1000`.","example": 1000},"accessions": {"type": "array","description": "If set, return the reference sets for which the `accession` matches this string (case-sensitive, exact match).","example": ["A0009283","A0006657"],"items": {"type": "string"}},"assemblyPUIs": {"type": "array","description": "If set, return the reference sets for which the `assemblyId` matches this string (case-sensitive, exact match).","example": ["doi:10.15454/312953986E3","doi:10.15454/312953986E3"],"items": {"type": "string"}},"md5checksums": {"type": "array","description": "If set, return the reference sets for which the `md5checksum` matches this string (case-sensitive, exact match).","example": ["c2365e900c81a89cf74d83dab60df146"],"items": {"type": "string"}},"referenceSetDbIds": {"type": "array","description": "The `ReferenceSets` to search.","example": ["32a19dd7","2c182c18"],"items": {"type": "string"}}}', '', '', 'search', 'False'),
+  'search/samples/{searchResultsDbId}': MetaRow('search/samples/{searchResultsDbId}', 'Genotyping', 'Submit a search request for Samples', '{"page": {"type": "integer","description": "Which result page is requested. The page indexing starts at 0 (the first page is \'page\'= 0). Default is `0`.","example": 0},"pageSize": {"type": "integer","description": "The size of the pages to be returned. Default is `1000`.","example": 1000},"germplasmDbIds": {"type": "array","description": "List of IDs which uniquely identify germplasm to search for","example": ["e9c6edd7","1b1df4a6"],"items": {"type": "string"}},"germplasmNames": {"type": "array","description": "List of human readable names to identify germplasm to search for","example": ["A0000003","A0000477"],"items": {"type": "string"}},"studyDbIds": {"type": "array","description": "List of study identifiers to search for","example": ["cf6c4bd4","691e69d6"],"items": {"type": "string"}},"studyNames": {"type": "array","description": "List of study names to filter search results","example": ["The First Bob Study 2017","Wheat Yield Trial 246"],"items": {"type": "string"}},"externalReferenceIDs": {"type": "array","description": "List of external reference IDs. Could be a simple strings or a URIs. (use with `externalReferenceSources` parameter)","example": ["http://purl.obolibrary.org/obo/ro.owl","14a19841"],"items": {"type": "string"}},"externalReferenceSources": {"type": "array","description": "List of identifiers for the source system or database of an external reference (use with `externalReferenceIDs` parameter)","example": ["OBO Library","Field App Name"],"items": {"type": "string"}},"observationUnitDbIds": {"type": "array","description": "The ID which uniquely identifies an observation unit","example": ["3cd0ca36","983f3b14"],"items": {"type": "string"}},"plateDbIds": {"type": "array","description": "The ID which uniquely identifies a plate of samples","example": ["0cac98b8","b96125fb"],"items": {"type": "string"}},"sampleDbIds": {"type": "array","description": "The ID which uniquely identifies a sample","example": ["3bece2ca","dd286cc6"],"items": {"type": "string"}}}', '', '', 'search', 'False'),
+  'search/variants/{searchResultsDbId}': MetaRow('search/variants/{searchResultsDbId}', 'Genotyping', 'Gets a list of `Variant` matching the search criteria.', '{"pageSize": {"type": "integer","description": "The size of the pages to be returned. Default is `1000`.","example": 1000},"pageToken": {"type": "string","description": "Used to request a specific page of data to be returned.\\n\\nTokenized pages are for large data sets which can not be efficiently broken into indexed pages. Use the nextPageToken and prevPageToken from a prior response to construct a query and move to the next or previous page respectively. ","example": "33c27874"},"callSetDbIds": {"type": "array","description": "Only return variant calls which belong to call sets with these IDs. If unspecified, return all variants and no variant call objects.","example": ["4639fe3e","b60d900b"],"items": {"type": "string"}},"end": {"type": "integer","description": "The end of the window (0-based, exclusive) for which overlapping variants should be returned.","example": 1500},"referenceDbId": {"type": "string","description": "Only return variants on this reference.","example": "120a2d5c"},"start": {"type": "integer","description": "The beginning of the window (0-based, inclusive) for which overlapping variants should be returned. Genomic positions are non-negative integers less than reference length. Requests spanning the join of circular genomes are represented as two requests one on each side of the join (position 0).","example": 100},"variantDbIds": {"type": "array","description": "The `Variant`s to search.","example": ["3b63d889","ab4d174d"],"items": {"type": "string"}},"variantSetDbIds": {"type": "array","description": "The `VariantSet` to search.","example": ["ba63d810","434d1760"],"items": {"type": "string"}}}', '', '', 'search', 'False'),
+  'search/variantsets/{searchResultsDbId}': MetaRow('search/variantsets/{searchResultsDbId}', 'Genotyping', 'Gets a list of `VariantSet` matching the search criteria.', '{"page": {"type": "integer","description": "Which result page is requested. The page indexing starts at 0 (the first page is \'page\'= 0). Default is `0`.","example": 0},"pageSize": {"type": "integer","description": "The size of the pages to be returned. Default is `1000`.","example": 1000},"studyDbIds": {"type": "array","description": "List of study identifiers to search for","example": ["cf6c4bd4","691e69d6"],"items": {"type": "string"}},"studyNames": {"type": "array","description": "List of study names to filter search results","example": ["The First Bob Study 2017","Wheat Yield Trial 246"],"items": {"type": "string"}},"callSetDbIds": {"type": "array","description": "The CallSet to search.","example": ["9569cfc4","da1e888c"],"items": {"type": "string"}},"variantDbIds": {"type": "array","description": "The Variant to search.","example": ["c80f068b","eb7c5f50"],"items": {"type": "string"}},"variantSetDbIds": {"type": "array","description": "The VariantSet to search.","example": ["b2903842","dcbb8558"],"items": {"type": "string"}}}', '', '', 'search', 'False'),
+  'search/plates/{searchResultsDbId}': MetaRow('search/plates/{searchResultsDbId}', 'Genotyping', 'Submit a search request for Plate', '{"page": {"type": "integer","description": "Which result page is requested. The page indexing starts at 0 (the first page is \'page\'= 0). Default is `0`.","example": 0},"pageSize": {"type": "integer","description": "The size of the pages to be returned. Default is `1000`.","example": 1000},"germplasmDbIds": {"description": "The ID which uniquely identifies a germplasm","items": {"type": "string"},"type": "array","nullable": true,"example": ["d745e1e2","6dd28d74"]},"germplasmNames": {"type": "array","description": "List of human readable names to identify germplasm to search for","example": ["A0000003","A0000477"],"items": {"type": "string"}},"commonCropNames": {"type": "array","description": "Common name for the crop which this program is for","example": ["Tomatillo","Paw Paw"],"items": {"type": "string"}},"programDbIds": {"type": "array","description": "A program identifier to search for","example": ["8f5de35b","0e2d4a13"],"items": {"type": "string"}},"programNames": {"type": "array","description": "A name of a program to search for","example": ["Better Breeding Program","Best Breeding Program"],"items": {"type": "string"}},"trialDbIds": {"type": "array","description": "The ID which uniquely identifies a trial to search for","example": ["d2593dc2","9431a731"],"items": {"type": "string"}},"trialNames": {"type": "array","description": "The human readable name of a trial to search for","example": ["All Yield Trials 2016","Disease Resistance Study Comparison Group"],"items": {"type": "string"}},"studyDbIds": {"type": "array","description": "List of study identifiers to search for","example": ["cf6c4bd4","691e69d6"],"items": {"type": "string"}},"studyNames": {"type": "array","description": "List of study names to filter search results","example": ["The First Bob Study 2017","Wheat Yield Trial 246"],"items": {"type": "string"}},"externalReferenceIDs": {"type": "array","description": "List of external reference IDs. Could be a simple strings or a URIs. (use with `externalReferenceSources` parameter)","example": ["http://purl.obolibrary.org/obo/ro.owl","14a19841"],"items": {"type": "string"}},"externalReferenceSources": {"type": "array","description": "List of identifiers for the source system or database of an external reference (use with `externalReferenceIDs` parameter)","example": ["OBO Library","Field App Name"],"items": {"type": "string"}},"observationUnitDbIds": {"description": "The ID which uniquely identifies an observation unit","items": {"type": "string"},"type": "array","nullable": true,"example": ["3cd0ca36","983f3b14"]},"plateDbIds": {"description": "The ID which uniquely identifies a plate of samples","items": {"type": "string"},"type": "array","nullable": true,"example": ["0cac98b8","b96125fb"]},"plateNames": {"description": "The human readable name of a plate of samples","items": {"type": "string"},"type": "array","nullable": true,"example": ["0cac98b8","b96125fb"]},"plateBarcodes": {"description": "A unique identifier physically attached to the plate","items": {"type": "string"},"type": "array","nullable": true,"example": ["11223344","55667788"]},"sampleDbIds": {"description": "The ID which uniquely identifies a sample","items": {"type": "string"},"type": "array","nullable": true,"example": ["3bece2ca","dd286cc6"]},"sampleNames": {"description": "The human readable name of the sample","items": {"type": "string"},"type": "array","nullable": true,"example": ["SA_111","SA_222"]},"sampleGroupDbIds": {"description": "The unique identifier for a group of related Samples","items": {"type": "string"},"type": "array","nullable": true,"example": ["45e1e2d7","6cc6dd28"]}}', '', '', 'search', 'False'),
+  'search/allelematrix/{searchResultsDbId}': MetaRow('search/allelematrix/{searchResultsDbId}', 'Genotyping', 'Submit a search request for AlleleMatrix', '{"pagination": {"description": "Pagination for the matrix","type": "array","nullable": true,"items": {"type": "object","properties": {"dimension": {"description": "the dimension of the matrix being paginated","type": "string","enum": ["CALLSETS","VARIANTS"],"example": "VARIANTS"},"pageSize": {"description": "the maximum number of elements per page in this dimension of the matrix","type": "integer","example": 500},"page": {"description": "the requested page number (zero indexed)","type": "integer","example": 0}}},"example": [{"dimension": "variants","pageSize": 500,"page": 0},{"dimension": "callsets","pageSize": 1000,"page": 4}]},"preview": {"description": "Default Value = false\\n<br/>\\nIf \'preview\' is set to true, then the server should only return the lists of \'callSetDbIds\', \\n\'variantDbIds\', and \'variantSetDbIds\'. The server should not return any matrix data. This\\nis intended to be a preview and give the client a sense of how large the matrix returned will be\\n<br/>\\nIf \'preview\' is set to false or not set (default), then the server should return all the matrix\\ndata as requested.","type": "boolean","default": false,"example": true},"dataMatrixNames": {"description": "`dataMatrixNames` is a list of names (ie \'Genotype\', \'Read Depth\' etc). This list controls which data matrices are returned in the response.","type": "array","nullable": true,"items": {"type": "string"},"example": ["Genotype","Read Depth"]},"dataMatrixAbbreviations": {"description": "`dataMatrixAbbreviations` is a comma seperated list of abbreviations (ie \'GT\', \'RD\' etc). This list controls which data matrices are returned in the response.","type": "array","nullable": true,"items": {"type": "string"},"example": ["GT","RD"]},"positionRanges": {"description": "The postion range to search\\n<br/>\\nUses the format \\"<chrom>:<start>-<end>\\" where <chrom> is the chromosome name, <start> is \\nthe starting position of the range, and <end> is the ending position of the range","type": "array","nullable": true,"items": {"type": "string"},"example": ["20:1000-35000","20:87000-125000"]},"germplasmNames": {"description": "A list of human readable `Germplasm` names","type": "array","nullable": true,"items": {"type": "string"},"example": ["a03202ec","274e4f63"]},"germplasmPUIs": {"description": "A list of permanent unique identifiers associated with `Germplasm`","type": "array","nullable": true,"items": {"type": "string"},"example": ["a03202ec","274e4f63"]},"germplasmDbIds": {"description": "A list of IDs which uniquely identify `Germplasm` within the given database server","type": "array","nullable": true,"items": {"type": "string"},"example": ["a03202ec","274e4f63"]},"sampleDbIds": {"description": "A list of IDs which uniquely identify `Samples` within the given database server","type": "array","nullable": true,"items": {"type": "string"},"example": ["a03202ec","274e4f63"]},"callSetDbIds": {"description": "A list of IDs which uniquely identify `CallSets` within the given database server","type": "array","items": {"type": "string"},"example": ["a03202ec","274e4f63"]},"variantDbIds": {"description": "A list of IDs which uniquely identify `Variants` within the given database server","type": "array","nullable": true,"items": {"type": "string"},"example": ["bba0b258","ff97d4f0"]},"variantSetDbIds": {"description": "A list of IDs which uniquely identify `VariantSets` within the given database server","type": "array","nullable": true,"items": {"type": "string"},"example": ["407c0508","49e24dfc"]},"expandHomozygotes": {"description": "Should homozygotes be expanded (true) or collapsed into a single occurrence (false)","type": "boolean","nullable": true,"example": true},"sepPhased": {"description": "The string used as a separator for phased allele calls.","type": "string","nullable": true,"example": "|"},"sepUnphased": {"description": "The string used as a separator for unphased allele calls.","type": "string","nullable": true,"example": "/"},"unknownString": {"description": "The string used as a representation for missing data.","type": "string","nullable": true,"example": "."}}', '', '', 'search', 'False'),
+  'search/pedigree/{searchResultsDbId}': MetaRow('search/pedigree/{searchResultsDbId}', 'Genotyping', 'Submit a search request for PedigreeNode', '{"page": {"type": "integer","description": "Which result page is requested. The page indexing starts at 0 (the first page is \'page\'= 0). Default is `0`.","example": 0},"pageSize": {"type": "integer","description": "The size of the pages to be returned. Default is `1000`.","example": 1000},"commonCropNames": {"type": "array","description": "Common name for the crop which this program is for","example": ["Tomatillo","Paw Paw"],"items": {"type": "string"}},"programDbIds": {"type": "array","description": "A program identifier to search for","example": ["8f5de35b","0e2d4a13"],"items": {"type": "string"}},"programNames": {"type": "array","description": "A name of a program to search for","example": ["Better Breeding Program","Best Breeding Program"],"items": {"type": "string"}},"germplasmDbIds": {"type": "array","description": "List of IDs which uniquely identify germplasm to search for","example": ["e9c6edd7","1b1df4a6"],"items": {"type": "string"}},"germplasmNames": {"type": "array","description": "List of human readable names to identify germplasm to search for","example": ["A0000003","A0000477"],"items": {"type": "string"}},"trialDbIds": {"type": "array","description": "The ID which uniquely identifies a trial to search for","example": ["d2593dc2","9431a731"],"items": {"type": "string"}},"trialNames": {"type": "array","description": "The human readable name of a trial to search for","example": ["All Yield Trials 2016","Disease Resistance Study Comparison Group"],"items": {"type": "string"}},"studyDbIds": {"type": "array","description": "List of study identifiers to search for","example": ["cf6c4bd4","691e69d6"],"items": {"type": "string"}},"studyNames": {"type": "array","description": "List of study names to filter search results","example": ["The First Bob Study 2017","Wheat Yield Trial 246"],"items": {"type": "string"}},"externalReferenceIDs": {"type": "array","description": "List of external reference IDs. Could be a simple strings or a URIs. (use with `externalReferenceSources` parameter)","example": ["http://purl.obolibrary.org/obo/ro.owl","14a19841"],"items": {"type": "string"}},"externalReferenceSources": {"type": "array","description": "List of identifiers for the source system or database of an external reference (use with `externalReferenceIDs` parameter)","example": ["OBO Library","Field App Name"],"items": {"type": "string"}},"germplasmPUIs": {"description": "List of Permanent Unique Identifiers to identify germplasm","items": {"type": "string"},"type": "array","nullable": true,"example": ["http://pui.per/accession/A0000003","http://pui.per/accession/A0000477"]},"accessionNumbers": {"description": "A collection of unique identifiers for materials or germplasm within a genebank\\n\\nMCPD (v2.1) (ACCENUMB) 2. This is the unique identifier for accessions within a genebank, and is assigned when a sample is entered into the genebank collection (e.g. \\"PI 113869\\").","items": {"type": "string"},"type": "array","nullable": true,"example": ["A0000003","A0000477"]},"collections": {"description": "A specific panel/collection/population name this germplasm belongs to.","items": {"type": "string"},"type": "array","nullable": true,"example": ["RDP1","MDP1"]},"familyCodes": {"description": "A familyCode representing the family this germplasm belongs to.","items": {"type": "string"},"type": "array","nullable": true,"example": ["f0000203","fa009965"]},"instituteCodes": {"description": "The code for the institute that maintains the material. \\n<br/> MCPD (v2.1) (INSTCODE) 1. FAO WIEWS code of the institute where the accession is maintained. The codes consist of the 3-letter ISO 3166 country code of the country where the institute is located plus a number (e.g. PER001). The current set of institute codes is available from http://www.fao.org/wiews. For those institutes not yet having an FAO Code, or for those with \\"obsolete\\" codes, see \\"Common formatting rules (v)\\".","items": {"type": "string"},"type": "array","nullable": true,"example": ["PER001","NOR001"]},"binomialNames": {"description": "List of the full binomial name (scientific name) to identify a germplasm","items": {"type": "string"},"type": "array","nullable": true,"example": ["Aspergillus fructus","Zea mays"]},"genus": {"description": "List of Genus names to identify germplasm","items": {"type": "string"},"type": "array","nullable": true,"example": ["Aspergillus","Zea"]},"species": {"description": "List of Species names to identify germplasm","items": {"type": "string"},"type": "array","nullable": true,"example": ["fructus","mays"]},"synonyms": {"description": "List of alternative names or IDs used to reference this germplasm","items": {"type": "string"},"type": "array","nullable": true,"example": ["variety_1","2c38f9b6"]},"includeParents": {"description": "If this parameter is true, include the array of parents in the response","type": "boolean","nullable": true,"example": true},"includeSiblings": {"description": "If this parameter is true, include the array of siblings in the response","type": "boolean","nullable": true,"example": true},"includeProgeny": {"description": "If this parameter is true, include the array of progeny in the response","type": "boolean","nullable": true,"example": true},"includeFullTree": {"description": "If this parameter is true, recursively include ALL of the nodes available in this pedigree tree","type": "boolean","nullable": true,"example": true},"pedigreeDepth": {"description": "Recursively include this number of levels up the tree in the response (parents, grand-parents, great-grand-parents, etc)","type": "integer","nullable": true,"example": 3},"progenyDepth": {"description": "Recursively include this number of levels down the tree in the response (children, grand-children, great-grand-children, etc)","type": "integer","nullable": true,"example": 3}}', '', '', 'search', 'False'),
+}
@@ -3,12 +3,18 @@
 import pandas as pd
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
-import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from client.client import BrapiClient
 from config.type import BrapiServerConfig
 
+# Concurrent page requests per paginated fetch (stays below auth.no_auth.POOL_SIZE)
+PAGE_WORKERS = 8
+
+# Characters that are not allowed in filenames on common filesystems
+_UNSAFE_FILENAME_CHARS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
 
 def fetch_paginated(
   client: BrapiClient,
@@ -32,54 +38,92 @@ def fetch_paginated(
   Returns:
       Tuple of (data, metadata)
   """
-  all_data = []
-  page = 0
-  params = params or {}
-  params['pageSize'] = pagesize
+  # Copy so the caller's dict is never mutated (page requests run concurrently)
+  params = {**(params or {}), 'pageSize': pagesize}
+
+  def get_page(page: int) -> Dict[str, Any]:
+    return client._get(endpoint, params={**params, 'page': page})
+
+  # First page tells us how many pages there are
+  response = get_page(0)
+  pages_fetched = 1
+
+  data = _extract_data(response['result']) if response and 'result' in response else []
+
+  if not data:
+    return _paginated_result([], {}, pages_fetched, as_dataframe)
 
-  total_count = 0
+  all_data = list(data)
+  # Pages are normalized as they arrive, overlapping pandas work with requests still in flight
+  frames = [_to_dataframe(data)] if as_dataframe else None
+  pagination = response.get('metadata', {}).get('pagination', {})
+  total_count, total_pages = _page_plan(pagination, len(data), max_pages)
 
-  while max_pages is None or page < max_pages:
-    params['page'] = page
+  # Remaining pages are independent, so fetch them concurrently (results stay in page order)
+  if total_pages > 1:
+    executor = ThreadPoolExecutor(max_workers=min(PAGE_WORKERS, total_pages - 1))
+    try:
+      for response in executor.map(get_page, range(1, total_pages)):
+        pages_fetched += 1
 
-    response = client._get(endpoint, params=params)
+        if not response or 'result' not in response:
+          break
 
-    if not response or 'result' not in response:
-      break
+        data = _extract_data(response['result'])
 
-    # Extract data from response
-    data = _extract_data(response['result'])
+        if not data:
+          break
 
-    if not data:
-      break
+        all_data.extend(data)
+        if frames is not None:
+          frames.append(_to_dataframe(data))
 
-    all_data.extend(data)
+        if total_count is not None and len(all_data) >= total_count:
+          break
+    finally:
+      # Leaving early (a short page, totalCount reached or a failed page) drops the page
+      # requests still queued; the context manager's shutdown would send them all
+      executor.shutdown(wait=False, cancel_futures=True)
 
-    # Check pagination
-    metadata = response.get('metadata', {})
-    pagination = metadata.get('pagination', {})
+  return _paginated_result(all_data, pagination, pages_fetched, as_dataframe, frames)
 
-    total_count = pagination.get('totalCount', len(all_data))
-    current_page = pagination.get('currentPage', page)
-    total_pages = pagination.get('totalPages', 1)
 
-    if max_pages is not None:
-      total_pages = min(total_pages, max_pages)
+def _page_plan(pagination: Dict[str, Any], first_page_size: int, max_pages: Optional[int]) -> Tuple[Optional[int], int]:
+  """Return (totalCount, number of pages to request) from the first page's pagination info"""
+  total_count = pagination.get('totalCount')
+  total_pages = pagination.get('totalPages', 1)
 
-    if current_page >= total_pages - 1:
-      break
+  # Don't request pages past totalCount, even when totalPages overstates it
+  # (page 0's length is the page size the server actually honoured)
+  if total_count is not None:
+    total_pages = min(total_pages, -(-total_count // first_page_size))
 
-    page += 1
+  if max_pages is not None:
+    total_pages = min(total_pages, max_pages)
 
+  return total_count, total_pages
+
+
+def _paginated_result(
+  all_data: List[Dict],
+  pagination: Dict[str, Any],
+  pages_fetched: int,
+  as_dataframe: bool,
+  frames: Optional[List[pd.DataFrame]] = None,
+) -> Tuple[Any, Dict[str, Any]]:
+  """Package fetched records and pagination info as (data, metadata), reusing per-page frames if given"""
   metadata = {
-    'totalCount': total_count,
+    'totalCount': pagination.get('totalCount', len(all_data)),
     'returnedCount': len(all_data),
-    'pagesFetched': page + 1,
+    'pagesFetched': pages_fetched,
     'timestamp': datetime.now().isoformat(),
   }
 
   if as_dataframe:
-    df = pd.json_normalize(all_data) if all_data else pd.DataFrame()
+    if frames:
+      df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+    else:
+      df = _to_dataframe(all_data)
     return df, metadata
 
   return all_data, metadata
@@ -134,7 +178,7 @@ def search_paginated(
       'timestamp': datetime.now().isoformat(),
     }
     if as_dataframe:
-      df = pd.json_normalize(data) if data else pd.DataFrame()
+      df = _to_dataframe(data)
       return df, metadata
     return data, metadata
 
@@ -163,6 +207,15 @@ def _extract_data(result_obj: Any) -> List[Dict]:
     return []
 
 
+def _to_dataframe(records: List[Dict]) -> pd.DataFrame:
+  """Build a DataFrame, only paying for json_normalize when some record has nested objects"""
+  if not records:
+    return pd.DataFrame()
+  if any(isinstance(value, dict) for record in records for value in record.values()):
+    return pd.json_normalize(records)
+  return pd.DataFrame.from_records(records)
+
+
 def download_images_batch(
   client: BrapiClient, output_dir: str, image_records: List[Dict],
 ) -> Tuple[List[Dict], List[Dict]]:
@@ -241,8 +294,7 @@ def download_images_batch(
 
 def sanitize_filename(filename: str, default_name: str) -> str:
   """Sanitize filename to be filesystem-safe"""
-  safe = re.sub(r'[<>:"/\\|?*]', '_', filename)
-  safe = safe.strip('. ')
+  safe = filename.translate(_UNSAFE_FILENAME_CHARS).strip('. ')
   if not safe:
     safe = default_name
   return safe
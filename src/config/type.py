@@ -1,8 +1,14 @@
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
-@dataclass
+# Repository root and its .env, resolved once at import
+WORKSPACE_DIR = Path(__file__).resolve().parents[2]
+ENV_PATH = WORKSPACE_DIR / ".env"
+
+# One instance per process (config.value.config); compared by identity
+@dataclass(eq=False)
 class BrapiServerConfig:
   mode: str 
   port: int 
@@ -13,34 +19,40 @@ class BrapiServerConfig:
   password: Optional[str] = None
   session_dir_override: Optional[str] = None
   capabilities_override: Optional[Path] = None
-  workspace_dir: Path = Path(__file__).parent.parent.parent
+  workspace_dir: Path = WORKSPACE_DIR
+
+  # Derived paths, created once in __post_init__ so later reads are plain attribute access
+  log_dir: Path = field(init=False)
+  sessions_dir: Path = field(init=False)
+  downloads_dir: Path = field(init=False)
+  capabilities_cache_file: Path = field(init=False)
 
   # @property
   # def workspace_dir(self) -> Path:
   #     return Path(__file__).parent.parent.parent
-  
-  @property
-  def log_dir(self) -> Path:
-      d = self.workspace_dir / "cache" / self.name / "logs"
-      d.mkdir(parents=True, exist_ok=True)
-      return d
-
-  @property
-  def sessions_dir(self) -> Path:
-      # Only use override if in STDIO mode
-      if self.session_dir_override and self.mode.upper() == 'STDIO':
-          d = Path(self.session_dir_override) / "data"
-      else:
-          d = self.workspace_dir / "cache" / self.name / "sessions"
-      d.mkdir(parents=True, exist_ok=True)
-      return d
-  
-  @property
-  def downloads_dir(self) -> Path:
+
+  def __post_init__(self):
+      cache_dir = self.workspace_dir / "cache" / self.name
+      self.log_dir = cache_dir / "logs"
+      self.capabilities_cache_file = cache_dir / "capabilities.json"
+
       # Only use override if in STDIO mode
       if self.session_dir_override and self.mode.upper() == 'STDIO':
-          d = Path(self.session_dir_override) / "images"
+          self.sessions_dir = Path(self.session_dir_override) / "data"
+          self.downloads_dir = Path(self.session_dir_override) / "images"
       else:
-        d = self.workspace_dir / "cache" / self.name / "downloads"
-      d.mkdir(parents=True, exist_ok=True)
-      return d
\ No newline at end of file
+          self.sessions_dir = cache_dir / "sessions"
+          self.downloads_dir = cache_dir / "downloads"
+
+      self.ensure_dirs()
+
+  def ensure_dirs(self):
+      """
+      Create every directory the server writes to, in one place.
+
+      Runs once from __post_init__, so the logger can rely on log_dir existing
+      instead of creating it again.
+      """
+      # log_dir also creates cache_dir, the parent of capabilities_cache_file
+      for d in (self.log_dir, self.sessions_dir, self.downloads_dir):
+          os.makedirs(d, exist_ok=True)
@@ -1,9 +1,23 @@
-from config.type import BrapiServerConfig
+from config.type import BrapiServerConfig, ENV_PATH
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 from pathlib import Path
 
-load_dotenv()
+@lru_cache(maxsize=1)
+def load_env() -> bool:
+    """
+    Load the workspace .env into os.environ, at most once per process.
+
+    Other entry points (tests, scripts) can call this too without re-parsing the file.
+    dotenv is pointed straight at the workspace .env so it doesn't walk up the
+    directory tree looking for one.
+    """
+    return load_dotenv(ENV_PATH)
+
+
+# Credentials are read once below into plain config fields
+load_env()
 
 _CONFIG = {
     'mode': os.getenv("MODE", "stdio"),
@@ -3,38 +3,35 @@ import threading
 import sys
 import os
 import time
-import http.client
+import socket
+from typing import Optional
 
 # Ensure 'src' is in the path so local imports work regardless of execution directory
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from config.value import config
-from mcp_server.http_server import BrapiMcpHttpServer
+from mcp_server.http_server import build_http_app
 from mcp_server.mcp_server import BrapiMcpServer
 from utils.maintenance import cleanup_old_files
 
-def run_http_server(host: str, log_level: str):
-    """Runs the HTTP server (blocking)"""
-    http_server = BrapiMcpHttpServer.create_server(config)
+def run_http_server(host: str, log_level: str, mcp_base: Optional[BrapiMcpServer] = None):
+    """Runs the HTTP server (blocking), on top of mcp_base if one is already built"""
+    app = build_http_app(config, mcp_base)
     # Run uvicorn with specified host and log level
     # In stdio mode, log_level='error' suppresses access logs to keep stdout clean
-    uvicorn.run(http_server.app, host=host, port=config.port, log_level=log_level)
+    uvicorn.run(app, host=host, port=config.port, log_level=log_level)
 
 def wait_for_http(port: int, timeout: int = 10) -> bool:
-    """Wait for HTTP server to be responsive"""
+    """Wait for HTTP server to accept connections"""
     start_time = time.time()
     while time.time() - start_time < timeout:
+        # uvicorn only listens once startup is complete, so an accepted connect is enough
         try:
-            conn = http.client.HTTPConnection("127.0.0.1", port)
-            conn.request("GET", "/health")
-            response = conn.getresponse()
-            if response.status == 200:
-                conn.close()
-                return True
-            conn.close()
-        except Exception:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return True
+        except OSError:
             pass
-        time.sleep(0.1)
+        time.sleep(0.05)
     return False
 
 if __name__ == '__main__':
@@ -43,13 +40,16 @@ if __name__ == '__main__':
     cleanup_old_files(config, days=30)
 
     if config.mode.lower() == 'stdio':
-        
+        # One MCP server backs both transports: capabilities are probed once and
+        # results saved over stdio are downloadable over HTTP
+        mcp_base = BrapiMcpServer(config)
+
         # 1. Start HTTP server in a background thread (Daemon)
         # Bind to 127.0.0.1 for security in local mode
         # Use 'error' log level to keep stdout clean for MCP
         http_thread = threading.Thread(
             target=run_http_server, 
-            args=("127.0.0.1", "error"), 
+            args=("127.0.0.1", "error", mcp_base), 
             daemon=True
         )
         http_thread.start()
@@ -62,7 +62,7 @@ if __name__ == '__main__':
 
         # 3. Run the MCP server in Stdio mode (Main Thread)
         # This blocks until the MCP connection closes
-        mcp_server = BrapiMcpServer(config).create_server()
+        mcp_server = mcp_base.create_server()
         mcp_server.run()
         
     else:
@@ -1,67 +1,89 @@
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse
-from pathlib import Path
-import mimetypes
+import functools
+import os
+import threading
+from typing import Optional
 from config.type import BrapiServerConfig
 from mcp_server.mcp_server import BrapiMcpServer
 
-class BrapiMcpHttpServer:
-  _instance = None
-
-  def __init__(self, config: BrapiServerConfig):
-    if hasattr(self, '_initialized') and self._initialized:
-      return
-    self.mcp_base = BrapiMcpServer(config)
-    self.mcp_app = self.mcp_base.create_server().http_app(path='/mcp')
-
-    self.app = FastAPI(title='BrAPI MCP Server', lifespan=self.mcp_app.lifespan)
-    self._setup_routes()
-    self.app.mount('/', self.mcp_app)
-    self._initialized = True
-
-  def _setup_routes(self):
-    """Setup HTTP routes for file downloads"""
-
-    @self.app.get('/health')
-    async def health():
-      return {'status': 'ok'}
-
-    @self.app.get('/download/{session_id}/{result_id}')
-    async def download_result(session_id: str, result_id: str):
-      """
-      Download a cached result file.
-
-      URL: http://localhost:8000/download/{session_id}/{result_id}
-      """
-      # Get cache for session
-      caches = self.mcp_base.session_manager.caches
-      if session_id not in caches:
-        raise HTTPException(status_code=404, detail=f"Session '{session_id}' not found")
-
-      cache = caches[session_id]
-      info = cache.get_result_info(result_id)
-
-      if not info:
-        raise HTTPException(status_code=404, detail=f"Result '{result_id}' not found")
-
-      file_path = Path(info['file_path'])
-
-      if not file_path.exists():
-        raise HTTPException(status_code=404, detail='File not found on disk')
-
-      # Determine MIME type
-      mime_type = mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
-
-      # Return file for download
-      return FileResponse(
-        path=file_path,
-        media_type=mime_type,
-        filename=f'{result_id}.{info["format"]}',
-        headers={'Content-Disposition': f'attachment; filename={result_id}.{info["format"]}'},
-      )
-
-  @classmethod
-  def create_server(cls, config: BrapiServerConfig):
-    if cls._instance is None:
-      cls._instance = cls(config)
-    return cls._instance
+# ResultCache only writes these formats
+MIME_TYPES = {
+  'csv': 'text/csv',
+  'json': 'application/json',
+  'parquet': 'application/vnd.apache.parquet',
+}
+
+# lru_cache alone doesn't stop two threads from building the app concurrently
+_build_lock = threading.Lock()
+
+
+def build_http_app(config: BrapiServerConfig, mcp_base: Optional[BrapiMcpServer] = None) -> FastAPI:
+  """
+  Return the process-wide FastAPI app (MCP at /mcp plus download routes), building it once.
+
+  Pass mcp_base to reuse an existing MCP server (stdio mode) so tools, capabilities
+  and sessions are shared with it.
+  """
+  with _build_lock:
+    return _build_http_app(config, mcp_base)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_http_app(config: BrapiServerConfig, mcp_base: Optional[BrapiMcpServer]) -> FastAPI:
+  mcp_base = mcp_base or BrapiMcpServer(config)
+  mcp_app = mcp_base.create_server().http_app(path='/mcp')
+  session_manager = mcp_base.session_manager
+
+  app = FastAPI(title='BrAPI MCP Server', lifespan=mcp_app.lifespan)
+
+  @app.get('/health')
+  async def health():
+    return {'status': 'ok'}
+
+  @app.get('/download/{session_id}/{result_id}')
+  async def download_result(session_id: str, result_id: str):
+    """
+    Download a cached result file.
+
+    URL: http://localhost:8000/download/{session_id}/{result_id}
+
+    Supports HTTP range requests (e.g. Range: bytes=0-1048575) for chunked or
+    resumed downloads; FileResponse handles these and streams the file in blocks.
+    """
+    # Get cache for session
+    caches = session_manager.caches
+    if session_id not in caches:
+      raise HTTPException(status_code=404, detail=f"Session '{session_id}' not found")
+
+    cache = caches[session_id]
+    # Waits for a result still being written, so keep it off the event loop
+    info = await run_in_threadpool(cache.get_result_info, result_id)
+
+    if not info:
+      raise HTTPException(status_code=404, detail=f"Result '{result_id}' not found")
+
+    file_path = info['file_path']
+
+    # The only stat on this path: it detects files removed behind the cache's back (FileResponse
+    # would fail with a 500) and supplies FileResponse's headers so it doesn't stat again
+    try:
+      stat_result = os.stat(file_path)
+    except FileNotFoundError:
+      raise HTTPException(status_code=404, detail='File not found on disk')
+
+    # Determine MIME type
+    mime_type = MIME_TYPES.get(info['format'], 'application/octet-stream')
+
+    # Return file for download
+    return FileResponse(
+      path=file_path,
+      stat_result=stat_result,
+      media_type=mime_type,
+      # filename also sets Content-Disposition: attachment
+      filename=f'{result_id}.{info["format"]}',
+    )
+
+  app.mount('/', mcp_app)
+  return app
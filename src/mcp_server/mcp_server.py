@@ -1,3 +1,4 @@
+import threading
 from fastmcp import FastMCP, Context
 from typing import Optional
 
@@ -18,6 +19,9 @@ class BrapiMcpServer:
   def __init__(self, config: BrapiServerConfig):
     self.config = config
     self.session_manager = SessionManager(config.sessions_dir)
+    # Built on first create_server() and shared by the stdio and HTTP transports
+    self._server: Optional[FastMCP] = None
+    self._server_lock = threading.Lock()
 
   def get_session_cache(
     self,
@@ -30,9 +34,16 @@ class BrapiMcpServer:
     return self.session_manager.get_or_create_session(session_id, context)
 
   def create_server(self) -> FastMCP:
+    """Return this instance's FastMCP server, probing capabilities and registering tools only once"""
+    with self._server_lock:
+      if self._server is None:
+        self._server = self._build_server()
+    return self._server
+
+  def _build_server(self) -> FastMCP:
     client = BrapiClient(self.config)
     server_name = self.config.name
-    capabilities = CapabilityBuilder.from_server(client, server_name)
+    capabilities = CapabilityBuilder.from_server(client, server_name, cache_file=self.config.capabilities_cache_file)
 
     server = FastMCP(server_name)
 
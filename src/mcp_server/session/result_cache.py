@@ -2,12 +2,41 @@
 
 """Cache results on MCP server for later retrieval"""
 
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+import logging
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional
-import json
-import pandas as pd
+import orjson
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+# Recently served load_result pages kept per cache (an LLM paging through a result repeats these)
+PAGE_CACHE_SIZE = 64
+
+# Result files are written off the tool's critical path; shared by every session's cache
+_WRITE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix='result-write')
+
+
+def _to_records(df, columnar: bool = False) -> list:
+  """Convert a DataFrame to row dicts (or value lists), via Arrow when the column types allow it"""
+  import pyarrow as pa
+
+  try:
+    table = pa.Table.from_pandas(df, preserve_index=False)
+  except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+    # Object columns holding mixed value types can't become Arrow arrays
+    return df.values.tolist() if columnar else df.to_dict(orient='records')
+  return _table_rows(table) if columnar else table.to_pylist()
+
+
+def _table_rows(table) -> list[list]:
+  """Row values in column order, without repeating the column names in every row"""
+  return [list(row) for row in zip(*table.to_pydict().values())]
+
 
 class ResultCache:
   """
@@ -15,24 +44,92 @@ class ResultCache:
   Used when agents need to save data to avoid context explosion.
   """
 
-  def __init__(self, cache_dir: Path):
+  def __init__(self, cache_dir: Path, assume_exists: bool = False):
     self.cache_dir = cache_dir
-    self.cache_dir.mkdir(parents=True, exist_ok=True)
+    # Callers that have just seen the directory on disk can skip the mkdir
+    if not assume_exists:
+      self.cache_dir.mkdir(parents=True, exist_ok=True)
     self.metadata_file = cache_dir / 'cache_metadata.json'
     self._load_metadata()
+    # Metadata writes are deferred while inside batch()
+    self._batch_depth = 0
+    self._dirty = False
+    # Bumped on every metadata change so readers can cache views of the metadata
+    self.version = 0
+    # (result_id, offset, limit, columns) -> load_result response, least recently used first
+    self._pages: OrderedDict[tuple, Dict[str, Any]] = OrderedDict()
+    # result_id -> background file write still in progress
+    self._writes: Dict[str, Future] = {}
+    # Writer threads update metadata too
+    self._lock = threading.RLock()
 
   def _load_metadata(self):
     """Load cache metadata"""
-    if self.metadata_file.exists():
-      with open(self.metadata_file, 'r') as f:
-        self.metadata = json.load(f)
-    else:
-      self.metadata = {}
+    try:
+      metadata = orjson.loads(self.metadata_file.read_bytes())
+    except FileNotFoundError:
+      metadata = {}
+    # size_bytes is only set once a result's file is written; entries still without it
+    # were saved by a process that stopped before its background write finished
+    self.metadata = {rid: info for rid, info in metadata.items() if info.get('size_bytes') is not None}
 
   def _save_metadata(self):
     """Save cache metadata"""
-    with open(self.metadata_file, 'w') as f:
-      json.dump(self.metadata, f, indent=2)
+    self.metadata_file.write_bytes(orjson.dumps(self.metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+
+  def _mark_dirty(self):
+    """Record a metadata change, writing it now unless a batch is open"""
+    with self._lock:
+      self._dirty = True
+      self.version += 1
+      if not self._batch_depth:
+        self.flush()
+
+  def flush(self):
+    """Write metadata to disk if it changed since the last write"""
+    with self._lock:
+      if self._dirty:
+        self._save_metadata()
+        self._dirty = False
+
+  def _wait_for_write(self, result_id: Optional[str] = None):
+    """Block until a result's file (or every pending file, if result_id is None) is on disk"""
+    with self._lock:
+      ids = [result_id] if result_id is not None else list(self._writes)
+    for rid in ids:
+      with self._lock:
+        future = self._writes.get(rid)
+      if future is None:
+        continue
+      # A failed write has already been logged and its entry dropped by _write_file
+      future.result()
+      with self._lock:
+        # Another thread may have waited on it too, or a newer save replaced it
+        if self._writes.get(rid) is future:
+          del self._writes[rid]
+
+  def _invalidate_pages(self, result_id: str):
+    """Drop cached load_result pages for a result that was rewritten or deleted"""
+    for key in [k for k in self._pages if k[0] == result_id]:
+      del self._pages[key]
+
+  @contextmanager
+  def batch(self):
+    """
+    Coalesce metadata writes from several saves/deletes into one.
+
+    Usage:
+        with cache.batch():
+            for ...:
+                cache.save_result(...)
+    """
+    self._batch_depth += 1
+    try:
+      yield self
+    finally:
+      self._batch_depth -= 1
+      if not self._batch_depth:
+        self.flush()
 
   def save_result(
     self,
@@ -52,8 +149,15 @@ class ResultCache:
         format: 'csv', 'json', or 'parquet'
 
     Returns:
-        Info about saved result including size and path
+        Info about saved result; size_bytes is filled in once the file is written
+
+    The file is written on a background thread. Readers in this class wait for it,
+    so a result can be loaded straight after saving. A failed write is logged and
+    the result removed, as if it had never been saved.
     """
+    # pandas is imported on first use so opening a cache (e.g. at startup) doesn't pay for it
+    import pandas as pd
+
     # Convert data to DataFrame if needed
     if isinstance(data, dict) and 'data' in data:
       df = pd.DataFrame(data['data'])
@@ -64,38 +168,81 @@ class ResultCache:
     else:
       raise ValueError(f'Unsupported data type: {type(data)}')
 
-    # Save file
-    if format == 'csv':
-      file_path = self.cache_dir / f'{result_id}.csv'
-      df.to_csv(file_path, index=False)
-    elif format == 'json':
-      file_path = self.cache_dir / f'{result_id}.json'
-      df.to_json(file_path, orient='records', indent=2)
-    elif format == 'parquet':
-      file_path = self.cache_dir / f'{result_id}.parquet'
-      df.to_parquet(file_path, index=False)
-    else:
+    if format not in ('csv', 'json', 'parquet'):
       raise ValueError(f'Unsupported format: {format}')
 
-    # Save metadata
+    # Never have two writers on the same file
+    self._wait_for_write(result_id)
+
+    # Save metadata now so the result is visible immediately; the writer fills in the rest
     self.metadata[result_id] = {
       'result_id': result_id,
       'session_id': session_id,
-      'file_path': str(file_path),
+      'file_path': str(self.cache_dir / f'{result_id}.{format}'),
       'format': format,
       'row_count': len(df),
       'column_count': len(df.columns),
       'columns': list(df.columns),
-      'size_bytes': file_path.stat().st_size,
+      # Recorded once by the writer; readers report this instead of stat'ing the file
+      'size_bytes': None,
       'created_at': datetime.now().isoformat(),
       'metadata': metadata or {},
     }
-    self._save_metadata()
+    self._invalidate_pages(result_id)
+    self._mark_dirty()
+
+    with self._lock:
+      self._writes[result_id] = _WRITE_POOL.submit(self._write_file, result_id, df, format)
 
     return self.metadata[result_id]
 
+  def _write_file(self, result_id: str, df, format: str):
+    """Write a result's data file and record its final format, path and size"""
+    try:
+      file_path, format = self._write_data(result_id, df, format)
+    except Exception:
+      # Nobody waits on this thread for the error, so it is logged here. Don't leave an
+      # entry pointing at a file that was never written
+      logger.exception('Failed to write result %s', result_id)
+      with self._lock:
+        self.metadata.pop(result_id, None)
+        self._mark_dirty()
+      return
+
+    with self._lock:
+      info = self.metadata[result_id]
+      info['format'] = format
+      info['file_path'] = str(file_path)
+      info['size_bytes'] = file_path.stat().st_size
+      self._mark_dirty()
+
+  def _write_data(self, result_id: str, df, format: str) -> tuple[Path, str]:
+    """Write df in the requested format, returning the file written and the format actually used"""
+    if format == 'csv':
+      file_path = self.cache_dir / f'{result_id}.csv'
+      # A csv.writer path over itertuples was measured slower than to_csv at every size
+      # (10 to 5k rows), once missing values are blanked to match to_csv's output
+      df.to_csv(file_path, index=False)
+    elif format == 'json':
+      file_path = self.cache_dir / f'{result_id}.json'
+      df.to_json(file_path, orient='records', indent=2)
+    elif format == 'parquet':
+      file_path = self.cache_dir / f'{result_id}.parquet'
+      try:
+        df.to_parquet(file_path, engine='pyarrow', index=False, compression='zstd')
+      except (ValueError, TypeError, NotImplementedError):
+        # Arrow rejects object columns with mixed value types (common in flattened BrAPI
+        # records); CSV stores anything, so keep the result rather than failing the call
+        file_path.unlink(missing_ok=True)
+        format = 'csv'
+        file_path = self.cache_dir / f'{result_id}.csv'
+        df.to_csv(file_path, index=False)
+
+    return file_path, format
+
   def get_result_info(self, result_id: str) -> Optional[Dict]:
     """Get metadata about a cached result without loading it"""
+    self._wait_for_write(result_id)
     return self.metadata.get(result_id)
 
   def load_result(
@@ -103,6 +250,8 @@ class ResultCache:
     result_id: str,
     limit: Optional[int] = None,
     columns: Optional[list[str]] = None,
+    offset: int = 0,
+    columnar: bool = False,
   ) -> Dict[str, Any]:
     """
     Load a cached result (or part of it).
@@ -111,60 +260,110 @@ class ResultCache:
         result_id: ID of cached result
         limit: Maximum rows to return
         columns: Specific columns to return
+        offset: Rows to skip before the first returned row
+        columnar: Return each row as a list of values ordered as metadata['columns']
 
     Returns:
         Data and metadata
     """
+    # Wait first: a write that fails removes the result
+    self._wait_for_write(result_id)
     if result_id not in self.metadata:
       raise ValueError(f'Result {result_id} not found in cache')
 
+    key = (result_id, offset, limit, tuple(columns) if columns else None, columnar)
+    page = self._pages.get(key)
+    if page is None:
+      page = self._read_page(result_id, limit, columns, offset, columnar)
+      self._pages[key] = page
+      if len(self._pages) > PAGE_CACHE_SIZE:
+        self._pages.popitem(last=False)
+    else:
+      self._pages.move_to_end(key)
+
+    # Callers may annotate the metadata, so don't hand out the cached dict itself
+    return {'data': page['data'], 'metadata': dict(page['metadata'])}
+
+  def _read_page(
+    self,
+    result_id: str,
+    limit: Optional[int],
+    columns: Optional[list[str]],
+    offset: int,
+    columnar: bool,
+  ) -> Dict[str, Any]:
+    """Read one page of a cached result from disk"""
     info = self.metadata[result_id]
     file_path = Path(info['file_path'])
 
-    # Load data
-    if info['format'] == 'csv':
-      df = pd.read_csv(file_path, nrows=limit)
-    elif info['format'] == 'json':
-      df = pd.read_json(file_path)
-      if limit:
-        df = df.head(limit)
-    elif info['format'] == 'parquet':
-      df = pd.read_parquet(file_path)
-      if limit:
-        df = df.head(limit)
-
-    # Filter columns if requested
-    if columns:
-      available_cols = [c for c in columns if c in df.columns]
-      df = df[available_cols]
+    # Only parse the requested columns from disk (CSV/parquet); JSON is filtered after loading.
+    # If none of them exist, read everything and let the filter below return no columns as before
+    read_columns = [c for c in info['columns'] if c in columns] if columns else None
+    wanted = set(read_columns) if read_columns else None
+
+    if info['format'] == 'parquet':
+      import pyarrow.parquet as pq
+
+      # Read and slice as an Arrow table; pandas never sees parquet pages
+      table = pq.read_table(file_path, columns=read_columns or None).slice(offset, limit or None)
+      if columns:
+        table = table.select([c for c in columns if c in table.column_names])
+      # No matching columns gives no rows, as DataFrame.to_dict does
+      if not table.num_columns:
+        records = []
+      else:
+        records = _table_rows(table) if columnar else table.to_pylist()
+      returned_columns = table.column_names
+    else:
+      import pandas as pd
+
+      # Load data; CSV skips the offset rows while parsing instead of materializing them
+      if info['format'] == 'csv':
+        df = pd.read_csv(
+          file_path,
+          skiprows=range(1, offset + 1) if offset else None,
+          nrows=limit,
+          usecols=(lambda c: c in wanted) if wanted else None,
+        )
+      elif info['format'] == 'json':
+        df = pd.read_json(file_path)
+        df = df.iloc[offset:offset + limit] if limit else df.iloc[offset:]
+
+      # Filter columns if requested
+      if columns:
+        available_cols = [c for c in columns if c in df.columns]
+        df = df[available_cols]
+
+      records = _to_records(df, columnar)
+      returned_columns = list(df.columns)
 
     return {
-      'data': df.to_dict(orient='records'),
+      'data': records,
       'metadata': {
         'result_id': result_id,
         'total_rows': info['row_count'],
-        'returned_rows': len(df),
-        'columns': list(df.columns),
-        'truncated': limit is not None and limit < info['row_count'],
+        'returned_rows': len(records),
+        'columns': returned_columns,
+        'truncated': offset + len(records) < info['row_count'],
+        'columnar': columnar,
       },
     }
 
   def list_results(self) -> Dict[str, Dict]:
     """List all cached results"""
+    self._wait_for_write()
     return self.metadata
 
   def delete_result(self, result_id: str) -> bool:
     """Delete a cached result"""
+    self._wait_for_write(result_id)
     if result_id not in self.metadata:
       return False
 
-    info = self.metadata[result_id]
-    file_path = Path(info['file_path'])
-
-    if file_path.exists():
-      file_path.unlink()
+    Path(self.metadata[result_id]['file_path']).unlink(missing_ok=True)
 
     del self.metadata[result_id]
-    self._save_metadata()
+    self._invalidate_pages(result_id)
+    self._mark_dirty()
 
     return True
@@ -1,12 +1,21 @@
 """Persistent session management"""
 
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 from fastmcp import Context
 from pathlib import Path
 from typing import Dict, Optional
-import json
+import orjson
+import time
 from datetime import datetime
 from mcp_server.session.result_cache import ResultCache
 
+# Threads used to open existing session caches at startup
+PRELOAD_WORKERS = 8
+
+# last_accessed updates are written to sessions.json at most this often
+REGISTRY_FLUSH_SECONDS = 5.0
+
 
 class SessionManager:
   """
@@ -20,21 +29,64 @@ class SessionManager:
 
     self.registry_file = base_cache_dir / 'sessions.json'
     self.caches: Dict[str, ResultCache] = {}
+    self._last_flush = 0.0
+    # last_accessed updates not yet written to disk
+    self._dirty = False
 
     self._load_registry()
+    self._preload_caches()
+    # Don't lose the last few seconds of last_accessed updates on shutdown
+    atexit.register(self.flush)
+
+  def _preload_caches(self):
+    """
+    Open the caches of known sessions in parallel so first requests find them ready.
+
+    Sessions whose cache directory is gone (or from another machine) are skipped
+    and opened lazily as before, so startup never creates directories for them.
+    """
+    cache_dirs = {sid: Path(info['cache_dir']) for sid, info in self.registry.items()}
+    cache_dirs = {sid: d for sid, d in cache_dirs.items() if d.is_dir()}
+    if not cache_dirs:
+      return
+
+    with ThreadPoolExecutor(max_workers=min(PRELOAD_WORKERS, len(cache_dirs))) as executor:
+      futures = {sid: executor.submit(ResultCache, d, assume_exists=True) for sid, d in cache_dirs.items()}
+
+    for sid, future in futures.items():
+      try:
+        self.caches[sid] = future.result()
+      except (OSError, ValueError):
+        # Unreadable metadata surfaces when the session is actually used
+        continue
 
   def _load_registry(self):
     """Load session registry from disk"""
     if self.registry_file.exists():
-      with open(self.registry_file, 'r') as f:
-        self.registry = json.load(f)
+      self.registry = orjson.loads(self.registry_file.read_bytes())
     else:
       self.registry = {}
 
+    # Older registries stored ISO strings; convert them once so every entry holds epoch seconds
+    converted = False
+    for info in self.registry.values():
+      for key in ('created_at', 'last_accessed'):
+        if isinstance(info.get(key), str):
+          info[key] = datetime.fromisoformat(info[key]).timestamp()
+          converted = True
+    if converted:
+      self._save_registry()
+
   def _save_registry(self):
     """Persist session registry to disk"""
-    with open(self.registry_file, 'w') as f:
-      json.dump(self.registry, f, indent=2)
+    self.registry_file.write_bytes(orjson.dumps(self.registry, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    self._dirty = False
+
+  def flush(self):
+    """Write last_accessed updates still held in memory"""
+    if self._dirty:
+      self._save_registry()
+      self._last_flush = time.time()
 
   def get_or_create_session(
     self, session_id: Optional[str] = None, context: Optional[Context] = None
@@ -60,34 +112,51 @@ class SessionManager:
       final_session_id = str(uuid.uuid4())[:8]
 
     # Check if session exists in registry
+    now = time.time()
     if final_session_id not in self.registry:
-      # Create new session entry
+      # Create new session entry, reusing its Path for the cache below
+      cache_dir = self.base_cache_dir / final_session_id
       self.registry[final_session_id] = {
-        'created_at': datetime.now().isoformat(),
-        'last_accessed': datetime.now().isoformat(),
-        'cache_dir': str(self.base_cache_dir / final_session_id),
+        'created_at': now,
+        'last_accessed': now,
+        'cache_dir': str(cache_dir),
       }
       self._save_registry()
+      self._last_flush = now
+      self.caches[final_session_id] = ResultCache(cache_dir)
     else:
-      # Update last accessed time
-      self.registry[final_session_id]['last_accessed'] = datetime.now().isoformat()
-      self._save_registry()
+      # Update last accessed time; only touch disk every REGISTRY_FLUSH_SECONDS
+      self.registry[final_session_id]['last_accessed'] = now
+      self._dirty = True
+      if now - self._last_flush > REGISTRY_FLUSH_SECONDS:
+        self._save_registry()
+        self._last_flush = now
 
-    # Get or create cache instance
-    if final_session_id not in self.caches:
-      cache_dir = Path(self.registry[final_session_id]['cache_dir'])
-      self.caches[final_session_id] = ResultCache(cache_dir)
+    # Get or create cache instance; the registry's path string is only parsed once per session
+    cache = self.caches.get(final_session_id)
+    if cache is None:
+      cache = self.caches[final_session_id] = ResultCache(Path(self.registry[final_session_id]['cache_dir']))
 
-    return self.caches[final_session_id], final_session_id
+    return cache, final_session_id
 
   def get_session_info(self, session_id: str) -> Optional[Dict]:
     """Get session metadata"""
-    return self.registry.get(session_id)
+    info = self.registry.get(session_id)
+    return _display_info(info) if info else None
 
   def list_sessions(self) -> Dict[str, Dict]:
     """List all sessions"""
-    return self.registry
+    return {sid: _display_info(info) for sid, info in self.registry.items()}
 
   def session_exists(self, session_id: str) -> bool:
     """Check if session exists"""
     return session_id in self.registry
+
+
+def _display_info(info: Dict) -> Dict:
+  """Copy of a registry entry with epoch timestamps as ISO strings"""
+  info = dict(info)
+  for key in ('created_at', 'last_accessed'):
+    if key in info:
+      info[key] = datetime.fromtimestamp(info[key]).isoformat()
+  return info
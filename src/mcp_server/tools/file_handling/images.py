@@ -1,5 +1,7 @@
-from typing import Optional, Dict
+import csv
+from typing import Optional, Dict, List
 from datetime import datetime
+from pathlib import Path
 
 from fastmcp import FastMCP
 from client.client import BrapiClient
@@ -17,6 +19,18 @@ def register_image_tools(
 ):
   """Register image-related tools"""
 
+  # Capabilities are fixed once the server starts, so look these up once here
+  images_supported = check_images_supported(capabilities)
+  image_search_endpoint = next(
+    (
+      module.endpoints[endpoint]
+      for module in capabilities.modules.values()
+      for endpoint in module.endpoints
+      if 'search/images' in endpoint
+    ),
+    None,
+  )
+
   @server.tool()
   def get_image_search_parameters() -> dict:
     """
@@ -25,14 +39,12 @@ def register_image_tools(
     Returns schema of all valid search parameters with their types.
     Use this before calling download_images() to see what filters are available.
     """
-    for module in capabilities.modules.values():
-      for endpoint in module.endpoints.keys():
-        if 'search/images' in endpoint:
-          return {
-            'service': 'search/images',
-            'valid_parameters': module.endpoints[endpoint].input_schema,
-            'description': 'Use these parameters with download_images()',
-          }
+    if image_search_endpoint:
+      return {
+        'service': 'search/images',
+        'valid_parameters': image_search_endpoint.input_schema,
+        'description': 'Use these parameters with download_images()',
+      }
 
     return {'error': 'Image search not supported by this server'}
 
@@ -54,7 +66,7 @@ def register_image_tools(
         Download summary with success/failure counts
     """
     # Check capabilities
-    if not check_images_supported(capabilities):
+    if not images_supported:
       return {'success': False, 'error': 'Images endpoint not supported by this server'}
 
     try:
@@ -73,16 +85,17 @@ def register_image_tools(
       #     as_dataframe=True,
       #   )
       # else:
-      df, metadata = fetch_paginated(
+      # Raw records are enough here; a DataFrame would only be used to write a small CSV
+      image_records, metadata = fetch_paginated(
         client=client,
         endpoint='images',
         params=search_params,
         max_pages=max_images // 100 + 1,
         pagesize=min(100, max_images),
-        as_dataframe=True,
+        as_dataframe=False,
       )
 
-      if len(df) == 0:
+      if not image_records:
         return {
           'success': True,
           'message': 'No images found matching criteria',
@@ -90,11 +103,7 @@ def register_image_tools(
         }
 
       # Limit to max_images
-      df = df.head(max_images)
-
-      # Convert to list of dicts for utility
-      image_records = df.to_dict(orient='records')
-
+      image_records = image_records[:max_images]
 
       # Download images (utility orchestrates, client does HTTP)
       downloaded, failed = download_images_batch(
@@ -103,14 +112,14 @@ def register_image_tools(
 
       # Save metadata CSV
       metadata_path = output_path / 'images_metadata.csv'
-      df.to_csv(metadata_path, index=False)
+      _write_metadata_csv(metadata_path, image_records)
 
       return {
         'success': True,
         'output_directory': str(output_path.absolute()),
         'images_downloaded': len(downloaded),
         'images_failed': len(failed),
-        'total_found': len(df),
+        'total_found': len(image_records),
         'metadata_csv': str(metadata_path),
         'downloaded_images': downloaded,
         'failed_images': failed if failed else None,
@@ -118,3 +127,25 @@ def register_image_tools(
 
     except Exception as e:
       return {'success': False, 'error': str(e)}
+
+
+def _flatten_record(record: Dict, prefix: str = '') -> Dict:
+  """Flatten nested objects into dotted keys (e.g. 'imageLocation.type'), as pd.json_normalize does"""
+  flat = {}
+  for key, value in record.items():
+    name = f'{prefix}{key}'
+    if isinstance(value, dict):
+      flat.update(_flatten_record(value, f'{name}.'))
+    else:
+      flat[name] = value
+  return flat
+
+
+def _write_metadata_csv(path: Path, records: List[Dict]):
+  """Write image records to CSV, one column per (flattened) field in order of first appearance"""
+  rows = [_flatten_record(record) for record in records]
+  fieldnames = list(dict.fromkeys(key for row in rows for key in row))
+  with open(path, 'w', newline='', encoding='utf-8') as f:
+    writer = csv.DictWriter(f, fieldnames=fieldnames)
+    writer.writeheader()
+    writer.writerows(rows)
@@ -3,16 +3,27 @@ from pathlib import Path
 from fastmcp import FastMCP, Context
 # from src.mcp_server.session.result_cache import ResultCache
 from config.type import BrapiServerConfig
-import json
+import orjson
 
 
 def register_result_cache_tools(server: FastMCP, get_session_cache: Callable, config: BrapiServerConfig):
   """Tools for working with saved results"""
 
+  # session id -> (cache version, serialized listing); rebuilt only after a save or delete
+  listings: dict[str, tuple[int, str]] = {}
+
+  # The HTTP server's port is fixed for the process, so the URL prefix is built once
+  port = config.port if config else 8000
+  download_url_prefix = f'http://localhost:{port}/download/'
+
   @server.resource('brapi://results/{session_id}')
   def list_saved_results(context: Context, session_id: str) -> str:
     """List all saved results"""
-    result_cache, _ = get_session_cache(context, session_id)
+    result_cache, active_session_id = get_session_cache(context, session_id)
+
+    cached = listings.get(active_session_id)
+    if cached and cached[0] == result_cache.version:
+      return cached[1]
 
     results = result_cache.list_results()
 
@@ -31,9 +42,11 @@ def register_result_cache_tools(server: FastMCP, get_session_cache: Callable, co
       ],
     }
 
-    return json.dumps(summary, indent=2)
+    listing = orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY).decode()
+    listings[active_session_id] = (result_cache.version, listing)
+    return listing
 
-  @server.resource('brapi://results/{session_id}/{result_id}')
+  @server.resource('brapi://results/{session_id}/{result_id}', mime_type='text/csv')
   def get_result(context: Context, session_id: str, result_id: str) -> str:
     """
     Get a saved result as CSV text (for small results).
@@ -44,21 +57,29 @@ def register_result_cache_tools(server: FastMCP, get_session_cache: Callable, co
     info = result_cache.get_result_info(result_id)
 
     if not info:
-      return json.dumps({'error': f"Result '{result_id}' not found"})
+      return orjson.dumps({'error': f"Result '{result_id}' not found"}).decode()
 
     # Only return as resource if small (<1000 rows)
     if info['row_count'] > 1000:
-      return json.dumps(
+      return orjson.dumps(
         {
           'error': 'Result too large to return as resource',
           'row_count': info['row_count'],
           'hint': f"Use load_result('{result_id}', limit=100) tool instead",
         }
-      )
+      ).decode()
 
-    # Read and return CSV
-    with open(info['file_path'], 'r') as f:
-      return f.read()
+    # Results stored in another format are converted; at this size that's cheap
+    if info['format'] != 'csv':
+      import pandas as pd
+
+      reader = pd.read_parquet if info['format'] == 'parquet' else pd.read_json
+      return reader(info['file_path']).to_csv(index=False)
+
+    # Read and return CSV: one binary read and a single decode, skipping the text-mode
+    # reader's incremental decoding and newline translation. Stays str: returning bytes
+    # makes FastMCP ship a base64 blob, a third larger and no longer readable as text
+    return Path(info['file_path']).read_bytes().decode('utf-8')
 
   @server.tool()
   def get_result_summary(context: Context, session_id: str, result_id: str) -> dict:
@@ -101,6 +122,7 @@ def register_result_cache_tools(server: FastMCP, get_session_cache: Callable, co
     limit: Optional[int] = None,
     columns: Optional[list[str]] = None,
     offset: int = 0,
+    columnar: bool = False,
   ) -> dict:
     """
     Load a saved result (or part of it) into context.
@@ -113,6 +135,8 @@ def register_result_cache_tools(server: FastMCP, get_session_cache: Callable, co
         limit: Maximum rows to load (default: all)
         columns: Specific columns to load (default: all)
         offset: Skip first N rows (for pagination)
+        columnar: Return each row as a list of values in metadata['columns'] order
+            instead of a dict (much smaller for wide or long results)
 
     Examples:
         # Load first 100 rows for sampling
@@ -125,20 +149,20 @@ def register_result_cache_tools(server: FastMCP, get_session_cache: Callable, co
         load_result('study123_obs', limit=100, offset=0)   # First 100
         load_result('study123_obs', limit=100, offset=100) # Next 100
 
+        # Compact rows: data=[['T1', 4.2], ...] with metadata['columns']=['traitName', 'value']
+        load_result('study123_obs', columns=['traitName', 'value'], columnar=True)
+
     Returns:
         Data and metadata
     """
     try:
-      # Load with offset support
+      # Offset is applied by the loader, so skipped rows are never materialized
       result_cache, _ = get_session_cache(context, session_id)
-      result_data = result_cache.load_result(result_id=result_id, limit=limit, columns=columns)
+      result_data = result_cache.load_result(
+        result_id=result_id, limit=limit, columns=columns, offset=offset, columnar=columnar
+      )
 
-      # Apply offset if needed
       if offset > 0:
-        data = result_data['data'][offset:]
-        if limit:
-          data = data[:limit]
-        result_data['data'] = data
         result_data['metadata']['offset'] = offset
 
       return {'success': True, **result_data}
@@ -176,10 +200,7 @@ def register_result_cache_tools(server: FastMCP, get_session_cache: Callable, co
     if not info:
       return {'error': f"Result '{result_id}' not found"}
 
-    # Use configured port
-    port = config.port if config else 8000
-    base_url = f'http://localhost:{port}'
-    download_url = f'{base_url}/download/{active_session_id}/{result_id}'
+    download_url = f'{download_url_prefix}{active_session_id}/{result_id}'
 
     return {
       'result_id': result_id,
@@ -219,9 +240,7 @@ def register_result_cache_tools(server: FastMCP, get_session_cache: Callable, co
     if not info:
       return {'error': f"Result '{result_id}' not found"}
 
-    port = config.port if config else 8000
-    base_url = f'http://localhost:{port}'
-    download_url = f'{base_url}/download/{active_session_id}/{result_id}'
+    download_url = f'{download_url_prefix}{active_session_id}/{result_id}'
 
     return {
       'download_url': download_url,
@@ -1,8 +1,10 @@
 """Generic BrAPI tools using general_get utility"""
 
 from typing import Optional, Dict, Callable
+import functools
 import hashlib
-import json
+from datetime import datetime
+import orjson
 from fastmcp import FastMCP, Context
 from client.client import BrapiClient
 from client.capabilities.capability_builder import ServerCapabilities
@@ -13,9 +15,40 @@ from client.capabilities.helpers import (
 )
 from client.helpers import fetch_paginated, search_paginated
 
+# A repeated brapi_get/brapi_search within this window reuses the saved result instead of refetching
+RESULT_REUSE_SECONDS = 300
+
+# Sub-resources brapi_get accepts after a db_id
+VALID_SUB_RESOURCES = frozenset(('calls', 'callsets', 'variants'))
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_query_hash(service: str, db_id: Optional[str], sub: Optional[str]) -> str:
+  """Result-id hash for a brapi_get query, memoized since the same queries recur"""
+  # Only 8 hex chars are kept, so a 4-byte blake2b digest replaces truncated md5
+  return hashlib.blake2b(
+    orjson.dumps({'service': service, 'db_id': db_id, 'sub': sub}, option=orjson.OPT_SORT_KEYS),
+    digest_size=4,
+  ).hexdigest()
+
+
+def _reusable_summary(result_cache, result_id: str, max_results: int) -> Optional[dict]:
+  """Summary of a recently saved result for the same query, or None if it must be fetched again"""
+  info = result_cache.get_result_info(result_id)
+  if not info:
+    return None
+  saved = info['metadata']
+  # The query hash doesn't cover max_results, so a result saved for a different limit isn't reused
+  if 'summary' not in saved or saved['query'].get('max_results') != max_results:
+    return None
+  age = datetime.now() - datetime.fromisoformat(info['created_at'])
+  return saved['summary'] if age.total_seconds() < RESULT_REUSE_SECONDS else None
+
 
 
 def register_discovery_tools(server, capabilities: ServerCapabilities):
+    # Capabilities don't change once the server is built, so this is formatted once
+    llm_format = capabilities.to_llm_format()
     
     @server.tool()
     def describe_server_capabilities():
@@ -27,7 +60,7 @@ def register_discovery_tools(server, capabilities: ServerCapabilities):
         Returns:
             Consolidated view of services
         """
-        return capabilities.to_llm_format()
+        return llm_format
     
     @server.tool()
     def get_search_parameters(service: str) -> dict:
@@ -89,8 +122,11 @@ def register_generic_tools(
   """
   Register generic tools based on server capabilities.
   Only creates tools for endpoints the server actually supports.
-  Implemented: brapi_get, brapi_search, brapi_aggregate
+  Implemented: brapi_get, brapi_search
   """
+  # Only used in error responses; capabilities are fixed for the server's lifetime
+  all_services = list_all_services(capabilities)
+  search_services = list_search_services(capabilities)
 
   @server.tool()
   def brapi_get(
@@ -137,79 +173,73 @@ def register_generic_tools(
         'error': f"Service '{service}' not supported by this server",
         'hint': 'Use describe_server_capabilities() to see available services',
         # TODO :: Test if listing services is helpful/unnecessary
-        'available_services': list_all_services(capabilities),
+        'available_services': all_services,
       }
 
     # Build endpoint
-    endpoint_parts = [service]
-    if db_id:
-      endpoint_parts.append(db_id)
     if sub:
-      if sub not in ['calls', 'callsets', 'variants']:
+      if sub not in VALID_SUB_RESOURCES:
         return {'error': f"Invalid sub-resource '{sub}'"}
       if not db_id:
         return {'error': f"sub-resource '{sub}' requires db_id"}
-      endpoint_parts.append(sub)
-
-    endpoint = '/'.join(endpoint_parts)
+      endpoint = f'{service}/{db_id}/{sub}'
+    elif db_id:
+      endpoint = f'{service}/{db_id}'
+    else:
+      endpoint = service
 
     # Fetch data
     try:
-      # Fixed
-      # max_results = min(max_results, 500)
-      # Automatic
-      _, initial_metadata = fetch_paginated(
-        client=client,
-        endpoint=endpoint,
-        params=params,
-        max_pages=1,
-        pagesize=1,
-        as_dataframe=False,
-      )
-      max_results = min(max_results, int(initial_metadata.get('totalCount', 1000)))
-      
-      max_pages = max_results // 100 + 1
-
-      df, metadata = fetch_paginated(
-        client=client,
-        endpoint=endpoint,
-        params=params,
-        max_pages=max_pages,
-        pagesize=min(100, max_results),
-        as_dataframe=True,
-      )
-
-      # Limit and clean
-      df = df.head(max_results)
-      df = df.dropna(axis=1, how='all')
-
       result_cache, active_session_id = get_session_cache(context, session_id)
 
-      query_hash = hashlib.md5(
-          json.dumps({
-              "service": service,
-              "db_id": db_id,
-              "sub": sub
-          }, sort_keys=True).encode()
-      ).hexdigest()[:8]
-      result_id = f"{service}_{query_hash}"
-
-      result_cache.save_result(
-          result_id=result_id,
-          session_id=active_session_id,
-          data=df,
-          metadata={
-              "query": {
-                  "service": service,
-                  "endpoint": endpoint,
-                  "db_id": db_id,
-                  "sub": sub,
-                  # "params": params
-              },
-              "endpoint": endpoint
-          },
-          format='csv'
-      )
+      result_id = f"{service}_{_get_query_hash(service, db_id, sub)}"
+
+      summary = _reusable_summary(result_cache, result_id, max_results)
+      if summary is None:
+        # No separate totalCount probe: fetch_paginated learns it from the first page and
+        # never requests pages past it, so this is one round trip plus the concurrent rest
+        max_pages = max_results // 100 + 1
+
+        df, metadata = fetch_paginated(
+          client=client,
+          endpoint=endpoint,
+          params=params,
+          max_pages=max_pages,
+          pagesize=min(100, max_results),
+          as_dataframe=True,
+        )
+
+        # Limit and clean. dropna is one vectorized pass; tracking all-null columns per page
+        # during pagination was measured slower (one isna().all() per page frame)
+        df = df.head(max_results)
+        df = df.dropna(axis=1, how='all')
+
+        summary = {
+            "total_count": metadata.get('totalCount', len(df)),
+            "returned_count": len(df),
+            "columns": list(df.columns),
+            "column_count": len(df.columns),
+            "truncated": metadata.get('totalCount', 0) > max_results
+        }
+
+        result_cache.save_result(
+            result_id=result_id,
+            session_id=active_session_id,
+            data=df,
+            metadata={
+                "query": {
+                    "service": service,
+                    "endpoint": endpoint,
+                    "db_id": db_id,
+                    "sub": sub,
+                    "max_results": max_results,
+                    # "params": params
+                },
+                "endpoint": endpoint,
+                "summary": summary
+            },
+            format='parquet'
+        )
 
       response = {
           # "result_id": result_id,
@@ -218,13 +248,7 @@ def register_generic_tools(
           #     "service": service,
           #     "db_id": db_id
           # },
-          "summary": {
-              "total_count": metadata.get('totalCount', len(df)),
-              "returned_count": len(df),
-              "columns": list(df.columns),
-              "column_count": len(df.columns),
-              "truncated": metadata.get('totalCount', 0) > max_results
-          },
+          "summary": summary,
           "access": {
               "resource": f"brapi://results/{active_session_id}/{result_id}",
               "tools": {
@@ -237,7 +261,7 @@ def register_generic_tools(
       
       # Optionally include data (for small results)
       if return_data:
-          response["data"] = df.to_dict(orient='records')
+          response["data"] = result_cache.load_result(result_id)['data']
           response["warning"] = "Data included in response - use return_data=False for large datasets"
       
       return response
@@ -282,62 +306,64 @@ def register_generic_tools(
       return {
         'error': f"Search not supported for '{service}' on this server",
         'hint': 'Use describe_server_capabilities() to see available search endpoints',
-        'available_search_services': list_search_services(capabilities),
+        'available_search_services': search_services,
       }
 
     result_cache, active_session_id = get_session_cache(context, session_id)
     # Execute search
     try:
-      # Fixed
-      # max_results = min(max_results, 500)
-      # Automatic
-      _, initial_metadata = metadata = search_paginated(
-        client=client,
-        service=service,
-        search_params=search_params,
-        max_pages=1,
-        pagesize=1,
-        as_dataframe=False,
-      )
-      max_results = min(max_results, int(initial_metadata.get('totalCount', 1000)))
-
-      max_pages = max_results // 100 + 1
-
-      df, metadata = search_paginated(
-        client=client,
-        service=service,
-        search_params=search_params,
-        max_pages=max_pages,
-        pagesize=min(100, max_results),
-        as_dataframe=True,
-      )
-
-      # Limit and clean
-      df = df.head(max_results)
-      df = df.dropna(axis=1, how='all')
-
-      query_hash = hashlib.md5(
-                json.dumps({
+      query_hash = hashlib.blake2b(
+                orjson.dumps({
                     "service": service,
                     "search_params": search_params
-                }, sort_keys=True).encode()
-            ).hexdigest()[:8]
+                }, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS),
+                digest_size=4
+            ).hexdigest()
       
       result_id = f"search_{service}_{query_hash}"
 
-      result_cache.save_result(
-          session_id= active_session_id,
-          result_id=result_id,
-          data=df,
-          metadata={
-              "query": {
-                  "service": service,
-                  "search_params": search_params,
-                  "search": True
-              }
-          },
-          format='csv'
-      )
+      summary = _reusable_summary(result_cache, result_id, max_results)
+      if summary is None:
+        # No separate totalCount probe (which cost a whole extra search POST); the first
+        # results page bounds the rest
+        max_pages = max_results // 100 + 1
+
+        df, metadata = search_paginated(
+          client=client,
+          service=service,
+          search_params=search_params,
+          max_pages=max_pages,
+          pagesize=min(100, max_results),
+          as_dataframe=True,
+        )
+
+        # Limit and clean
+        df = df.head(max_results)
+        df = df.dropna(axis=1, how='all')
+
+        summary = {
+            "total_matches": metadata.get('totalCount', len(df)),
+            "returned_count": len(df),
+            "columns": list(df.columns),
+            "column_count": len(df.columns),
+            "truncated": metadata.get('totalCount', 0) > max_results
+        }
+
+        result_cache.save_result(
+            session_id= active_session_id,
+            result_id=result_id,
+            data=df,
+            metadata={
+                "query": {
+                    "service": service,
+                    "search_params": search_params,
+                    "search": True,
+                    "max_results": max_results
+                },
+                "summary": summary
+            },
+            format='parquet'
+        )
 
       response = {
           # "result_id": result_id,
@@ -346,13 +372,7 @@ def register_generic_tools(
           #     "service": service,
           #     "search_params": search_params
           # },
-          "summary": {
-              "total_matches": metadata.get('totalCount', len(df)),
-              "returned_count": len(df),
-              "columns": list(df.columns),
-              "column_count": len(df.columns),
-              "truncated": metadata.get('totalCount', 0) > max_results
-          },
+          "summary": summary,
           "access": {
               "resource": f"brapi://results/{active_session_id}/{result_id}",
               "tools": {
@@ -364,7 +384,7 @@ def register_generic_tools(
           "hint": f"Data saved to server. Access via resource or load_result('{result_id}')"
       }
       if return_data:
-        response["data"] = df.to_dict(orient='records')
+        response["data"] = result_cache.load_result(result_id)['data']
         response["warning"] = "Data included - use return_data=False for large datasets"
       
       return response
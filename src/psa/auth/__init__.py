@@ -1,6 +1,13 @@
 """Authentication modules for BrAPI servers."""
 
-from .sgn_auth import SGNBrAPIOAuth2, create_sgn_session
 from .no_auth import create_base_session
 
 __all__ = ["SGNBrAPIOAuth2", "create_sgn_session", "create_base_session"]
+
+
+def __getattr__(name):
+    # The SGN session pulls in authlib (~130 ms), so it is only imported when asked for
+    if name in ("SGNBrAPIOAuth2", "create_sgn_session"):
+        from . import sgn_auth
+        return getattr(sgn_auth, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
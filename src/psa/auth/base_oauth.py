@@ -1,6 +1,6 @@
 from authlib.integrations.requests_client import OAuth2Session
 from authlib.oauth2.rfc6749 import OAuth2Token
-import json
+import orjson
 from pathlib import Path
 from typing import Optional, Dict, Callable
 import os
@@ -64,7 +64,12 @@ class BrAPIOAuth2Session(OAuth2Session):
         if isinstance(token, OAuth2Token):
             token = dict(token)
 
-        Path(self.token_file).write_text(json.dumps(token, indent=2))
+        # Owner-only: the file holds a bearer token. open's mode only applies when the
+        # file is created, so tighten one left by an older version too
+        fd = os.open(self.token_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            os.fchmod(fd, 0o600)
+            f.write(orjson.dumps(token, option=orjson.OPT_INDENT_2))
 
     def _load_token(self) -> Optional[Dict]:
         """Load token from file if it exists and storing is enabled."""
@@ -72,9 +77,9 @@ class BrAPIOAuth2Session(OAuth2Session):
             return None
 
         try:
-            token_data = json.loads(Path(self.token_file).read_text())
+            token_data = orjson.loads(Path(self.token_file).read_bytes())
             return token_data
-        except (FileNotFoundError, json.JSONDecodeError):
+        except (FileNotFoundError, orjson.JSONDecodeError):
             return None
 
     def is_authenticated(self) -> bool:
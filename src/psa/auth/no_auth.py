@@ -2,23 +2,45 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+# Keep-alive connections kept per host, so bursts of tool calls reuse connections
+# instead of opening (and then discarding) extras beyond urllib3's default of 10
+POOL_SIZE = 32
 
-def create_base_session() -> requests.Session:
-    """
-    Create a standard requests session with retry logic but no authentication.
-    Useful for public BrAPI endpoints.
+# Transient failures (rate limiting, gateway errors) are retried with capped exponential
+# backoff plus up to 1s of jitter, so concurrent callers don't retry in lockstep
+RETRY_TOTAL = 5
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+BACKOFF_MAX = 30
+
+
+def configure_session(session: requests.Session) -> requests.Session:
     """
-    session = requests.Session()
+    Mount a pooled adapter with retry logic on both schemes.
 
+    Compression needs no setup: requests sends Accept-Encoding: gzip, deflate
+    (adding br/zstd when brotli/zstandard are installed) and urllib3 decodes
+    the response. Setting the header by hand could advertise an encoding
+    that can't be decoded here.
+    """
     retries = Retry(
-        total=3,
+        total=RETRY_TOTAL,
         backoff_factor=1,
-        status_forcelist=[500, 502, 503, 504],
+        backoff_max=BACKOFF_MAX,
+        backoff_jitter=1.0,
+        status_forcelist=RETRY_STATUSES,
         allowed_methods=["GET", "POST"],
     )
 
-    adapter = HTTPAdapter(max_retries=retries)
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retries)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
 
     return session
+
+
+def create_base_session() -> requests.Session:
+    """
+    Create a standard requests session with retry logic but no authentication.
+    Useful for public BrAPI endpoints.
+    """
+    return configure_session(requests.Session())
@@ -1,10 +1,13 @@
 from authlib.oauth2.rfc6749 import OAuth2Token
-import requests
 import time
 from pathlib import Path
 from typing import Optional, Dict
 
 from .base_oauth import BrAPIOAuth2Session
+from .no_auth import configure_session
+
+# A stored token needs at least this long left to be reused instead of logging in at startup
+MIN_STORED_TOKEN_SECONDS = 300
 
 
 class SGNBrAPIOAuth2(BrAPIOAuth2Session):
@@ -58,7 +61,8 @@ class SGNBrAPIOAuth2(BrAPIOAuth2Session):
             raise ValueError("Username and password must be provided")
 
         payload = {"grant_type": "password", "password": password, "username": username}
-        response = requests.post(self.token_url, data=payload)
+        # Sent through this session so (re)logins reuse its pooled connections
+        response = self.post(self.token_url, data=payload, withhold_token=True)
         response.raise_for_status()
 
         data = response.json()
@@ -101,6 +105,7 @@ def create_sgn_session(
     password: Optional[str] = None,
     auto_login: bool = False,
     store_token: bool = False,
+    token_file: str = ".brapi_token.json",
 ) -> SGNBrAPIOAuth2:
     """
     Create an SGN BrAPI OAuth2 session.
@@ -109,13 +114,19 @@ def create_sgn_session(
         base_url: Base URL of SGN server
         username: BrAPI username
         password: BrAPI password
-        auto_login: If True, login immediately
+        auto_login: If True, login immediately unless a stored token is still valid
         store_token: If True, tokens persisted to disk
+        token_file: Token file name (only used if store_token=True)
 
     Returns:
         Configured SGNBrAPIOAuth2 session
     """
-    session = SGNBrAPIOAuth2(base_url, store_token=store_token)
+    session = SGNBrAPIOAuth2(base_url, token_file=token_file, store_token=store_token)
+    configure_session(session)
+
+    stored = session.token
+    if stored and stored.get("expires_at", 0) - time.time() > MIN_STORED_TOKEN_SECONDS:
+        return session
 
     if auto_login and username and password:
         session.login(username=username, password=password)
@@ -1,13 +1,14 @@
 """Configuration from environment variables for PSA MCP Server."""
 
+import functools
 import os
 from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PSAConfig:
-    """Configuration for the PSA BrAPI MCP Server."""
+    """Configuration for the PSA BrAPI MCP Server (immutable once loaded)."""
 
     base_url: str
     auth_type: str
@@ -56,7 +57,8 @@ class PSAConfig:
         )
 
 
-# Singleton config instance - loaded on import
+# Singleton config instance - loaded from the environment on first use
+@functools.lru_cache(maxsize=1)
 def get_config() -> PSAConfig:
     """Get the PSA configuration from environment variables."""
     return PSAConfig.from_env()
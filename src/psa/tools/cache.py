@@ -0,0 +1,55 @@
+"""Reuse of rendered tool output for slow-changing BrAPI data."""
+
+import functools
+import inspect
+from typing import Callable
+
+import orjson
+
+from psa.client import BrAPIClient
+
+
+def render(data) -> str:
+    """Pretty-print tool output as JSON (orjson, several times faster than json.dumps)."""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
+
+def cached_output(client: BrAPIClient) -> Callable:
+    """
+    Cache a tool's returned string in the client's TTL cache, keyed by its arguments.
+
+    A repeated call skips both the HTTP round trip and the JSON rendering.
+    Works for sync and async tools; apply it below @server.tool().
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        signature = inspect.signature(fn)
+
+        def key_for(args, kwargs):
+            bound = signature.bind(*args, **kwargs)
+            # Omitted arguments and their defaults share one entry
+            bound.apply_defaults()
+            return (fn.__name__, tuple(bound.arguments.items()))
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                key = key_for(args, kwargs)
+                text = client.cached(key)
+                if text is None:
+                    text = await fn(*args, **kwargs)
+                    client.remember(key, text)
+                return text
+        else:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                key = key_for(args, kwargs)
+                text = client.cached(key)
+                if text is None:
+                    text = fn(*args, **kwargs)
+                    client.remember(key, text)
+                return text
+
+        return wrapper
+
+    return decorator
@@ -1,18 +1,23 @@
 """Discovery tools for BrAPI Core endpoints."""
 
-import json
 from typing import Optional
 
 from fastmcp import FastMCP
 
-from psa.client import BrAPIClient
+from psa.client import BrAPIClient, query_params
+from psa.tools.cache import cached_output, render
 
 
 def register_discovery_tools(server: FastMCP, client: BrAPIClient) -> None:
-    """Register discovery tools with the MCP server."""
+    """
+    Register discovery tools with the MCP server.
+
+    The tools are async so that several called together overlap their requests.
+    """
 
     @server.tool()
-    def list_programs(
+    @cached_output(client)
+    async def list_programs(
         program_name: Optional[str] = None,
         common_crop_name: Optional[str] = None,
         page_size: int = 100,
@@ -31,18 +36,19 @@ def register_discovery_tools(server: FastMCP, client: BrAPIClient) -> None:
         Returns:
             JSON array of programs with programDbId, programName, etc.
         """
-        params = {"pageSize": page_size}
-        if program_name:
-            params["programName"] = program_name
-        if common_crop_name:
-            params["commonCropName"] = common_crop_name
+        params = query_params(
+            page_size,
+            programName=program_name,
+            commonCropName=common_crop_name,
+        )
 
-        response = client.get("/programs", params=params)
+        response = await client.aget("/programs", params=params)
         data = response.get("result", {}).get("data", [])
-        return json.dumps(data, indent=2)
+        return render(data)
 
     @server.tool()
-    def list_locations(
+    @cached_output(client)
+    async def list_locations(
         location_name: Optional[str] = None,
         location_type: Optional[str] = None,
         country_code: Optional[str] = None,
@@ -63,20 +69,20 @@ def register_discovery_tools(server: FastMCP, client: BrAPIClient) -> None:
         Returns:
             JSON array of locations with locationDbId, locationName, countryCode, etc.
         """
-        params = {"pageSize": page_size}
-        if location_name:
-            params["locationName"] = location_name
-        if location_type:
-            params["locationType"] = location_type
-        if country_code:
-            params["countryCode"] = country_code
-
-        response = client.get("/locations", params=params)
+        params = query_params(
+            page_size,
+            locationName=location_name,
+            locationType=location_type,
+            countryCode=country_code,
+        )
+
+        response = await client.aget("/locations", params=params)
         data = response.get("result", {}).get("data", [])
-        return json.dumps(data, indent=2)
+        return render(data)
 
     @server.tool()
-    def list_seasons(
+    @cached_output(client)
+    async def list_seasons(
         year: Optional[str] = None,
         season_name: Optional[str] = None,
         page_size: int = 100,
@@ -98,18 +104,19 @@ def register_discovery_tools(server: FastMCP, client: BrAPIClient) -> None:
         Returns:
             JSON array of seasons with seasonDbId, season, year, etc.
         """
-        params = {"pageSize": page_size}
-        if year:
-            params["year"] = year
-        if season_name:
-            params["seasonName"] = season_name
+        params = query_params(
+            page_size,
+            year=year,
+            seasonName=season_name,
+        )
 
-        response = client.get("/seasons", params=params)
+        response = await client.aget("/seasons", params=params)
         data = response.get("result", {}).get("data", [])
-        return json.dumps(data, indent=2)
+        return render(data)
 
     @server.tool()
-    def search_trials(
+    @cached_output(client)
+    async def search_trials(
         program_db_id: Optional[str] = None,
         location_db_id: Optional[str] = None,
         common_crop_name: Optional[str] = None,
@@ -141,18 +148,15 @@ def register_discovery_tools(server: FastMCP, client: BrAPIClient) -> None:
         Returns:
             JSON array of trials with trialDbId, trialName, programDbId, etc.
         """
-        params = {"pageSize": page_size}
-        if program_db_id:
-            params["programDbId"] = program_db_id
-        if location_db_id:
-            params["locationDbId"] = location_db_id
-        if common_crop_name:
-            params["commonCropName"] = common_crop_name
-        if trial_name:
-            params["trialName"] = trial_name
-        if active is not None:
-            params["active"] = str(active).lower()
-
-        response = client.get("/trials", params=params)
+        params = query_params(
+            page_size,
+            programDbId=program_db_id,
+            locationDbId=location_db_id,
+            commonCropName=common_crop_name,
+            trialName=trial_name,
+            active=active,
+        )
+
+        response = await client.aget("/trials", params=params)
         data = response.get("result", {}).get("data", [])
-        return json.dumps(data, indent=2)
+        return render(data)
@@ -1,17 +1,18 @@
 """Germplasm tools for BrAPI Germplasm endpoints."""
 
-import json
 from typing import Optional
 
 from fastmcp import FastMCP
 
-from psa.client import BrAPIClient
+from psa.client import BrAPIClient, query_params
+from psa.tools.cache import cached_output, render
 
 
 def register_germplasm_tools(server: FastMCP, client: BrAPIClient) -> None:
     """Register germplasm tools with the MCP server."""
 
     @server.tool()
+    @cached_output(client)
     def search_germplasm(
         germplasm_name: Optional[str] = None,
         accession_number: Optional[str] = None,
@@ -41,23 +42,21 @@ def register_germplasm_tools(server: FastMCP, client: BrAPIClient) -> None:
             - genus, species, commonCropName
             - instituteCode, instituteName
         """
-        params = {"pageSize": page_size}
-        if germplasm_name:
-            params["germplasmName"] = germplasm_name
-        if accession_number:
-            params["accessionNumber"] = accession_number
-        if common_crop_name:
-            params["commonCropName"] = common_crop_name
-        if genus:
-            params["genus"] = genus
-        if species:
-            params["species"] = species
+        params = query_params(
+            page_size,
+            germplasmName=germplasm_name,
+            accessionNumber=accession_number,
+            commonCropName=common_crop_name,
+            genus=genus,
+            species=species,
+        )
 
         response = client.get("/germplasm", params=params)
         data = response.get("result", {}).get("data", [])
-        return json.dumps(data, indent=2)
+        return render(data)
 
     @server.tool()
+    @cached_output(client)
     def get_germplasm_by_id(germplasm_db_id: str) -> str:
         """
         Get detailed information about a specific germplasm.
@@ -80,7 +79,7 @@ def register_germplasm_tools(server: FastMCP, client: BrAPIClient) -> None:
         """
         response = client.get(f"/germplasm/{germplasm_db_id}")
         data = response.get("result", {})
-        return json.dumps(data, indent=2)
+        return render(data)
 
     @server.tool()
     def get_pedigree(
@@ -112,17 +111,15 @@ def register_germplasm_tools(server: FastMCP, client: BrAPIClient) -> None:
             - progeny (list of offspring if include_progeny=True)
             - pedigreeString (text representation)
         """
-        params = {
-            "pageSize": page_size,
-            "includeParents": str(include_parents).lower(),
-            "includeProgeny": str(include_progeny).lower(),
-            "pedigreeDepth": pedigree_depth,
-        }
-        if germplasm_db_id:
-            params["germplasmDbId"] = germplasm_db_id
-        if germplasm_name:
-            params["germplasmName"] = germplasm_name
+        params = query_params(
+            page_size,
+            includeParents=include_parents,
+            includeProgeny=include_progeny,
+            pedigreeDepth=pedigree_depth,
+            germplasmDbId=germplasm_db_id,
+            germplasmName=germplasm_name,
+        )
 
         response = client.get("/pedigree", params=params)
         data = response.get("result", {}).get("data", [])
-        return json.dumps(data, indent=2)
+        return render(data)
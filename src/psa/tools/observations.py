@@ -1,16 +1,26 @@
 """Observation tools for BrAPI Phenotyping endpoints."""
 
+import contextlib
 import csv
-import json
+import functools
+import gzip
+import hashlib
+import io
 import os
 import re
-from datetime import datetime, timezone
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
 from typing import Optional
 
+import orjson
+import requests
 from fastmcp import FastMCP
 
-from psa.client import BrAPIClient
+from psa.client import BrAPIClient, query_params
 from psa.config import PSAConfig
+from psa.tools.cache import cached_output, render
 
 # CSV columns for observation export (matches reference format)
 CSV_COLUMNS = [
@@ -30,28 +40,138 @@ CSV_COLUMNS = [
     "season.seasonDbId",
 ]
 
+# Characters replaced by "_" in file names built from study IDs and names
+_UNSAFE_NAME_CHARS = re.compile(r'[^\w\-]')
 
-def flatten_observation(obs: dict) -> dict:
-    """Flatten nested season data for CSV export.
+# Columns read straight off an observation (all but the season ones), and their defaults
+_TOP_LEVEL_COLUMNS = tuple(CSV_COLUMNS[:11])
+_BLANKS = ("",) * len(_TOP_LEVEL_COLUMNS)
+
+# Write buffer for downloaded files; exports are many small rows, so the default 8 KiB
+# buffer would flush (one write syscall each) every few dozen observations
+WRITE_BUFFER_BYTES = 1 << 20
+
+# Gzip level for "csv.gz"/"json.gz" downloads and the study cache: several times smaller
+# than plain text for a small fraction of the CPU of gzip's default level 9
+OUTPUT_GZIP_LEVEL = 1
+
+# download_study requests observations in pages this large, up to PAGE_WORKERS at a time
+DOWNLOAD_PAGE_SIZE = 1000
+PAGE_WORKERS = 8
+
+# Statuses meaning a server doesn't offer POST /search/observations; download_study then
+# pages through GET /observations instead
+SEARCH_UNSUPPORTED_STATUSES = frozenset((404, 405, 501))
+
+# How long download_study waits for a search the server is still running
+SEARCH_WAIT_SECONDS = 60
+
+# Studies already downloaded are kept here (under data_dir) as gzipped JSON lines
+STUDY_CACHE_DIR = ".cache"
+
+
+def observation_row(obs: dict) -> tuple:
+    """Flatten an observation into a CSV row, in CSV_COLUMNS order.
 
     Args:
         obs: A BrAPI observation object with potentially nested season data.
 
     Returns:
-        A flat dictionary with season fields extracted to dot-notation keys.
+        A tuple of the non-season fields followed by the nested season's
+        season, year and seasonDbId ("" where missing).
     """
-    flat = {}
-    # Copy top-level fields
-    for col in CSV_COLUMNS[:11]:  # All non-season columns
-        flat[col] = obs.get(col, "")
-
     # Flatten nested season data
-    season = obs.get("season", {}) or {}
-    flat["season.season"] = season.get("season", "")
-    flat["season.year"] = season.get("year", "")
-    flat["season.seasonDbId"] = season.get("seasonDbId", "")
+    season = obs.get("season") or {}
+    return (
+        *map(obs.get, _TOP_LEVEL_COLUMNS, _BLANKS),
+        season.get("season", ""),
+        season.get("year", ""),
+        season.get("seasonDbId", ""),
+    )
+
+
+def open_output(file_path: str, compressed: bool, text: bool):
+    """Open a download file for writing, buffered and optionally gzip-compressed.
+
+    Args:
+        file_path: File to create (or overwrite).
+        compressed: Gzip the file at OUTPUT_GZIP_LEVEL.
+        text: Return a UTF-8 text stream (for csv) instead of a binary one.
+
+    Returns:
+        A writable file object; closing it closes the file.
+    """
+    # The stack closes the file if wrapping it fails; on success the caller owns it
+    with contextlib.ExitStack() as stack:
+        if compressed:
+            raw = stack.enter_context(gzip.open(file_path, "wb", compresslevel=OUTPUT_GZIP_LEVEL))
+        else:
+            raw = stack.enter_context(open(file_path, "wb", buffering=0))
+        # Buffer in front of gzip too, so it compresses large blocks rather than every row
+        f = io.BufferedWriter(raw, WRITE_BUFFER_BYTES)
+        out = io.TextIOWrapper(f, encoding="utf-8", newline="") if text else f
+        stack.pop_all()
+    return out
+
+
+def study_cache_path(data_dir: str, study_db_id: str, last_update) -> str:
+    """Path of a study's cached observations for one lastUpdate of the study.
 
-    return flat
+    Args:
+        data_dir: Directory downloads are saved to.
+        study_db_id: The study ID.
+        last_update: The study's BrAPI lastUpdate (version and timestamp).
+
+    Returns:
+        A file path named {study}-{hash}.jsonl.gz; any change to the study's
+        lastUpdate gives a different hash.
+    """
+    key = hashlib.blake2b(
+        orjson.dumps([study_db_id, last_update], option=orjson.OPT_SORT_KEYS),
+        digest_size=16,
+    ).hexdigest()
+    safe_study_id = _UNSAFE_NAME_CHARS.sub('_', study_db_id)
+    return os.path.join(data_dir, STUDY_CACHE_DIR, f"{safe_study_id}-{key}.jsonl.gz")
+
+
+def read_cached_pages(path: str) -> Iterator[list]:
+    """Yield the observations in a study cache file, DOWNLOAD_PAGE_SIZE at a time."""
+    with gzip.open(path, "rb") as f:
+        next(f)  # Header line: study, lastUpdate and when it was cached
+        page = []
+        for line in f:
+            page.append(orjson.loads(line))
+            if len(page) == DOWNLOAD_PAGE_SIZE:
+                yield page
+                page = []
+        if page:
+            yield page
+
+
+def cache_pages(pages: Iterable[list], path: str, header: dict) -> Iterator[list]:
+    """Pass pages through while saving them to a study cache file.
+
+    The file only appears at path once every page has been written, so an
+    interrupted download never leaves a partial cache behind. Cache files for
+    earlier versions of the same study are then removed.
+    """
+    cache_dir, name = os.path.split(path)
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with gzip.open(tmp_path, "wb", compresslevel=OUTPUT_GZIP_LEVEL) as f:
+            f.write(orjson.dumps(header, option=orjson.OPT_APPEND_NEWLINE))
+            for data in pages:
+                f.write(b"".join(orjson.dumps(obs, option=orjson.OPT_APPEND_NEWLINE) for obs in data))
+                yield data
+        os.replace(tmp_path, path)
+        study = name.rsplit("-", 1)[0]
+        for other in os.listdir(cache_dir):
+            if other.endswith(".jsonl.gz") and other.rsplit("-", 1)[0] == study and other != name:
+                os.remove(os.path.join(cache_dir, other))
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
 
 def register_observation_tools(server: FastMCP, client: BrAPIClient, config: Optional[PSAConfig] = None) -> None:
@@ -60,6 +180,9 @@ def register_observation_tools(server: FastMCP, client: BrAPIClient, config: Opt
     # Default data directory if config not provided
     data_dir = config.data_dir if config else "./data"
 
+    # Cleared once the server rejects POST /search/observations, so it isn't tried again
+    search_offered = True
+
     @server.tool()
     def get_observations(
         study_db_id: Optional[str] = None,
@@ -91,23 +214,21 @@ def register_observation_tools(server: FastMCP, client: BrAPIClient, config: Opt
             - value, observationTimeStamp
             - studyDbId
         """
-        params = {"pageSize": page_size}
-        if study_db_id:
-            params["studyDbId"] = study_db_id
-        if germplasm_db_id:
-            params["germplasmDbId"] = germplasm_db_id
-        if observation_variable_db_id:
-            params["observationVariableDbId"] = observation_variable_db_id
-        if observation_unit_db_id:
-            params["observationUnitDbId"] = observation_unit_db_id
-        if observation_level:
-            params["observationLevel"] = observation_level
+        params = query_params(
+            page_size,
+            studyDbId=study_db_id,
+            germplasmDbId=germplasm_db_id,
+            observationVariableDbId=observation_variable_db_id,
+            observationUnitDbId=observation_unit_db_id,
+            observationLevel=observation_level,
+        )
 
         response = client.get("/observations", params=params)
         data = response.get("result", {}).get("data", [])
-        return json.dumps(data, indent=2)
+        return render(data)
 
     @server.tool()
+    @cached_output(client)
     def get_observation_variables(
         study_db_id: Optional[str] = None,
         common_crop_name: Optional[str] = None,
@@ -136,19 +257,17 @@ def register_observation_tools(server: FastMCP, client: BrAPIClient, config: Opt
             - scale (dataType, validValues)
             - ontologyReference
         """
-        params = {"pageSize": page_size}
-        if study_db_id:
-            params["studyDbId"] = study_db_id
-        if common_crop_name:
-            params["commonCropName"] = common_crop_name
-        if observation_variable_name:
-            params["observationVariableName"] = observation_variable_name
-        if trait_class:
-            params["traitClass"] = trait_class
+        params = query_params(
+            page_size,
+            studyDbId=study_db_id,
+            commonCropName=common_crop_name,
+            observationVariableName=observation_variable_name,
+            traitClass=trait_class,
+        )
 
         response = client.get("/variables", params=params)
         data = response.get("result", {}).get("data", [])
-        return json.dumps(data, indent=2)
+        return render(data)
 
     @server.tool()
     def download_study(
@@ -165,7 +284,8 @@ def register_observation_tools(server: FastMCP, client: BrAPIClient, config: Opt
 
         Args:
             study_db_id: The study ID to download (required)
-            output_format: Output format - "json" (default) or "csv"
+            output_format: Output format - "json" (default) or "csv", or "json.gz"/"csv.gz"
+                for a gzip-compressed file (much smaller, at little extra CPU)
             include_metadata: Include study metadata in JSON output (default True, ignored for CSV)
 
         Returns:
@@ -174,16 +294,18 @@ def register_observation_tools(server: FastMCP, client: BrAPIClient, config: Opt
             - study_name: Name of the study
             - observation_count: Number of observations downloaded
             - file_size_kb: Size of the saved file in KB
+            - from_cache: True if observations came from an earlier download of
+              the same study version (the study's lastUpdate) instead of the server
         """
         # Validate output format
         output_format = output_format.lower()
-        if output_format not in ("json", "csv"):
-            return json.dumps({
+        if output_format not in ("json", "csv", "json.gz", "csv.gz"):
+            return render({
                 "status": "error",
-                "message": f"Invalid output_format '{output_format}'. Use 'json' or 'csv'."
-            }, indent=2)
+                "message": f"Invalid output_format '{output_format}'. Use 'json', 'csv', 'json.gz' or 'csv.gz'."
+            })
         # Get study details for metadata and naming
-        study_response = client.get(f"/studies/{study_db_id}")
+        study_response = client.get_cached(f"/studies/{study_db_id}")
         study = study_response.get("result", {})
 
         study_name = study.get("studyName", f"study_{study_db_id}")
@@ -191,69 +313,156 @@ def register_observation_tools(server: FastMCP, client: BrAPIClient, config: Opt
         seasons = study.get("seasons", [])
         year = seasons[0] if seasons else "unknown"
 
-        # Fetch all observations with pagination
-        all_observations = []
-        page = 0
-        while True:
-            response = client.get(
-                "/observations",
-                params={"studyDbId": study_db_id, "pageSize": 1000, "page": page}
-            )
-            data = response.get("result", {}).get("data", [])
+        def fetch_page(path: str, params: dict, page: int) -> tuple:
+            """One page of observations, with the response's pagination info."""
+            deadline = time.monotonic() + SEARCH_WAIT_SECONDS
+            delay = 0.5
+            while True:
+                response = client.get(path, params={**params, "page": page})
+                result = response.get("result", {})
+                # A search that isn't finished answers with its searchResultsDbId again
+                if "data" in result or "searchResultsDbId" not in result:
+                    break
+                if time.monotonic() + delay > deadline:
+                    raise TimeoutError(f"Search for study {study_db_id}'s observations did not finish")
+                time.sleep(delay)
+                delay = min(delay * 2, 8)
+            pagination = response.get("metadata", {}).get("pagination", {})
+            return result.get("data", []), pagination
+
+        def search_results_path() -> str | None:
+            """Path of a /search/observations result set for the study, or None if search isn't offered."""
+            nonlocal search_offered
+            if not search_offered:
+                return None
+            try:
+                response = client.post(
+                    "/search/observations",
+                    json={"studyDbIds": [study_db_id], "pageSize": DOWNLOAD_PAGE_SIZE},
+                )
+            except requests.HTTPError as e:
+                if e.response is None or e.response.status_code not in SEARCH_UNSUPPORTED_STATUSES:
+                    raise
+                search_offered = False
+                return None
+            search_id = response.get("result", {}).get("searchResultsDbId")
+            return f"/search/observations/{search_id}" if search_id else None
+
+        def observation_pages():
+            """Yield the study's observations one page at a time, in page order."""
+            # One server-side search for the study, paged through; plain GET /observations
+            # with a studyDbId filter where the server has no search endpoint
+            path = search_results_path()
+            if path:
+                params = {"pageSize": DOWNLOAD_PAGE_SIZE}
+            else:
+                path, params = "/observations", {"studyDbId": study_db_id, "pageSize": DOWNLOAD_PAGE_SIZE}
+            fetch = functools.partial(fetch_page, path, params)
+
+            data, pagination = fetch(0)
             if not data:
-                break
-            all_observations.extend(data)
-            page += 1
-            if len(data) < 1000:
-                break
+                return
+            yield data
+
+            total_pages = pagination.get("totalPages")
+            if total_pages is None:
+                # Without pagination info, keep requesting until a short page
+                page = 1
+                while len(data) >= DOWNLOAD_PAGE_SIZE:
+                    data, _ = fetch(page)
+                    if not data:
+                        return
+                    yield data
+                    page += 1
+                return
+
+            # The page count is known, so the remaining pages are fetched concurrently
+            if total_pages > 1:
+                executor = ThreadPoolExecutor(max_workers=min(PAGE_WORKERS, total_pages - 1))
+                try:
+                    for data, _ in executor.map(fetch, range(1, total_pages)):
+                        if not data:
+                            return
+                        yield data
+                finally:
+                    # An empty page, a failed page or an abandoned download drops the
+                    # requests still queued instead of sending and waiting on them all
+                    executor.shutdown(wait=False, cancel_futures=True)
 
         # Create data directory if it doesn't exist
         os.makedirs(data_dir, exist_ok=True)
 
-        # Sanitize filename components (remove special characters)
-        safe_study_name = re.sub(r'[^\w\-]', '_', study_name)
-        safe_program = re.sub(r'[^\w\-]', '_', program_name)
+        # A study whose lastUpdate hasn't changed is re-exported from the local cache.
+        # Without lastUpdate there is no way to tell, so such studies are always fetched
+        last_update = study.get("lastUpdate")
+        from_cache = False
+        if last_update:
+            cache_path = study_cache_path(data_dir, study_db_id, last_update)
+            from_cache = os.path.exists(cache_path)
+            if from_cache:
+                pages = read_cached_pages(cache_path)
+            else:
+                pages = cache_pages(observation_pages(), cache_path, {
+                    "study_db_id": study_db_id,
+                    "last_update": last_update,
+                    "cached_at": datetime.now(UTC).isoformat(),
+                })
+        else:
+            pages = observation_pages()
 
-        if output_format == "csv":
-            # Create filename: {program}_{year}_{study_name}.csv
-            filename = f"{safe_program}_{year}_{safe_study_name}.csv"
+        # Sanitize filename components (remove special characters)
+        safe_study_name = _UNSAFE_NAME_CHARS.sub('_', study_name)
+        safe_program = _UNSAFE_NAME_CHARS.sub('_', program_name)
+
+        # Each page is written as it arrives, so the whole study is never held in memory
+        observation_count = 0
+        compressed = output_format.endswith(".gz")
+        if output_format.startswith("csv"):
+            # Create filename: {program}_{year}_{study_name}.csv (or .csv.gz)
+            filename = f"{safe_program}_{year}_{safe_study_name}.{output_format}"
             file_path = os.path.join(data_dir, filename)
 
             # Write CSV file
-            with open(file_path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS, extrasaction="ignore")
-                writer.writeheader()
-                for obs in all_observations:
-                    writer.writerow(flatten_observation(obs))
+            with open_output(file_path, compressed, text=True) as f:
+                # Plain rows: csv.DictWriter's per-row dict checks and lookups made it twice as slow
+                writer = csv.writer(f)
+                writer.writerow(CSV_COLUMNS)
+                for data in pages:
+                    writer.writerows(map(observation_row, data))
+                    observation_count += len(data)
         else:
-            # Create filename: {program}_{year}_{study_name}.json
-            filename = f"{safe_program}_{year}_{safe_study_name}.json"
+            # Create filename: {program}_{year}_{study_name}.json (or .json.gz)
+            filename = f"{safe_program}_{year}_{safe_study_name}.{output_format}"
             file_path = os.path.join(data_dir, filename)
 
-            # Prepare output data
-            output = {
-                "downloaded_at": datetime.now(timezone.utc).isoformat(),
-                "study_db_id": study_db_id,
-                "observation_count": len(all_observations),
-                "observations": all_observations,
-            }
-
-            if include_metadata:
-                output["study_metadata"] = study
-
-            # Write JSON file
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(output, f, indent=2)
+            # Write compact JSON: the header keys, the observations array, then a trailer
+            # with the count (only known once every page is in) and the study metadata
+            with open_output(file_path, compressed, text=False) as f:
+                f.write(orjson.dumps({
+                    "downloaded_at": datetime.now(UTC).isoformat(),
+                    "study_db_id": study_db_id,
+                })[:-1] + b',"observations":[')
+                for data in pages:
+                    if observation_count:
+                        f.write(b",")
+                    f.write(b",".join(map(orjson.dumps, data)))
+                    observation_count += len(data)
+
+                trailer = {"observation_count": observation_count}
+                if include_metadata:
+                    trailer["study_metadata"] = study
+                f.write(b"]," + orjson.dumps(trailer)[1:])
 
         file_size_kb = os.path.getsize(file_path) / 1024
 
-        return json.dumps({
+        return render({
             "status": "success",
             "file_path": os.path.abspath(file_path),
             "format": output_format,
             "study_name": study_name,
             "program": program_name,
             "year": year,
-            "observation_count": len(all_observations),
+            "observation_count": observation_count,
             "file_size_kb": round(file_size_kb, 2),
-        }, indent=2)
+            "from_cache": from_cache,
+        })
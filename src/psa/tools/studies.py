@@ -1,11 +1,11 @@
 """Study tools for BrAPI Study endpoints."""
 
-import json
 from typing import Optional
 
 from fastmcp import FastMCP
 
-from psa.client import BrAPIClient
+from psa.client import BrAPIClient, query_params
+from psa.tools.cache import render
 
 
 def register_study_tools(server: FastMCP, client: BrAPIClient) -> None:
@@ -48,27 +48,20 @@ def register_study_tools(server: FastMCP, client: BrAPIClient) -> None:
         Returns:
             JSON array of studies with studyDbId, studyName, trialDbId, locationDbId, etc.
         """
-        params = {"pageSize": page_size}
-        if trial_db_id:
-            params["trialDbId"] = trial_db_id
-        if program_db_id:
-            params["programDbId"] = program_db_id
-        if location_db_id:
-            params["locationDbId"] = location_db_id
-        if common_crop_name:
-            params["commonCropName"] = common_crop_name
-        if study_name:
-            params["studyName"] = study_name
-        if year:
-            params["seasonDbId"] = year  # In BrAPI, seasonDbId often equals year
-        if season_db_id:
-            params["seasonDbId"] = season_db_id
-        if active is not None:
-            params["active"] = str(active).lower()
+        params = query_params(
+            page_size,
+            trialDbId=trial_db_id,
+            programDbId=program_db_id,
+            locationDbId=location_db_id,
+            commonCropName=common_crop_name,
+            studyName=study_name,
+            seasonDbId=season_db_id or year,  # In BrAPI, seasonDbId often equals year
+            active=active,
+        )
 
         response = client.get("/studies", params=params)
         data = response.get("result", {}).get("data", [])
-        return json.dumps(data, indent=2)
+        return render(data)
 
     @server.tool()
     def get_study_details(study_db_id: str) -> str:
@@ -90,6 +83,6 @@ def register_study_tools(server: FastMCP, client: BrAPIClient) -> None:
             - contacts, dataLinks
             - experimentalDesign, observationLevels
         """
-        response = client.get(f"/studies/{study_db_id}")
+        response = client.get_cached(f"/studies/{study_db_id}")
         data = response.get("result", {})
-        return json.dumps(data, indent=2)
+        return render(data)
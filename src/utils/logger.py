@@ -1,3 +1,4 @@
+import inspect
 import logging
 from logging.handlers import TimedRotatingFileHandler
 from pathlib import Path
@@ -16,8 +17,8 @@ LOG_CONFIG = {
 def string_to_log_level(level: str):
   return logging._nameToLevel.get(level.upper(), logging.INFO)
 
+# config.ensure_dirs() has already created the log directory
 log_dir = Path(LOG_CONFIG['dir'])
-log_dir.mkdir(exist_ok=True)
 
 log_file = log_dir / LOG_CONFIG['file_name']
 
@@ -47,39 +48,42 @@ def with_logging(level: str = 'info'):
   """
 
   def decorator(func):
-    # is_async = inspect.iscoroutinefunction(func)
-    # needs 'inspect' module to know if a function is sync/async
-    # setting is_async false for now
-    is_async = False
-
-    @wraps(func)
-    async def async_wrapper(*args, **kwargs):
-      ctx = None
-      if args and hasattr(args[0], 'log'):
-        ctx = args[0]
-      func_name = func.__name__
-      level_num = string_to_log_level(level)
-      start_msg = f'Starting tool: {func_name}'
-      end_msg = f'Completed tool: {func_name} successfully'
-
-      # Entry log
-      if ctx:
-        ctx.log(level.lower(), start_msg)
-      logging.log(level_num, start_msg)
-
-      try:
-        result = await func(*args, **kwargs)
-        # Exit log
-        if ctx:
-          ctx.log(level.lower(), end_msg)
-        logging.log(level_num, end_msg)
-        return result
-      except Exception as e:
-        err_msg = f'Error in tool {func_name}: {e}'
+    # Fixed for the decorated tool, so resolved once rather than on every call
+    func_name = func.__name__
+    level_num = string_to_log_level(level)
+    level_lower = level.lower()
+    start_msg = f'Starting tool: {func_name}'
+    end_msg = f'Completed tool: {func_name} successfully'
+
+    # Only the wrapper matching the tool is defined, chosen once here
+    if inspect.iscoroutinefunction(func):
+
+      @wraps(func)
+      async def async_wrapper(*args, **kwargs):
+        ctx = None
+        if args and hasattr(args[0], 'log'):
+          ctx = args[0]
+
+        # Entry log
         if ctx:
-          ctx.log('error', err_msg)
-        logging.exception(err_msg)
-        raise
+          await ctx.log(level_lower, start_msg)
+        logging.log(level_num, start_msg)
+
+        try:
+          result = await func(*args, **kwargs)
+          # Exit log
+          if ctx:
+            await ctx.log(level_lower, end_msg)
+          logging.log(level_num, end_msg)
+          return result
+        except Exception as e:
+          err_msg = f'Error in tool {func_name}: {e}'
+          if ctx:
+            await ctx.log('error', err_msg)
+          logging.exception(err_msg)
+          raise
+
+      return async_wrapper
 
     @wraps(func)
     def sync_wrapper(*args, **kwargs):
@@ -87,21 +91,17 @@ def with_logging(level: str = 'info'):
       # check if context has log method
       if args and hasattr(args[0], 'log'):
         ctx = args[0]
-      func_name = func.__name__
-      level_num = string_to_log_level(level)
-      start_msg = f'Starting tool: {func_name}'
-      end_msg = f'Completed tool: {func_name} successfully'
 
       # Entry log
       if ctx:
-        ctx.log(level.lower(), start_msg)
+        ctx.log(level_lower, start_msg)
       logging.log(level_num, start_msg)
 
       try:
         result = func(*args, **kwargs)
         # Exit log
         if ctx:
-          ctx.log(level.lower(), end_msg)
+          ctx.log(level_lower, end_msg)
         logging.log(level_num, end_msg)
         return result
       except Exception as e:
@@ -111,7 +111,7 @@ def with_logging(level: str = 'info'):
         logging.exception(err_msg)
         raise
 
-    return async_wrapper if is_async else sync_wrapper
+    return sync_wrapper
 
   return decorator
 